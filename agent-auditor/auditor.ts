@@ -4,30 +4,59 @@
  */
 
 import axios, { AxiosError } from 'axios';
+import { metrics } from '../solana-fetcher/index.js';
 import { RiskScorer } from './risk-scorer.js';
+import { ToriiClient } from './torii-client.js';
 import {
   TokenData,
   AuditReport,
   RiskFactors,
   ToriiApiRequest,
   ToriiApiResponse,
+  ToriiClientConfig,
   TokenClassification,
-  AuditJobResult
+  AuditJobResult,
+  AuditProgress
 } from './types.js';
 
+/**
+ * RiskScorer analyzers run in microseconds, below the default buckets
+ */
+const SCORER_BUCKETS = [0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1];
+
+const scorerDuration = metrics.histogram(
+  'risk_scorer_analyzer_duration_seconds',
+  'RiskScorer time per analyzer',
+  ['analyzer'],
+  SCORER_BUCKETS
+);
+const auditDuration = metrics.histogram(
+  'audit_duration_seconds',
+  'ComplianceAuditor.auditToken duration by outcome',
+  ['outcome']
+);
+
 export class ComplianceAuditor {
   private riskScorer: RiskScorer;
-  private toriiApiUrl: string;
+  private torii: ToriiClient;
 
-  constructor(toriiApiUrl: string = 'http://localhost:3000/api/check') {
+  constructor(
+    toriiApiUrl: string = 'http://localhost:3000/api/check',
+    toriiConfig?: Partial<ToriiClientConfig>
+  ) {
     this.riskScorer = new RiskScorer();
-    this.toriiApiUrl = toriiApiUrl;
+    this.torii = new ToriiClient(toriiApiUrl, toriiConfig);
   }
 
   /**
-   * Main audit function - analyzes token and generates comprehensive report
+   * Main audit function - analyzes token and generates comprehensive report.
+   * `onProgress` receives the scoring results before Torii is called.
    */
-  public async auditToken(tokenData: TokenData): Promise<AuditJobResult> {
+  public async auditToken(
+    tokenData: TokenData,
+    onProgress?: (progress: AuditProgress) => void
+  ): Promise<AuditJobResult> {
+    const endAudit = auditDuration.startTimer();
     try {
       console.log(`🔍 Starting audit for token: ${tokenData.address}`);
       
@@ -35,25 +64,50 @@ export class ComplianceAuditor {
       const riskFactors = this.analyzeRiskFactors(tokenData);
       
       // Step 2: Calculate overall risk score
-      const overallRiskScore = this.riskScorer.calculateOverallRisk(riskFactors);
+      const overallRiskScore = this.timed('overall', () =>
+        this.riskScorer.calculateOverallRisk(riskFactors)
+      );
       const riskLevel = this.riskScorer.getRiskLevel(overallRiskScore);
       
       // Step 3: Identify red flags
-      const redFlags = this.riskScorer.identifyRedFlags(riskFactors, tokenData);
+      const redFlags = this.timed('red_flags', () =>
+        this.riskScorer.identifyRedFlags(riskFactors, tokenData)
+      );
       
       // Step 4: Infer token classification
-      const classification = this.riskScorer.inferTokenClassification(tokenData, riskFactors);
+      const classification = this.timed('classification', () =>
+        this.riskScorer.inferTokenClassification(tokenData, riskFactors)
+      );
       
-      // Step 5: Call Torii API for Japan compliance check
+      onProgress?.({
+        stage: 'torii',
+        partial: {
+          tokenAddress: tokenData.address,
+          tokenName: tokenData.name,
+          tokenSymbol: tokenData.symbol,
+          overallRiskScore,
+          riskLevel,
+          riskFactors,
+          redFlags
+        }
+      });
+
+      // Step 5: Call Torii API for Japan compliance check (it classifies the
+      // project's description, so without one the fallback status is used)
       let toriiResponse: ToriiApiResponse | undefined;
-      try {
-        toriiResponse = await this.checkToriiCompliance(tokenData, classification);
-      } catch (error) {
-        console.warn('⚠️ Torii API check failed, continuing without it:', error instanceof Error ? error.message : 'Unknown error');
+      const description = this.projectDescription(tokenData);
+      if (description && this.torii.canCheck()) {
+        try {
+          toriiResponse = await this.checkToriiCompliance(tokenData, description, classification);
+        } catch (error) {
+          console.warn('⚠️ Torii API check failed, continuing without it:', error instanceof Error ? error.message : 'Unknown error');
+        }
       }
       
       // Step 6: Generate recommendations
-      const recommendations = this.riskScorer.generateRecommendations(riskFactors, redFlags);
+      const recommendations = this.timed('recommendations', () =>
+        this.riskScorer.generateRecommendations(riskFactors, redFlags)
+      );
       
       // Step 7: Compile audit report
       const report: AuditReport = {
@@ -76,6 +130,7 @@ export class ComplianceAuditor {
       };
 
       console.log(`✅ Audit completed - Risk: ${riskLevel} (${overallRiskScore}/100)`);
+      endAudit({ outcome: 'ok' });
       
       return {
         success: true,
@@ -84,6 +139,7 @@ export class ComplianceAuditor {
 
     } catch (error) {
       console.error('❌ Audit failed:', error);
+      endAudit({ outcome: 'error' });
       return {
         success: false,
         error: error instanceof Error ? error.message : 'Unknown error',
@@ -96,53 +152,68 @@ export class ComplianceAuditor {
    * Analyze all risk factors
    */
   private analyzeRiskFactors(tokenData: TokenData): RiskFactors {
+    // The holder summary is shared by the analyzers; time it on its own
+    this.timed('holder_summary', () => this.riskScorer.summarizeHolders(tokenData));
+
     return {
-      centralizedOwnership: this.riskScorer.analyzeCentralizedOwnership(tokenData),
-      authorityRisk: this.riskScorer.analyzeAuthorityRisk(tokenData),
-      whaleConcentration: this.riskScorer.analyzeWhaleConcentration(tokenData),
-      liquidityRisk: this.riskScorer.analyzeLiquidityRisk(tokenData)
+      centralizedOwnership: this.timed('centralized_ownership', () =>
+        this.riskScorer.analyzeCentralizedOwnership(tokenData)
+      ),
+      authorityRisk: this.timed('authority', () => this.riskScorer.analyzeAuthorityRisk(tokenData)),
+      whaleConcentration: this.timed('whale_concentration', () =>
+        this.riskScorer.analyzeWhaleConcentration(tokenData)
+      ),
+      liquidityRisk: this.timed('liquidity', () => this.riskScorer.analyzeLiquidityRisk(tokenData))
     };
   }
 
   /**
-   * Call Torii API for Japan compliance check
+   * Run one RiskScorer step, recording its duration
+   */
+  private timed<T>(analyzer: string, run: () => T): T {
+    const end = scorerDuration.startTimer({ analyzer });
+    try {
+      return run();
+    } finally {
+      end();
+    }
+  }
+
+  /**
+   * Call Torii API for Japan compliance check (fails fast while the circuit is open)
    */
   private async checkToriiCompliance(
     tokenData: TokenData,
+    description: string,
     classification: TokenClassification
   ): Promise<ToriiApiResponse> {
     const request: ToriiApiRequest = {
+      description,
       tokenAddress: tokenData.address,
       classification,
       supply: tokenData.supply,
-      holderCount: tokenData.holders.length
+      holderCount: tokenData.holderCount ?? tokenData.holderSet?.length ?? tokenData.holders.length
     };
 
-    try {
-      const response = await axios.post<ToriiApiResponse>(
-        this.toriiApiUrl,
-        request,
-        {
-          timeout: 10000,
-          headers: {
-            'Content-Type': 'application/json'
-          }
-        }
-      );
+    return this.torii.check(request);
+  }
 
-      return response.data;
-    } catch (error) {
-      if (axios.isAxiosError(error)) {
-        const axiosError = error as AxiosError;
-        if (axiosError.code === 'ECONNREFUSED') {
-          throw new Error('Torii API is not running. Start the API server first.');
-        }
-        if (axiosError.response?.status === 404) {
-          throw new Error('Torii API endpoint not found. Check the API URL.');
-        }
-      }
-      throw error;
-    }
+  /**
+   * The project's own description, from the token data or its metadata,
+   * within Torii's 10-2000 character limit. Never built from the audit's own
+   * findings, since Torii's verdict overrides them.
+   */
+  private projectDescription(tokenData: TokenData): string | undefined {
+    const candidate = tokenData.description ?? tokenData.metadata?.description;
+    if (typeof candidate !== 'string' || candidate.trim().length < 10) return undefined;
+    return candidate.trim().slice(0, 2000);
+  }
+
+  /**
+   * Torii transport, circuit breaker state and in-flight requests
+   */
+  public getToriiStats(): ReturnType<ToriiClient['getStats']> {
+    return this.torii.getStats();
   }
 
   /**
@@ -173,6 +244,18 @@ export class ComplianceAuditor {
     }
   }
 
+  /**
+   * Re-issue a report whose inputs are unchanged: same findings, new
+   * timestamp and next audit time
+   */
+  public refreshReport(report: AuditReport): AuditReport {
+    return {
+      ...report,
+      timestamp: Date.now(),
+      nextAuditSchedule: this.calculateNextAuditTime(report.riskLevel)
+    };
+  }
+
   /**
    * Calculate next audit schedule based on risk level
    */
@@ -0,0 +1,144 @@
+/**
+ * Columnar Holder Set
+ * Array-backed holder storage for scoring large holder lists without
+ * per-holder objects or full sorts
+ */
+
+import { HolderData } from './types.js';
+
+/**
+ * Whale threshold (% of supply) shared by scoring and summaries
+ */
+export const WHALE_THRESHOLD = 5.0;
+
+/**
+ * Holder aggregates used by every RiskScorer factor
+ */
+export interface HolderSummary {
+  count: number;
+  topHolderPercentage: number;
+  top10HolderPercentage: number;
+  whaleCount: number;
+  whalePercentage: number;
+  gini?: number; // Only from incremental tracking
+}
+
+export class HolderSet {
+  public readonly addresses: string[];
+  public readonly balances: Float64Array;
+  public readonly percentages: Float64Array;
+  private size = 0;
+
+  constructor(capacity: number) {
+    this.addresses = new Array(capacity);
+    this.balances = new Float64Array(capacity);
+    this.percentages = new Float64Array(capacity);
+  }
+
+  /**
+   * Build a set from holder objects
+   */
+  static from(holders: HolderData[]): HolderSet {
+    const set = new HolderSet(holders.length);
+    for (const holder of holders) {
+      set.add(holder.address, holder.balance, holder.percentage);
+    }
+    return set;
+  }
+
+  get length(): number {
+    return this.size;
+  }
+
+  add(address: string, balance: number, percentage: number): void {
+    if (this.size === this.balances.length) {
+      throw new RangeError(`HolderSet capacity ${this.balances.length} exceeded`);
+    }
+    this.addresses[this.size] = address;
+    this.balances[this.size] = balance;
+    this.percentages[this.size] = percentage;
+    this.size++;
+  }
+
+  /**
+   * Indices of the k largest holders by percentage, largest first.
+   * Keeps a k-sized sorted buffer instead of sorting all holders.
+   */
+  topK(k: number): Int32Array {
+    const limit = Math.min(k, this.size);
+    const top = new Int32Array(limit);
+    let filled = 0;
+
+    for (let i = 0; i < this.size; i++) {
+      const value = this.percentages[i];
+      if (filled === limit && value <= this.percentages[top[limit - 1]]) continue;
+
+      // Insert into the sorted buffer, dropping the smallest when full
+      let j = filled < limit ? filled++ : limit - 1;
+      while (j > 0 && this.percentages[top[j - 1]] < value) {
+        top[j] = top[j - 1];
+        j--;
+      }
+      top[j] = i;
+    }
+
+    return top;
+  }
+
+  /**
+   * Top holder, top 10 and whale aggregates in a single pass
+   */
+  summarize(whaleThreshold: number = WHALE_THRESHOLD): HolderSummary {
+    const top10 = new Float64Array(10);
+    let topCount = 0;
+    let whaleCount = 0;
+    let whalePercentage = 0;
+
+    for (let i = 0; i < this.size; i++) {
+      const value = this.percentages[i];
+
+      if (value > whaleThreshold) {
+        whaleCount++;
+        whalePercentage += value;
+      }
+
+      if (topCount === 10 && value <= top10[9]) continue;
+      let j = topCount < 10 ? topCount++ : 9;
+      while (j > 0 && top10[j - 1] < value) {
+        top10[j] = top10[j - 1];
+        j--;
+      }
+      top10[j] = value;
+    }
+
+    let top10HolderPercentage = 0;
+    for (let i = 0; i < topCount; i++) {
+      top10HolderPercentage += top10[i];
+    }
+
+    return {
+      count: this.size,
+      topHolderPercentage: topCount > 0 ? top10[0] : 0,
+      top10HolderPercentage,
+      whaleCount,
+      whalePercentage
+    };
+  }
+
+  /**
+   * Materialize holder objects (e.g. for the largest holders of a report)
+   */
+  toHolders(indices?: ArrayLike<number>): HolderData[] {
+    const holders: HolderData[] = [];
+    const count = indices ? indices.length : this.size;
+    for (let n = 0; n < count; n++) {
+      const i = indices ? indices[n] : n;
+      holders.push({
+        address: this.addresses[i],
+        balance: this.balances[i],
+        percentage: this.percentages[i]
+      });
+    }
+    return holders;
+  }
+}
@@ -4,27 +4,120 @@
  */
 
 import Bull, { Queue, Job, JobOptions } from 'bull';
+import {
+  TokenAnalyzer,
+  TokenDataError,
+  TokenFetchError,
+  MetricsRegistry,
+  metrics
+} from '../solana-fetcher/index.js';
 import { ComplianceAuditor } from './auditor.js';
+import { AuditScheduler } from './scheduler.js';
+import { ReportStore } from './report-store.js';
+import { mapAnalysisToTokenData } from './token-mapper.js';
 import {
   TokenData,
   AuditJobData,
   AuditJobResult,
+  AuditProgress,
+  AuditStatus,
   QueueConfig,
   ScheduledAuditConfig,
   AuditReport
 } from './types.js';
 
+const QUEUE_NAME = 'compliance-audits';
+const ONE_DAY = 24 * 60 * 60 * 1000;
+const AUDIT_INTERVALS: Record<ScheduledAuditConfig['frequency'], number> = {
+  daily: ONE_DAY,
+  weekly: 7 * ONE_DAY,
+  monthly: 30 * ONE_DAY
+};
+const BULK_CHUNK_SIZE = 1000; // jobs per addBulk call (one Redis pipeline each)
+
+/**
+ * Deterministic job ID for a mint's on-demand audit, so a mint is queued at
+ * most once at a time
+ */
+export function auditJobId(tokenAddress: string): string {
+  return `audit:${tokenAddress}`;
+}
+
+/**
+ * Free the IDs of finished jobs so they can be queued again, in one atomic
+ * step with the state check (a job re-added concurrently is never touched).
+ * A completed job is deleted (its report is in the report store); a failed
+ * job is kept for analysis under '<id>:failed:<finishedOn>'. Returns 1 per
+ * ID still waiting or running, 0 per ID that is free.
+ *
+ * KEYS: completed set, failed set
+ * ARGV: job key prefix, job IDs...
+ */
+const FREE_JOB_IDS_SCRIPT = `
+local states = {}
+for i = 2, #ARGV do
+  local id = ARGV[i]
+  local key = ARGV[1] .. id
+  states[i - 1] = 0
+  if redis.call('EXISTS', key) == 1 then
+    if redis.call('ZSCORE', KEYS[1], id) then
+      redis.call('ZREM', KEYS[1], id)
+      redis.call('DEL', key, key .. ':logs')
+    else
+      local failedAt = redis.call('ZSCORE', KEYS[2], id)
+      if failedAt then
+        local archived = id .. ':failed:' .. (redis.call('HGET', key, 'finishedOn') or failedAt)
+        redis.call('RENAME', key, ARGV[1] .. archived)
+        if redis.call('EXISTS', key .. ':logs') == 1 then
+          redis.call('RENAME', key .. ':logs', ARGV[1] .. archived .. ':logs')
+        end
+        redis.call('ZREM', KEYS[2], id)
+        redis.call('ZADD', KEYS[2], failedAt, archived)
+      else
+        states[i - 1] = 1
+      end
+    end
+  end
+end
+return states
+`;
+
+type AuditWatcher = (status: AuditStatus) => void;
+
+const jobDuration = metrics.histogram(
+  'audit_job_duration_seconds',
+  'Audit job processing time (analysis + audit) by outcome',
+  ['outcome']
+);
+const fingerprintChecks = metrics.counter(
+  'audit_fingerprint_checks_total',
+  'Audit jobs by whether the on-chain fingerprint matched the last audit',
+  ['result']
+);
+const jobWait = metrics.histogram(
+  'audit_job_wait_seconds',
+  'Time audit jobs spent queued before processing started'
+);
+
 export class AuditQueue {
   private queue: Queue<AuditJobData>;
   private auditor: ComplianceAuditor;
+  private analyzer: TokenAnalyzer;
   private config: QueueConfig;
-  private scheduledAudits: Map<string, ScheduledAuditConfig> = new Map();
+  private scheduler: AuditScheduler;
+  private reports: ReportStore;
+  private watchers: Map<string, Set<AuditWatcher>> = new Map();
+  private listeningForJobEvents = false;
 
   constructor(
     auditor: ComplianceAuditor,
-    config?: Partial<QueueConfig>
+    config?: Partial<QueueConfig>,
+    analyzer?: TokenAnalyzer
   ) {
     this.auditor = auditor;
+    this.analyzer = analyzer || new TokenAnalyzer({
+      rpcUrl: process.env.SOLANA_RPC_URL
+    });
     
     // Default configuration
     this.config = {
@@ -37,11 +130,16 @@ export class AuditQueue {
       backoff: config?.backoff || {
         type: 'exponential',
         delay: 5000
-      }
+      },
+      concurrency: config?.concurrency || 1,
+      processJobs: config?.processJobs ?? true,
+      fullHolderScan: config?.fullHolderScan ?? false,
+      scheduler: config?.scheduler,
+      reportStore: config?.reportStore
     };
 
     // Initialize Bull queue
-    this.queue = new Bull<AuditJobData>('compliance-audits', {
+    this.queue = new Bull<AuditJobData>(QUEUE_NAME, {
       redis: this.config.redis,
       defaultJobOptions: {
         attempts: this.config.retryAttempts,
@@ -51,7 +149,21 @@ export class AuditQueue {
       }
     });
 
-    this.setupProcessors();
+    this.scheduler = new AuditScheduler(
+      this.queue.client,
+      (tokenAddresses, priority) => this.addBatchAudits(tokenAddresses, priority, { scheduledAudit: true }),
+      { key: `${QUEUE_NAME}:schedule`, ...this.config.scheduler }
+    );
+    this.reports = new ReportStore(this.queue.client, {
+      key: `${QUEUE_NAME}:reports`,
+      ...this.config.reportStore
+    });
+
+    if (this.config.processJobs) {
+      this.setupProcessors();
+      // Every processing worker ticks; claims are atomic, so none overlap
+      this.scheduler.start();
+    }
     this.setupEventHandlers();
   }
 
@@ -59,14 +171,178 @@ export class AuditQueue {
    * Setup job processors
    */
   private setupProcessors(): void {
-    // Process audit jobs
-    this.queue.process('audit', async (job: Job<AuditJobData>) => {
-      console.log(`📋 Processing audit job ${job.id} for token ${job.data.tokenAddress}`);
-      
-      // In a real implementation, you would fetch token data here
-      // For now, this expects the token data to be fetched externally
-      throw new Error('Token data fetching not implemented - integrate with Solana RPC');
+    // Process up to `concurrency` audit jobs at once in this process
+    this.queue.process('audit', this.config.concurrency, (job: Job<AuditJobData>) =>
+      this.processAuditJob(job)
+    );
+  }
+
+  /**
+   * Fetch on-chain data for a queued token and run the compliance audit
+   */
+  private async processAuditJob(job: Job<AuditJobData>): Promise<AuditJobResult> {
+    console.log(`📋 Processing audit job ${job.id} for token ${job.data.tokenAddress}`);
+    // Delayed and retried jobs count from when they became runnable
+    const queuedAt = job.timestamp + (job.opts.delay || 0);
+    jobWait.observe(undefined, Math.max(0, (job.processedOn ?? Date.now()) - queuedAt) / 1000);
+    return jobDuration.time({}, () => this.runAuditJob(job));
+  }
+
+  /**
+   * Fingerprint the mint first (fresh mint accounts and the holders the
+   * analysis will score). A scheduled re-audit of an unchanged mint reuses
+   * the last report; otherwise the fetched accounts feed the full analysis.
+   */
+  private async runAuditJob(job: Job<AuditJobData>): Promise<AuditJobResult> {
+    let tokenData: TokenData;
+    let fingerprint: string;
+    this.reportProgress(job, { stage: 'fetch' });
+    try {
+      const analyzeOptions = { fullHolders: this.config.fullHolderScan };
+      const current = await this.analyzer.fingerprintToken(job.data.tokenAddress, analyzeOptions);
+      fingerprint = current.fingerprint;
+
+      const last = await this.reports.getLatest(current.mintAddress);
+      const unchanged = last?.fingerprint === fingerprint;
+      fingerprintChecks.inc({ result: !last ? 'new' : unchanged ? 'unchanged' : 'changed' });
+
+      if (job.data.scheduledAudit && last && unchanged) {
+        const report = this.auditor.refreshReport(last.report);
+        await this.reports.save(report, fingerprint);
+        console.log(`♻️ ${current.mintAddress} unchanged since last audit, reusing report`);
+        return { success: true, report, unchanged: true };
+      }
+
+      const analysis = await this.analyzer.analyzeSnapshot(
+        current.snapshot,
+        analyzeOptions,
+        current.holders
+      );
+      tokenData = mapAnalysisToTokenData(analysis);
+      this.reportProgress(job, {
+        stage: 'score',
+        partial: { tokenAddress: tokenData.address, tokenName: tokenData.name, tokenSymbol: tokenData.symbol }
+      });
+    } catch (error) {
+      // An invalid mint will never succeed - don't burn the remaining attempts
+      if (error instanceof TokenDataError && error.type === TokenFetchError.INVALID_MINT) {
+        job.discard();
+      }
+      throw error;
+    }
+
+    const result = await this.auditor.auditToken(tokenData, progress => this.reportProgress(job, progress));
+    if (!result.success) {
+      if (!result.retryable) {
+        job.discard();
+      }
+      throw new Error(result.error || 'Audit failed');
+    }
+
+    await this.reports.save(result.report!, fingerprint);
+    return result;
+  }
+
+  /**
+   * Publish a job's stage to everyone following it (see watchAudit)
+   */
+  private reportProgress(job: Job<AuditJobData>, progress: AuditProgress): void {
+    job.progress({ ...progress, attempt: job.attemptsMade }).catch(error =>
+      console.warn(`⚠️ Could not report progress for job ${job.id}:`, error.message)
+    );
+  }
+
+  /**
+   * Current state of an audit job. Once Bull has dropped a finished job,
+   * an on-demand audit ID (see auditJobId) answers from the report store.
+   */
+  public async getAuditStatus(jobId: string): Promise<AuditStatus | null> {
+    const job = await this.queue.getJob(jobId);
+    if (!job) {
+      const tokenAddress = jobId.startsWith('audit:') ? jobId.slice('audit:'.length) : null;
+      const latest = tokenAddress ? await this.reports.getLatest(tokenAddress) : null;
+      return latest ? { jobId, state: 'complete', report: latest.report } : null;
+    }
+
+    const state = await job.getState();
+    if (state === 'completed') {
+      return { jobId, state: 'complete', report: (job.returnvalue as AuditJobResult).report };
+    }
+    if (state === 'failed') {
+      return { jobId, state: 'failed', error: job.failedReason };
+    }
+    const progress = job.progress();
+    return { jobId, state: 'pending', progress: typeof progress === 'object' ? progress : undefined };
+  }
+
+  /**
+   * Follow an audit job from any process: `watcher` gets each stage and the
+   * final result. Returns a function that stops watching.
+   */
+  public watchAudit(jobId: string, watcher: AuditWatcher): () => void {
+    this.listenForJobEvents();
+    const watchers = this.watchers.get(jobId) || new Set();
+    watchers.add(watcher);
+    this.watchers.set(jobId, watchers);
+
+    return () => {
+      watchers.delete(watcher);
+      if (watchers.size === 0) this.watchers.delete(jobId);
+    };
+  }
+
+  /**
+   * One set of Bull global listeners (Redis pub/sub) shared by all watchers
+   */
+  private listenForJobEvents(): void {
+    if (this.listeningForJobEvents) return;
+    this.listeningForJobEvents = true;
+
+    const notify = (jobId: string, status: AuditStatus) => {
+      this.watchers.get(jobId)?.forEach(watcher => watcher(status));
+    };
+
+    this.queue.on('global:progress', (jobId: string, progress: string | AuditProgress) => {
+      notify(jobId, {
+        jobId,
+        state: 'pending',
+        progress: typeof progress === 'string' ? JSON.parse(progress) as AuditProgress : progress
+      });
+    });
+    this.queue.on('global:completed', (jobId: string, result: string | AuditJobResult) => {
+      const { report } = typeof result === 'string' ? JSON.parse(result) as AuditJobResult : result;
+      notify(jobId, { jobId, state: 'complete', report });
     });
+    this.queue.on('global:failed', (jobId: string) => {
+      if (!this.watchers.has(jobId)) return;
+      // Failed attempts with retries left go back to waiting
+      this.getAuditStatus(jobId)
+        .then(status => status?.state === 'failed' && notify(jobId, status))
+        .catch(error => console.warn(`⚠️ Could not read status of job ${jobId}:`, error.message));
+    });
+  }
+
+  /**
+   * Audit report history (every report the workers have made)
+   */
+  public getReportStore(): ReportStore {
+    return this.reports;
+  }
+
+  /**
+   * Mark a payment transaction as spent. Returns false if it already paid
+   * for an audit, so one payment can't be replayed for many.
+   */
+  public async claimPayment(signature: string): Promise<boolean> {
+    return (await this.queue.client.sadd(`${QUEUE_NAME}:payments`, signature)) === 1;
+  }
+
+  /**
+   * Give back a claimed payment that did not buy an audit after all, so it
+   * can pay for a later one
+   */
+  public async releasePayment(signature: string): Promise<void> {
+    await this.queue.client.srem(`${QUEUE_NAME}:payments`, signature);
   }
 
   /**
@@ -80,7 +356,9 @@ export class AuditQueue {
         console.log(`   Risk: ${result.report.riskLevel} (${result.report.overallRiskScore}/100)`);
         
         // Schedule next audit if applicable
-        this.scheduleNextAudit(result.report);
+        this.scheduleNextAudit(result.report).catch(error =>
+          console.error(`⚠️ Could not schedule next audit for ${result.report!.tokenAddress}:`, error.message)
+        );
       }
     });
 
@@ -100,14 +378,24 @@ export class AuditQueue {
   }
 
   /**
-   * Add a token audit to the queue
+   * Add a token audit to the queue. If the mint already has an audit waiting
+   * or running, that job is returned instead of queueing another.
    */
   public async addAudit(
     tokenAddress: string,
     priority: number = 0,
-    options?: Partial<JobOptions>
+    options?: Partial<JobOptions>,
+    data?: Partial<AuditJobData>
   ): Promise<Job<AuditJobData>> {
+    const jobId = options?.jobId ?? auditJobId(tokenAddress);
+    const [pending] = await this.freeJobIds([jobId]);
+    if (pending) {
+      const existing = await this.queue.getJob(jobId);
+      if (existing) return existing;
+    }
+
     const jobData: AuditJobData = {
+      ...data,
       tokenAddress,
       priority,
       retryCount: 0
@@ -115,6 +403,7 @@ export class AuditQueue {
 
     const job = await this.queue.add('audit', jobData, {
       priority,
+      jobId,
       ...options
     });
 
@@ -124,56 +413,75 @@ export class AuditQueue {
 
   /**
    * Add multiple audits in batch
+   * Addresses are deduplicated, mints that already have an audit waiting or
+   * running are skipped, and the rest are inserted with addBulk in chunks of
+   * BULK_CHUNK_SIZE (one Redis pipeline each). Returns the jobs added.
    */
   public async addBatchAudits(
     tokenAddresses: string[],
-    priority: number = 0
+    priority: number = 0,
+    data?: Partial<AuditJobData>
   ): Promise<Job<AuditJobData>[]> {
-    console.log(`📦 Adding batch of ${tokenAddresses.length} audits`);
-    
-    const jobs = await Promise.all(
-      tokenAddresses.map(address => this.addAudit(address, priority))
+    const unique = [...new Set(tokenAddresses)];
+    const added: Job<AuditJobData>[] = [];
+    let alreadyQueued = 0;
+
+    for (let start = 0; start < unique.length; start += BULK_CHUNK_SIZE) {
+      const chunk = unique.slice(start, start + BULK_CHUNK_SIZE);
+      const pending = await this.freeJobIds(chunk.map(auditJobId));
+
+      const jobs = chunk
+        .filter((_, i) => !pending[i])
+        .map(tokenAddress => ({
+          name: 'audit',
+          data: { ...data, tokenAddress, priority, retryCount: 0 },
+          opts: { priority, jobId: auditJobId(tokenAddress) }
+        }));
+      alreadyQueued += chunk.length - jobs.length;
+
+      if (jobs.length > 0) {
+        added.push(...await this.queue.addBulk(jobs));
+      }
+    }
+
+    console.log(
+      `📦 Batch of ${tokenAddresses.length} audits: ${added.length} added, ` +
+      `${tokenAddresses.length - unique.length} duplicates, ${alreadyQueued} already queued`
     );
+    return added;
+  }
 
-    return jobs;
+  /**
+   * Free finished job IDs (see FREE_JOB_IDS_SCRIPT) and report which are
+   * still pending. A concurrent add between this and queue.add is harmless:
+   * Bull keeps the first job with an ID.
+   */
+  private async freeJobIds(jobIds: string[]): Promise<boolean[]> {
+    if (jobIds.length === 0) return [];
+
+    const states = (await this.queue.client.eval(
+      FREE_JOB_IDS_SCRIPT,
+      2,
+      this.queue.toKey('completed'),
+      this.queue.toKey('failed'),
+      this.queue.toKey(''),
+      ...jobIds
+    )) as number[];
+    return states.map(state => state === 1);
   }
 
   /**
-   * Schedule recurring audits for a token
+   * Schedule recurring audits for a token. The schedule lives in Redis, so it
+   * survives restarts and is shared by every worker.
    */
-  public scheduleRecurringAudit(config: ScheduledAuditConfig): void {
-    this.scheduledAudits.set(config.tokenAddress, config);
-    
-    // Calculate delay based on frequency
-    let delay: number;
-    switch (config.frequency) {
-      case 'daily':
-        delay = 24 * 60 * 60 * 1000; // 24 hours
-        break;
-      case 'weekly':
-        delay = 7 * 24 * 60 * 60 * 1000; // 7 days
-        break;
-      case 'monthly':
-        delay = 30 * 24 * 60 * 60 * 1000; // 30 days
-        break;
+  public async scheduleRecurringAudit(config: ScheduledAuditConfig): Promise<void> {
+    if (!config.enabled) {
+      await this.cancelScheduledAudit(config.tokenAddress);
+      return;
     }
 
-    // Add repeatable job
-    this.queue.add(
-      'audit',
-      {
-        tokenAddress: config.tokenAddress,
-        priority: config.priority || 0,
-        scheduledAudit: true
-      },
-      {
-        repeat: {
-          every: delay
-        },
-        jobId: `scheduled-${config.tokenAddress}`
-      }
-    );
-
+    const interval = AUDIT_INTERVALS[config.frequency];
+    await this.scheduler.schedule(config.tokenAddress, Date.now() + interval, interval, config.priority || 0);
     console.log(`⏰ Scheduled ${config.frequency} audit for ${config.tokenAddress}`);
   }
 
@@ -181,16 +489,33 @@ export class AuditQueue {
    * Cancel scheduled audit
    */
   public async cancelScheduledAudit(tokenAddress: string): Promise<void> {
-    const jobId = `scheduled-${tokenAddress}`;
-    await this.queue.removeRepeatable('audit', {
-      every: 0, // This is a placeholder, Bull will find the actual repeat config
-      jobId
-    });
-    
-    this.scheduledAudits.delete(tokenAddress);
+    await this.scheduler.unschedule(tokenAddress);
     console.log(`🛑 Cancelled scheduled audit for ${tokenAddress}`);
   }
 
+  /**
+   * Move recurring audits created as per-token Bull repeatable jobs onto the
+   * scheduler, keeping their next run time. Returns how many were moved.
+   */
+  public async migrateRepeatableAudits(): Promise<number> {
+    const repeatable = await this.queue.getRepeatableJobs();
+    let migrated = 0;
+
+    for (const job of repeatable) {
+      if (!job.id?.startsWith('scheduled-')) continue;
+      const tokenAddress = job.id.slice('scheduled-'.length);
+      const interval = Number(job.every) || AUDIT_INTERVALS.weekly;
+      await this.scheduler.schedule(tokenAddress, job.next, interval);
+      await this.queue.removeRepeatableByKey(job.key);
+      migrated++;
+    }
+
+    if (migrated > 0) {
+      console.log(`🔀 Migrated ${migrated} repeatable audits to the scheduler`);
+    }
+    return migrated;
+  }
+
   /**
    * Schedule next audit based on report risk level
    */
@@ -216,14 +541,8 @@ export class AuditQueue {
         break;
     }
 
-    // Check if already scheduled
-    const existing = this.scheduledAudits.get(report.tokenAddress);
-    if (existing && existing.frequency === frequency) {
-      return; // Already scheduled at correct frequency
-    }
-
-    // Schedule new audit
-    this.scheduleRecurringAudit({
+    // Replaces any earlier due time, including the lease set when claimed
+    await this.scheduleRecurringAudit({
       tokenAddress: report.tokenAddress,
       frequency,
       priority: report.riskLevel === 'CRITICAL' ? 10 : 5,
@@ -231,6 +550,13 @@ export class AuditQueue {
     });
   }
 
+  /**
+   * Number of tokens on the re-audit schedule
+   */
+  public async getScheduledCount(): Promise<number> {
+    return this.scheduler.count();
+  }
+
   /**
    * Get queue statistics
    */
@@ -254,6 +580,20 @@ export class AuditQueue {
     return { waiting, active, completed, failed, delayed, paused };
   }
 
+  /**
+   * Publish getStats() as audit_queue_jobs{state} gauges, refreshed on every
+   * scrape. Register from one process only: the counts are queue-wide.
+   */
+  public registerMetrics(registry: MetricsRegistry = metrics): void {
+    const gauge = registry.gauge('audit_queue_jobs', 'Audit jobs in the Bull queue by state', ['state']);
+    registry.onCollect(async () => {
+      const stats = await this.getStats();
+      for (const [state, count] of Object.entries(stats)) {
+        gauge.set({ state }, count);
+      }
+    });
+  }
+
   /**
    * Get failed jobs for analysis
    */
@@ -302,6 +642,7 @@ export class AuditQueue {
    * Close queue connection
    */
   public async close(): Promise<void> {
+    this.scheduler.stop();
     await this.queue.close();
     console.log('👋 Queue closed');
   }
@@ -319,14 +660,16 @@ export class AuditQueue {
  */
 export async function createAuditQueue(
   toriiApiUrl?: string,
-  queueConfig?: Partial<QueueConfig>
+  queueConfig?: Partial<QueueConfig>,
+  analyzer?: TokenAnalyzer
 ): Promise<AuditQueue> {
   const auditor = new ComplianceAuditor(toriiApiUrl);
-  const queue = new AuditQueue(auditor, queueConfig);
+  const queue = new AuditQueue(auditor, queueConfig, analyzer);
   
   console.log('🚀 Audit queue initialized');
   console.log(`   Redis: ${queueConfig?.redis?.host || 'localhost'}:${queueConfig?.redis?.port || 6379}`);
   console.log(`   Retry attempts: ${queueConfig?.retryAttempts || 3}`);
+  console.log(`   Concurrency: ${queueConfig?.processJobs === false ? 'producer only' : queueConfig?.concurrency || 1}`);
   
   return queue;
 }
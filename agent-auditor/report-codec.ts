@@ -0,0 +1,554 @@
+/**
+ * Compact Audit Report Codec
+ * Binary encoding of AuditReport for storage and transport. Prose from
+ * RiskScorer, the auditor and Torii is written as a phrase code plus the
+ * numbers it contains, token addresses as their 32 raw bytes and small
+ * integers as one byte. Anything unrecognised is kept verbatim, so decoding
+ * always returns exactly the report that was encoded.
+ */
+
+import { AuditReport, RedFlag, RiskFactors, ToriiApiResponse } from './types.js';
+
+const FORMAT_VERSION = 1;
+
+/**
+ * Known text with every number replaced by `#`. A phrase's code is its index
+ * plus one, so this list is append-only: reordering or removing entries
+ * breaks stored reports.
+ */
+const PHRASES = [
+  // Risk levels, red flag severities and token classifications
+  'LOW',
+  'MEDIUM',
+  'HIGH',
+  'CRITICAL',
+  'payment_token',
+  'utility_token',
+  'security_token',
+  'governance_token',
+  'unknown',
+
+  // RiskScorer factor details
+  'No holder data available',
+  'CRITICAL: Single holder owns #% of supply',
+  'High centralization: Top holder owns #%',
+  'Moderate centralization: Top holder owns #%',
+  'Top # holders control #% of supply',
+  'Well-distributed: Top holder #%, top # holders #%',
+  'CRITICAL: Both mint and freeze authorities are active - token can be inflated and accounts frozen',
+  'HIGH RISK: Mint authority active - supply can be inflated at any time',
+  'HIGH RISK: Freeze authority active - accounts can be frozen',
+  'Authorities renounced - token supply is fixed and accounts cannot be frozen',
+  'No whales detected (no holder > #%)',
+  '# whales control #% of supply',
+  '# whales control #% of supply - moderate risk',
+  'Very low liquidity: only # holders',
+  'Low liquidity: # holders',
+  'Moderate liquidity: # holders',
+  'Good liquidity: # holders',
+
+  // RiskScorer red flags
+  'Centralized Ownership',
+  'Single holder controls #% of supply',
+  'Potential for price manipulation and regulatory classification as security',
+  'Top holder owns #% of supply',
+  'May indicate centralized control and regulatory scrutiny',
+  'Mint Authority',
+  'Mint authority is not renounced',
+  'Supply can be inflated at any time, undermining scarcity and value',
+  'Freeze Authority',
+  'Freeze authority is not renounced',
+  'Token accounts can be frozen, preventing transfers',
+  'Whale Concentration',
+  'High risk of coordinated market manipulation',
+  'Low Liquidity',
+  'Only # token holders',
+  'Low liquidity may result in high slippage and difficulty exiting positions',
+
+  // RiskScorer recommendations
+  '🔑 Renounce mint authority to fix total supply and improve trust',
+  '🔑 Renounce freeze authority to prevent account freezing',
+  '📊 Improve token distribution to reduce centralization risk',
+  '🔄 Consider vesting schedules or airdrops to increase holder diversity',
+  '🐋 Encourage whale holders to diversify or implement anti-whale mechanisms',
+  '💧 Increase liquidity by adding to DEX pools or increasing holder count',
+  '⚖️ Consult with legal counsel regarding Japan PSA/FIEA compliance',
+  '📋 Consider registration with Japanese Financial Services Agency if classified as security',
+
+  // Auditor regulatory status
+  'Likely compliant with Japan PSA',
+  'May require PSA/FIEA registration',
+  'Likely requires FIEA registration as security token',
+  'Requires PSA registration as crypto asset',
+  'May qualify as utility token (PSA registration)',
+  'Uncertain - consult legal counsel',
+  'Classification unclear - may be security or utility',
+  'Classification unknown - legal review required',
+
+  // Torii classifications, warnings, requirements and notes
+  'SECURITY TOKEN',
+  'HIGH RISK - Possible Security',
+  'NFT',
+  'CRYPTO ASSET',
+  'PREPAID PAYMENT',
+  'UTILITY TOKEN',
+  '⚠️  Profit/revenue distribution detected',
+  '⚠️  Staking mechanism may trigger collective investment scheme',
+  'ℹ️  Governance rights (lower risk if no economic benefit)',
+  '⚠️  Buyback program may indicate security characteristics',
+  '🚨 Investment language detected - high security risk',
+  'Type I or II Financial Instruments Business License',
+  'Legal consultation before Japan launch',
+  'Usually none (case by case)',
+  'Crypto Asset Exchange License',
+  'Notification to Finance Bureau',
+  'Usually no registration',
+  'SECURITY TOKEN (電子記録移転権利) - Financial Instruments and Exchange Act',
+  'HIGH RISK - Possible Security (要審査) - May require: FIEA registration',
+  'NFT (NFT) - Note: Fractional NFTs may be securities',
+  'CRYPTO ASSET (暗号資産) - Payment Services Act',
+  'PREPAID PAYMENT (前払式支払手段) - Payment Services Act',
+  'UTILITY TOKEN (ユーティリティトークン) - Note: Verify no security characteristics'
+];
+
+const PHRASE_CODES = new Map(PHRASES.map((phrase, i) => [phrase, i + 1]));
+const PHRASE_PARTS = PHRASES.map(phrase => phrase.split('#'));
+const NUMBER_PATTERN = /\d+(?:\.\d+)?/g;
+
+// Number tags; smaller values are the number itself
+const UINT_TAG = 0xfd;
+const FLOAT_TAG = 0xfe;
+
+// Flag bits
+const HAS_NAME = 1 << 0;
+const HAS_SYMBOL = 1 << 1;
+const HAS_TORII = 1 << 2;
+const HAS_NEXT_AUDIT = 1 << 3;
+const COMPLIANT = 1 << 4;
+const MINT_AUTHORITY = 1 << 5;
+const FREEZE_AUTHORITY = 1 << 6;
+const TORII_COMPLIANT = 1 << 7;
+const HAS_TORII_NOTES = 1 << 8;
+const HAS_TORII_SCORE = 1 << 9;
+const HAS_TORII_LEVEL = 1 << 10;
+const HAS_TORII_CONFIDENCE = 1 << 11;
+
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
+const BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz';
+const BASE58_VALUES = new Int8Array(128).fill(-1);
+for (let i = 0; i < BASE58_ALPHABET.length; i++) {
+  BASE58_VALUES[BASE58_ALPHABET.charCodeAt(i)] = i;
+}
+
+/**
+ * Base58 text of a 32-byte public key (PublicKey.toBase58 without the BN
+ * round trip)
+ */
+function encodeKey(bytes: Uint8Array): string {
+  const digits = new Uint8Array(44);
+  let length = 0;
+  for (const byte of bytes) {
+    let carry = byte;
+    for (let j = 0; j < length; j++) {
+      carry += digits[j] << 8;
+      digits[j] = carry % 58;
+      carry = (carry / 58) | 0;
+    }
+    while (carry > 0) {
+      digits[length++] = carry % 58;
+      carry = (carry / 58) | 0;
+    }
+  }
+
+  let text = '';
+  for (let i = 0; i < bytes.length && bytes[i] === 0; i++) text += '1';
+  for (let j = length - 1; j >= 0; j--) text += BASE58_ALPHABET[digits[j]];
+  return text;
+}
+
+/**
+ * The 32 bytes of a canonical base58 public key, or null for any other text
+ */
+function decodeKey(text: string): Uint8Array | null {
+  if (text.length < 32 || text.length > 44) return null;
+  const bytes = new Uint8Array(32);
+  for (let i = 0; i < text.length; i++) {
+    const code = text.charCodeAt(i);
+    let carry = code < 128 ? BASE58_VALUES[code] : -1;
+    if (carry < 0) return null;
+    for (let j = 31; j >= 0; j--) {
+      carry += bytes[j] * 58;
+      bytes[j] = carry & 0xff;
+      carry >>= 8;
+    }
+    if (carry !== 0) return null;
+  }
+  // Extra leading '1's decode to the same bytes
+  return encodeKey(bytes) === text ? bytes : null;
+}
+
+/**
+ * Decimal text of a number parameter: value * 4 + digits after the point
+ * (up to 3), or null if the text wouldn't come back unchanged
+ */
+function packDecimal(text: string): number | null {
+  const point = text.indexOf('.');
+  const decimals = point === -1 ? 0 : text.length - point - 1;
+  // Leading zeros ("007", "00.5") and long numbers don't survive the trip
+  if (decimals > 3 || text.length > 15 || (text[0] === '0' && text.length > 1 && point !== 1)) {
+    return null;
+  }
+  const value = Number(point === -1 ? text : text.slice(0, point) + text.slice(point + 1));
+  return value * 4 + decimals;
+}
+
+function unpackDecimal(packed: number): string {
+  const decimals = packed % 4;
+  const digits = String((packed - decimals) / 4);
+  if (decimals === 0) return digits;
+  const padded = digits.padStart(decimals + 1, '0');
+  return `${padded.slice(0, -decimals)}.${padded.slice(-decimals)}`;
+}
+
+class Writer {
+  private bytes = new Uint8Array(256);
+  private view = new DataView(this.bytes.buffer);
+  private offset = 0;
+
+  private reserve(size: number): void {
+    if (this.offset + size <= this.bytes.length) return;
+    const grown = new Uint8Array(Math.max(this.bytes.length * 2, this.offset + size));
+    grown.set(this.bytes);
+    this.bytes = grown;
+    this.view = new DataView(grown.buffer);
+  }
+
+  byte(value: number): void {
+    this.reserve(1);
+    this.bytes[this.offset++] = value;
+  }
+
+  raw(bytes: Uint8Array): void {
+    this.reserve(bytes.length);
+    this.bytes.set(bytes, this.offset);
+    this.offset += bytes.length;
+  }
+
+  /**
+   * LEB128 unsigned integer (arithmetic, so safe up to 2^53)
+   */
+  uvarint(value: number): void {
+    while (value >= 0x80) {
+      this.byte((value % 0x80) | 0x80);
+      value = Math.floor(value / 0x80);
+    }
+    this.byte(value);
+  }
+
+  number(value: number): void {
+    if (Number.isSafeInteger(value) && value >= 0 && !Object.is(value, -0)) {
+      if (value < UINT_TAG) {
+        this.byte(value);
+      } else {
+        this.byte(UINT_TAG);
+        this.uvarint(value);
+      }
+      return;
+    }
+    this.byte(FLOAT_TAG);
+    this.reserve(8);
+    this.view.setFloat64(this.offset, value);
+    this.offset += 8;
+  }
+
+  /**
+   * Phrase code and number parameters, or 0 and the UTF-8 text
+   */
+  text(value: string): void {
+    // A literal '#' would be read back as a parameter
+    let exact = !value.includes('#');
+    const direct = exact ? PHRASE_CODES.get(value) : undefined;
+    if (direct !== undefined) {
+      this.uvarint(direct);
+      return;
+    }
+
+    const params: number[] = [];
+    let phrase = '';
+    let end = 0;
+    NUMBER_PATTERN.lastIndex = 0;
+    for (let match = NUMBER_PATTERN.exec(value); match && exact; match = NUMBER_PATTERN.exec(value)) {
+      const packed = packDecimal(match[0]);
+      if (packed === null) exact = false;
+      else params.push(packed);
+      phrase += value.slice(end, match.index) + '#';
+      end = NUMBER_PATTERN.lastIndex;
+    }
+    phrase += value.slice(end);
+
+    const code = exact ? PHRASE_CODES.get(phrase) : undefined;
+    if (code !== undefined) {
+      this.uvarint(code);
+      for (const param of params) this.uvarint(param);
+      return;
+    }
+
+    const bytes = textEncoder.encode(value);
+    this.uvarint(0);
+    this.uvarint(bytes.length);
+    this.raw(bytes);
+  }
+
+  texts(values: string[]): void {
+    this.uvarint(values.length);
+    for (const value of values) this.text(value);
+  }
+
+  /**
+   * 1 and the 32 key bytes for a canonical base58 public key, else 0 and text
+   */
+  address(value: string): void {
+    const key = decodeKey(value);
+    if (key) {
+      this.byte(1);
+      this.raw(key);
+    } else {
+      this.byte(0);
+      this.text(value);
+    }
+  }
+
+  finish(): Uint8Array {
+    return this.bytes.slice(0, this.offset);
+  }
+}
+
+class Reader {
+  private view: DataView;
+  private offset = 0;
+
+  constructor(private bytes: Uint8Array) {
+    this.view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  }
+
+  byte(): number {
+    if (this.offset >= this.bytes.length) {
+      throw new RangeError('Truncated audit report');
+    }
+    return this.bytes[this.offset++];
+  }
+
+  raw(length: number): Uint8Array {
+    if (this.offset + length > this.bytes.length) {
+      throw new RangeError('Truncated audit report');
+    }
+    const bytes = this.bytes.subarray(this.offset, this.offset + length);
+    this.offset += length;
+    return bytes;
+  }
+
+  uvarint(): number {
+    let value = 0;
+    let scale = 1;
+    let byte: number;
+    do {
+      byte = this.byte();
+      value += (byte & 0x7f) * scale;
+      scale *= 0x80;
+    } while (byte & 0x80);
+    return value;
+  }
+
+  number(): number {
+    const tag = this.byte();
+    if (tag < UINT_TAG) return tag;
+    if (tag === UINT_TAG) return this.uvarint();
+    const value = this.view.getFloat64(this.offset);
+    this.raw(8);
+    return value;
+  }
+
+  text(): string {
+    const code = this.uvarint();
+    if (code === 0) {
+      return textDecoder.decode(this.raw(this.uvarint()));
+    }
+    const parts = PHRASE_PARTS[code - 1];
+    if (parts === undefined) {
+      throw new RangeError(`Unknown phrase code ${code}`);
+    }
+    let text = parts[0];
+    for (let i = 1; i < parts.length; i++) {
+      text += unpackDecimal(this.uvarint()) + parts[i];
+    }
+    return text;
+  }
+
+  texts(): string[] {
+    return Array.from({ length: this.uvarint() }, () => this.text());
+  }
+
+  address(): string {
+    return this.byte() === 1 ? encodeKey(this.raw(32)) : this.text();
+  }
+}
+
+/**
+ * Encode a report (optional fields absent or undefined are equivalent)
+ */
+export function encodeReport(report: AuditReport): Uint8Array {
+  const { riskFactors, toriiApiResponse: torii } = report;
+  const writer = new Writer();
+
+  let flags = 0;
+  if (report.tokenName !== undefined) flags |= HAS_NAME;
+  if (report.tokenSymbol !== undefined) flags |= HAS_SYMBOL;
+  if (torii) flags |= HAS_TORII;
+  if (report.nextAuditSchedule !== undefined) flags |= HAS_NEXT_AUDIT;
+  if (report.japanCompliance.compliant) flags |= COMPLIANT;
+  if (riskFactors.authorityRisk.hasMintAuthority) flags |= MINT_AUTHORITY;
+  if (riskFactors.authorityRisk.hasFreezeAuthority) flags |= FREEZE_AUTHORITY;
+  if (torii?.compliant) flags |= TORII_COMPLIANT;
+  if (torii?.regulatoryNotes !== undefined) flags |= HAS_TORII_NOTES;
+  if (torii?.riskScore !== undefined) flags |= HAS_TORII_SCORE;
+  if (torii?.riskLevel !== undefined) flags |= HAS_TORII_LEVEL;
+  if (torii?.confidence !== undefined) flags |= HAS_TORII_CONFIDENCE;
+
+  writer.byte(FORMAT_VERSION);
+  writer.uvarint(flags);
+  writer.address(report.tokenAddress);
+  if (report.tokenName !== undefined) writer.text(report.tokenName);
+  if (report.tokenSymbol !== undefined) writer.text(report.tokenSymbol);
+  writer.number(report.timestamp);
+  writer.number(report.overallRiskScore);
+  writer.text(report.riskLevel);
+  writer.text(report.japanCompliance.classification);
+  writer.text(report.japanCompliance.regulatoryStatus);
+
+  const { centralizedOwnership, authorityRisk, whaleConcentration, liquidityRisk } = riskFactors;
+  writer.number(centralizedOwnership.score);
+  writer.text(centralizedOwnership.details);
+  writer.number(centralizedOwnership.topHolderPercentage);
+  writer.number(centralizedOwnership.top10HolderPercentage);
+  writer.number(authorityRisk.score);
+  writer.text(authorityRisk.details);
+  writer.number(whaleConcentration.score);
+  writer.text(whaleConcentration.details);
+  writer.number(whaleConcentration.whaleCount);
+  writer.number(whaleConcentration.whalePercentage);
+  writer.number(liquidityRisk.score);
+  writer.text(liquidityRisk.details);
+
+  writer.uvarint(report.redFlags.length);
+  for (const redFlag of report.redFlags) {
+    writer.text(redFlag.severity);
+    writer.text(redFlag.category);
+    writer.text(redFlag.description);
+    writer.text(redFlag.impact);
+  }
+  writer.texts(report.recommendations);
+
+  if (torii) {
+    writer.text(torii.classification);
+    writer.texts(torii.warnings);
+    writer.texts(torii.recommendations);
+    if (torii.regulatoryNotes !== undefined) writer.text(torii.regulatoryNotes);
+    if (torii.riskScore !== undefined) writer.number(torii.riskScore);
+    if (torii.riskLevel !== undefined) writer.text(torii.riskLevel);
+    if (torii.confidence !== undefined) writer.number(torii.confidence);
+  }
+  if (report.nextAuditSchedule !== undefined) writer.number(report.nextAuditSchedule);
+
+  return writer.finish();
+}
+
+/**
+ * Decode a report written by encodeReport. Fields come back in the order
+ * the auditor builds them, so JSON of the result matches JSON of the input.
+ */
+export function decodeReport(bytes: Uint8Array): AuditReport {
+  const reader = new Reader(bytes);
+  const version = reader.byte();
+  if (version !== FORMAT_VERSION) {
+    throw new RangeError(`Unsupported audit report format ${version}`);
+  }
+  const flags = reader.uvarint();
+
+  const tokenAddress = reader.address();
+  const tokenName = flags & HAS_NAME ? reader.text() : undefined;
+  const tokenSymbol = flags & HAS_SYMBOL ? reader.text() : undefined;
+  const timestamp = reader.number();
+  const overallRiskScore = reader.number();
+  const riskLevel = reader.text() as AuditReport['riskLevel'];
+  const japanCompliance: AuditReport['japanCompliance'] = {
+    classification: reader.text() as AuditReport['japanCompliance']['classification'],
+    compliant: (flags & COMPLIANT) !== 0,
+    regulatoryStatus: reader.text()
+  };
+
+  const riskFactors: RiskFactors = {
+    centralizedOwnership: {
+      score: reader.number(),
+      details: reader.text(),
+      topHolderPercentage: reader.number(),
+      top10HolderPercentage: reader.number()
+    },
+    authorityRisk: {
+      score: reader.number(),
+      details: reader.text(),
+      hasMintAuthority: (flags & MINT_AUTHORITY) !== 0,
+      hasFreezeAuthority: (flags & FREEZE_AUTHORITY) !== 0
+    },
+    whaleConcentration: {
+      score: reader.number(),
+      details: reader.text(),
+      whaleCount: reader.number(),
+      whalePercentage: reader.number()
+    },
+    liquidityRisk: {
+      score: reader.number(),
+      details: reader.text()
+    }
+  };
+
+  const redFlags: RedFlag[] = Array.from({ length: reader.uvarint() }, () => ({
+    severity: reader.text() as RedFlag['severity'],
+    category: reader.text(),
+    description: reader.text(),
+    impact: reader.text()
+  }));
+  const recommendations = reader.texts();
+
+  let toriiApiResponse: ToriiApiResponse | undefined;
+  if (flags & HAS_TORII) {
+    toriiApiResponse = {
+      compliant: (flags & TORII_COMPLIANT) !== 0,
+      classification: reader.text(),
+      warnings: reader.texts(),
+      recommendations: reader.texts()
+    };
+    if (flags & HAS_TORII_NOTES) toriiApiResponse.regulatoryNotes = reader.text();
+    if (flags & HAS_TORII_SCORE) toriiApiResponse.riskScore = reader.number();
+    if (flags & HAS_TORII_LEVEL) toriiApiResponse.riskLevel = reader.text() as ToriiApiResponse['riskLevel'];
+    if (flags & HAS_TORII_CONFIDENCE) toriiApiResponse.confidence = reader.number();
+  }
+
+  const nextAuditSchedule = flags & HAS_NEXT_AUDIT ? reader.number() : undefined;
+
+  return {
+    tokenAddress,
+    ...(tokenName !== undefined && { tokenName }),
+    ...(tokenSymbol !== undefined && { tokenSymbol }),
+    timestamp,
+    overallRiskScore,
+    riskLevel,
+    japanCompliance,
+    riskFactors,
+    redFlags,
+    recommendations,
+    ...(toriiApiResponse && { toriiApiResponse }),
+    ...(nextAuditSchedule !== undefined && { nextAuditSchedule })
+  };
+}
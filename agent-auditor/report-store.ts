@@ -0,0 +1,293 @@
+/**
+ * Audit Report Store
+ * Every audit report kept in Redis next to the queue, with sorted-set indexes
+ * by token, time, risk level and next audit time. Index members sort
+ * lexicographically (zero-padded time + token address), so every query is a
+ * range scan with an exact cursor: O(log n + page size) at any store size.
+ * Reports are stored in the compact binary encoding (see report-codec.ts).
+ */
+
+import type { Queue } from 'bull';
+import { encodeReport, decodeReport } from './report-codec.js';
+import { AuditReport, ReportPage, ReportQuery, StoredAudit } from './types.js';
+
+const RISK_LEVELS: AuditReport['riskLevel'][] = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL'];
+const MAX_PAGE_SIZE = 1000;
+
+/**
+ * Save a report and update every index. An older report than the token's
+ * latest (a late retry) only joins the history.
+ *
+ * KEYS: records, latest, next-audit, by-time, by-token, by-next-audit,
+ *       by-risk LOW, MEDIUM, HIGH, CRITICAL
+ * ARGV: report ID, token address, encoded record, risk level index (1-4),
+ *       next-audit member ('' for none), per-token history limit (0 = all)
+ */
+const SAVE_SCRIPT = `
+local id, address = ARGV[1], ARGV[2]
+redis.call('HSET', KEYS[1], id, ARGV[3])
+redis.call('ZADD', KEYS[4], 0, id)
+redis.call('ZADD', KEYS[5], 0, id)
+
+local previous = redis.call('HGET', KEYS[2], address)
+if not previous or previous < id then
+  redis.call('HSET', KEYS[2], address, id)
+  if previous then
+    for level = 7, 10 do redis.call('ZREM', KEYS[level], previous) end
+  end
+  redis.call('ZADD', KEYS[6 + tonumber(ARGV[4])], 0, id)
+
+  local due = redis.call('HGET', KEYS[3], address)
+  if due then redis.call('ZREM', KEYS[6], due) end
+  if ARGV[5] == '' then
+    redis.call('HDEL', KEYS[3], address)
+  else
+    redis.call('HSET', KEYS[3], address, ARGV[5])
+    redis.call('ZADD', KEYS[6], 0, ARGV[5])
+  end
+end
+
+local limit = tonumber(ARGV[6])
+local excess = limit > 0 and redis.call('ZCARD', KEYS[5]) - limit or 0
+if excess > 0 then
+  local trimmed = redis.call('ZRANGE', KEYS[5], 0, excess - 1)
+  redis.call('ZREMRANGEBYRANK', KEYS[5], 0, excess - 1)
+  for _, old in ipairs(trimmed) do
+    redis.call('ZREM', KEYS[4], old)
+    redis.call('HDEL', KEYS[1], old)
+  end
+end
+return 1
+`;
+
+/**
+ * One page of an index with its records in one round trip. Members of the
+ * next-audit index name a token, resolved through its latest report.
+ *
+ * KEYS: index, records, latest
+ * ARGV: 'rev' or 'fwd', start bound, end bound, limit, '1' to resolve tokens
+ */
+const PAGE_SCRIPT = `
+local members
+if ARGV[1] == 'rev' then
+  members = redis.call('ZREVRANGEBYLEX', KEYS[1], ARGV[2], ARGV[3], 'LIMIT', 0, ARGV[4])
+else
+  members = redis.call('ZRANGEBYLEX', KEYS[1], ARGV[2], ARGV[3], 'LIMIT', 0, ARGV[4])
+end
+if #members == 0 then return {members, {}} end
+
+local ids = members
+if ARGV[5] == '1' then
+  local addresses = {}
+  for i, member in ipairs(members) do addresses[i] = string.sub(member, 15) end
+  ids = redis.call('HMGET', KEYS[3], unpack(addresses))
+  for i, id in ipairs(ids) do if not id then ids[i] = '' end end
+end
+return {members, redis.call('HMGET', KEYS[2], unpack(ids))}
+`;
+
+/**
+ * Fixed-width time so lexicographic order is time order
+ */
+function timeKey(ms: number): string {
+  return String(Math.max(0, Math.floor(ms))).padStart(13, '0');
+}
+
+/**
+ * Report ID: audit time then token address
+ */
+export function reportId(report: Pick<AuditReport, 'timestamp' | 'tokenAddress'>): string {
+  return `${timeKey(report.timestamp)}:${report.tokenAddress}`;
+}
+
+// Fingerprint framing in front of the encoded report
+const NO_FINGERPRINT = 0;
+const HEX_FINGERPRINT = 1;
+const TEXT_FINGERPRINT = 2;
+const JSON_RECORD = 0x7b; // '{' - records written before the binary encoding
+
+/**
+ * LEB128 fingerprint length (one byte, as before, below 128)
+ */
+function encodeLength(length: number): number[] {
+  const bytes: number[] = [];
+  while (length >= 0x80) {
+    bytes.push((length & 0x7f) | 0x80);
+    length >>>= 7;
+  }
+  bytes.push(length);
+  return bytes;
+}
+
+/**
+ * Fingerprint then report, with a hex fingerprint (sha256) packed as bytes
+ * and its length as a varint
+ */
+function encodeRecord(report: AuditReport, fingerprint?: string): Buffer {
+  let header: Buffer;
+  if (fingerprint === undefined) {
+    header = Buffer.from([NO_FINGERPRINT]);
+  } else {
+    const hex = Buffer.from(fingerprint, 'hex');
+    const packed = hex.toString('hex') === fingerprint;
+    const bytes = packed ? hex : Buffer.from(fingerprint);
+    header = Buffer.concat([Buffer.from([packed ? HEX_FINGERPRINT : TEXT_FINGERPRINT, ...encodeLength(bytes.length)]), bytes]);
+  }
+  return Buffer.concat([header, encodeReport(report)]);
+}
+
+function decodeRecord(record: Buffer): StoredAudit {
+  if (record[0] === JSON_RECORD) return JSON.parse(record.toString());
+  if (record[0] === NO_FINGERPRINT) {
+    const report = decodeReport(record.subarray(1));
+    return { id: reportId(report), report };
+  }
+
+  let length = 0;
+  let start = 1;
+  for (let shift = 0; ; shift += 7) {
+    const byte = record[start++];
+    length |= (byte & 0x7f) << shift;
+    if (!(byte & 0x80)) break;
+  }
+
+  const report = decodeReport(record.subarray(start + length));
+  return {
+    id: reportId(report),
+    fingerprint: record.subarray(start, start + length).toString(record[0] === HEX_FINGERPRINT ? 'hex' : 'utf8'),
+    report
+  };
+}
+
+export interface ReportStoreConfig {
+  key: string; // prefix of the store's hashes and indexes
+  historyLimit: number; // reports kept per token, oldest trimmed first (default: 0 = all)
+}
+
+export class ReportStore {
+  private config: ReportStoreConfig;
+
+  constructor(
+    private redis: Queue['client'],
+    config?: Partial<ReportStoreConfig>
+  ) {
+    this.config = {
+      key: config?.key || 'audit-reports',
+      historyLimit: config?.historyLimit || 0
+    };
+  }
+
+  private keyFor(name: string): string {
+    return `${this.config.key}:${name}`;
+  }
+
+  /**
+   * Store a report (and the fingerprint it was audited at) and index it
+   */
+  public async save(report: AuditReport, fingerprint?: string): Promise<string> {
+    const id = reportId(report);
+    await this.redis.eval(
+      SAVE_SCRIPT,
+      10,
+      this.keyFor('records'),
+      this.keyFor('latest'),
+      this.keyFor('next-audit'),
+      this.keyFor('by-time'),
+      this.keyFor(`by-token:${report.tokenAddress}`),
+      this.keyFor('by-next-audit'),
+      ...RISK_LEVELS.map(level => this.keyFor(`by-risk:${level}`)),
+      id,
+      report.tokenAddress,
+      encodeRecord(report, fingerprint),
+      RISK_LEVELS.indexOf(report.riskLevel) + 1,
+      report.nextAuditSchedule ? `${timeKey(report.nextAuditSchedule)}:${report.tokenAddress}` : '',
+      this.config.historyLimit
+    );
+    return id;
+  }
+
+  /**
+   * Most recent audit of a token, or null if it was never audited
+   */
+  public async getLatest(tokenAddress: string): Promise<StoredAudit | null> {
+    const id = await this.redis.hget(this.keyFor('latest'), tokenAddress);
+    return id ? this.get(id) : null;
+  }
+
+  public async get(id: string): Promise<StoredAudit | null> {
+    const stored = await this.redis.hgetBuffer(this.keyFor('records'), id);
+    return stored ? decodeRecord(stored) : null;
+  }
+
+  /**
+   * A token's audits, newest first
+   */
+  public getHistory(tokenAddress: string, query?: ReportQuery): Promise<ReportPage> {
+    return this.newestFirst(this.keyFor(`by-token:${tokenAddress}`), query);
+  }
+
+  /**
+   * Every audit, newest first
+   */
+  public getRecent(query?: ReportQuery): Promise<ReportPage> {
+    return this.newestFirst(this.keyFor('by-time'), query);
+  }
+
+  /**
+   * Tokens whose latest audit is at `riskLevel`, most recently audited first
+   */
+  public getByRiskLevel(riskLevel: AuditReport['riskLevel'], query?: ReportQuery): Promise<ReportPage> {
+    return this.newestFirst(this.keyFor(`by-risk:${riskLevel}`), query);
+  }
+
+  /**
+   * Latest reports whose next audit is due by `dueBy`, soonest first
+   */
+  public getDueForReaudit(dueBy: number = Date.now(), query?: ReportQuery): Promise<ReportPage> {
+    const start = query?.cursor ? `(${query.cursor}` : '-';
+    // ';' sorts after ':', so every member due at `dueBy` is included
+    return this.page(this.keyFor('by-next-audit'), 'fwd', start, `[${timeKey(dueBy)};`, query?.limit, true);
+  }
+
+  /**
+   * Number of stored reports
+   */
+  public async count(): Promise<number> {
+    return this.redis.zcard(this.keyFor('by-time'));
+  }
+
+  private newestFirst(index: string, query?: ReportQuery): Promise<ReportPage> {
+    // A cursor is always older than `until`, so it only bounds the first page
+    const start = query?.cursor ? `(${query.cursor}` : query?.until !== undefined ? `[${timeKey(query.until)};` : '+';
+    const end = query?.since ? `[${timeKey(query.since)}` : '-';
+    return this.page(index, 'rev', start, end, query?.limit, false);
+  }
+
+  private async page(
+    index: string,
+    direction: 'rev' | 'fwd',
+    start: string,
+    end: string,
+    limit: number = 50,
+    resolveTokens: boolean
+  ): Promise<ReportPage> {
+    const pageSize = Math.min(Math.max(1, limit), MAX_PAGE_SIZE);
+    const [members, records] = (await this.redis.evalBuffer(
+      PAGE_SCRIPT,
+      3,
+      index,
+      this.keyFor('records'),
+      this.keyFor('latest'),
+      direction,
+      start,
+      end,
+      pageSize,
+      resolveTokens ? '1' : '0'
+    )) as [Buffer[], Array<Buffer | null>];
+
+    return {
+      items: records.filter((record): record is Buffer => !!record).map(decodeRecord),
+      nextCursor: members.length === pageSize ? members[members.length - 1].toString() : undefined
+    };
+  }
+}
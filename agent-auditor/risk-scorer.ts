@@ -4,92 +4,446 @@
  */
 
 import { TokenData, RiskFactors, RedFlag, TokenClassification } from './types.js';
+import { HolderSet, HolderSummary, WHALE_THRESHOLD } from './holder-set.js';
+import {
+  TokenBatch,
+  MINT_AUTHORITY,
+  FREEZE_AUTHORITY,
+  GOVERNANCE_HINT,
+  hasGovernanceHint
+} from './token-batch.js';
+
+/**
+ * Factor scores as pure functions of the holder aggregates, shared by the
+ * per-token analyzers and scoreBatch. Detail strings are built separately so
+ * batch scoring can skip them.
+ */
+function centralizationScore(count: number, topHolderPercentage: number, top10HolderPercentage: number): number {
+  if (count === 0) return 100;
+  // Single holder > 50% is critical
+  if (topHolderPercentage > 50) return 100;
+  if (topHolderPercentage > 30) return 75;
+  if (topHolderPercentage > 20) return 50;
+  if (top10HolderPercentage > 70) return 60;
+  if (top10HolderPercentage > 50) return 40;
+  return 20;
+}
+
+function centralizationDetails(count: number, topHolderPercentage: number, top10HolderPercentage: number): string {
+  if (count === 0) return 'No holder data available';
+  if (topHolderPercentage > 50) {
+    return `CRITICAL: Single holder owns ${topHolderPercentage.toFixed(2)}% of supply`;
+  }
+  if (topHolderPercentage > 30) {
+    return `High centralization: Top holder owns ${topHolderPercentage.toFixed(2)}%`;
+  }
+  if (topHolderPercentage > 20) {
+    return `Moderate centralization: Top holder owns ${topHolderPercentage.toFixed(2)}%`;
+  }
+  if (top10HolderPercentage > 50) {
+    return `Top 10 holders control ${top10HolderPercentage.toFixed(2)}% of supply`;
+  }
+  return `Well-distributed: Top holder ${topHolderPercentage.toFixed(2)}%, top 10 holders ${top10HolderPercentage.toFixed(2)}%`;
+}
+
+function authorityScore(hasMintAuthority: boolean, hasFreezeAuthority: boolean): number {
+  if (hasMintAuthority && hasFreezeAuthority) return 100;
+  if (hasMintAuthority) return 70;
+  if (hasFreezeAuthority) return 60;
+  return 0;
+}
+
+function authorityDetails(hasMintAuthority: boolean, hasFreezeAuthority: boolean): string {
+  if (hasMintAuthority && hasFreezeAuthority) {
+    return 'CRITICAL: Both mint and freeze authorities are active - token can be inflated and accounts frozen';
+  }
+  if (hasMintAuthority) return 'HIGH RISK: Mint authority active - supply can be inflated at any time';
+  if (hasFreezeAuthority) return 'HIGH RISK: Freeze authority active - accounts can be frozen';
+  return 'Authorities renounced - token supply is fixed and accounts cannot be frozen';
+}
+
+function whaleScore(whaleCount: number, whalePercentage: number): number {
+  if (whaleCount === 0) return 0;
+  if (whalePercentage > 70) return 90;
+  if (whalePercentage > 50) return 70;
+  if (whalePercentage > 30) return 50;
+  return 25;
+}
+
+function whaleDetails(whaleCount: number, whalePercentage: number): string {
+  if (whaleCount === 0) return 'No whales detected (no holder > 5%)';
+  const details = `${whaleCount} whales control ${whalePercentage.toFixed(2)}% of supply`;
+  return whalePercentage > 30 ? details : `${details} - moderate risk`;
+}
+
+function liquidityScore(holderCount: number): number {
+  if (holderCount < 10) return 90;
+  if (holderCount < 50) return 60;
+  if (holderCount < 200) return 30;
+  return 10;
+}
+
+function liquidityDetails(holderCount: number): string {
+  if (holderCount < 10) return `Very low liquidity: only ${holderCount} holders`;
+  if (holderCount < 50) return `Low liquidity: ${holderCount} holders`;
+  if (holderCount < 200) return `Moderate liquidity: ${holderCount} holders`;
+  return `Good liquidity: ${holderCount} holders`;
+}
+
+const WEIGHTS = {
+  centralizedOwnership: 0.30,
+  authorityRisk: 0.35,
+  whaleConcentration: 0.25,
+  liquidityRisk: 0.10
+};
+
+function overallScore(centralized: number, authority: number, whale: number, liquidity: number): number {
+  const weightedScore =
+    centralized * WEIGHTS.centralizedOwnership +
+    authority * WEIGHTS.authorityRisk +
+    whale * WEIGHTS.whaleConcentration +
+    liquidity * WEIGHTS.liquidityRisk;
+
+  return Math.round(weightedScore);
+}
+
+/**
+ * Red flag bits (BatchScores.redFlags); built into RedFlag objects on demand
+ */
+const FLAG_OWNERSHIP_CRITICAL = 1;
+const FLAG_OWNERSHIP_HIGH = 2;
+const FLAG_MINT_AUTHORITY = 4;
+const FLAG_FREEZE_AUTHORITY = 8;
+const FLAG_WHALES = 16;
+const FLAG_LOW_LIQUIDITY = 32;
+const CRITICAL_FLAGS = FLAG_OWNERSHIP_CRITICAL | FLAG_MINT_AUTHORITY;
+
+function redFlagMask(
+  topHolderPercentage: number,
+  hasMintAuthority: boolean,
+  hasFreezeAuthority: boolean,
+  whalePercentage: number,
+  holderCount: number
+): number {
+  let mask = 0;
+  if (topHolderPercentage > 50) mask |= FLAG_OWNERSHIP_CRITICAL;
+  else if (topHolderPercentage > 30) mask |= FLAG_OWNERSHIP_HIGH;
+  if (hasMintAuthority) mask |= FLAG_MINT_AUTHORITY;
+  if (hasFreezeAuthority) mask |= FLAG_FREEZE_AUTHORITY;
+  if (whalePercentage > 50) mask |= FLAG_WHALES;
+  if (holderCount < 50) mask |= FLAG_LOW_LIQUIDITY;
+  return mask;
+}
+
+function describeRedFlags(
+  mask: number,
+  topHolderPercentage: number,
+  whaleCount: number,
+  whalePercentage: number,
+  holderCount: number
+): RedFlag[] {
+  const redFlags: RedFlag[] = [];
+
+  // Centralized ownership red flags
+  if (mask & FLAG_OWNERSHIP_CRITICAL) {
+    redFlags.push({
+      severity: 'CRITICAL',
+      category: 'Centralized Ownership',
+      description: `Single holder controls ${topHolderPercentage.toFixed(2)}% of supply`,
+      impact: 'Potential for price manipulation and regulatory classification as security'
+    });
+  } else if (mask & FLAG_OWNERSHIP_HIGH) {
+    redFlags.push({
+      severity: 'HIGH',
+      category: 'Centralized Ownership',
+      description: `Top holder owns ${topHolderPercentage.toFixed(2)}% of supply`,
+      impact: 'May indicate centralized control and regulatory scrutiny'
+    });
+  }
+
+  // Authority red flags
+  if (mask & FLAG_MINT_AUTHORITY) {
+    redFlags.push({
+      severity: 'CRITICAL',
+      category: 'Mint Authority',
+      description: 'Mint authority is not renounced',
+      impact: 'Supply can be inflated at any time, undermining scarcity and value'
+    });
+  }
+
+  if (mask & FLAG_FREEZE_AUTHORITY) {
+    redFlags.push({
+      severity: 'HIGH',
+      category: 'Freeze Authority',
+      description: 'Freeze authority is not renounced',
+      impact: 'Token accounts can be frozen, preventing transfers'
+    });
+  }
+
+  // Whale concentration red flags
+  if (mask & FLAG_WHALES) {
+    redFlags.push({
+      severity: 'HIGH',
+      category: 'Whale Concentration',
+      description: `${whaleCount} whales control ${whalePercentage.toFixed(2)}% of supply`,
+      impact: 'High risk of coordinated market manipulation'
+    });
+  }
+
+  // Liquidity red flags
+  if (mask & FLAG_LOW_LIQUIDITY) {
+    redFlags.push({
+      severity: 'MEDIUM',
+      category: 'Low Liquidity',
+      description: `Only ${holderCount} token holders`,
+      impact: 'Low liquidity may result in high slippage and difficulty exiting positions'
+    });
+  }
+
+  return redFlags;
+}
+
+function buildRecommendations(
+  hasMintAuthority: boolean,
+  hasFreezeAuthority: boolean,
+  topHolderPercentage: number,
+  whalePercentage: number,
+  liquidityRiskScore: number,
+  hasCriticalFlag: boolean
+): string[] {
+  const recommendations: string[] = [];
+
+  // Authority recommendations
+  if (hasMintAuthority) {
+    recommendations.push('🔑 Renounce mint authority to fix total supply and improve trust');
+  }
+  if (hasFreezeAuthority) {
+    recommendations.push('🔑 Renounce freeze authority to prevent account freezing');
+  }
+
+  // Centralization recommendations
+  if (topHolderPercentage > 30) {
+    recommendations.push('📊 Improve token distribution to reduce centralization risk');
+    recommendations.push('🔄 Consider vesting schedules or airdrops to increase holder diversity');
+  }
+
+  // Whale recommendations
+  if (whalePercentage > 50) {
+    recommendations.push('🐋 Encourage whale holders to diversify or implement anti-whale mechanisms');
+  }
+
+  // Liquidity recommendations
+  if (liquidityRiskScore > 50) {
+    recommendations.push('💧 Increase liquidity by adding to DEX pools or increasing holder count');
+  }
+
+  // Compliance recommendations
+  if (hasCriticalFlag) {
+    recommendations.push('⚖️ Consult with legal counsel regarding Japan PSA/FIEA compliance');
+    recommendations.push('📋 Consider registration with Japanese Financial Services Agency if classified as security');
+  }
+
+  return recommendations;
+}
+
+// Classification codes, as stored in BatchScores (index into CLASSIFICATIONS)
+const CLASS_UNKNOWN = 0;
+const CLASS_UTILITY = 1;
+const CLASS_GOVERNANCE = 2;
+const CLASS_SECURITY = 3;
+
+const CLASSIFICATIONS = [
+  TokenClassification.UNKNOWN,
+  TokenClassification.UTILITY_TOKEN,
+  TokenClassification.GOVERNANCE_TOKEN,
+  TokenClassification.SECURITY_TOKEN,
+  TokenClassification.PAYMENT_TOKEN
+];
+
+/**
+ * Classification code of a token (see CLASSIFICATIONS)
+ */
+function classify(
+  topHolderPercentage: number,
+  hasActiveAuthorities: boolean,
+  centralizationRiskScore: number,
+  governanceHint: boolean
+): number {
+  // If highly centralized with active authorities, likely a security
+  if (topHolderPercentage > 30 && hasActiveAuthorities) {
+    return CLASS_SECURITY;
+  }
+
+  // Metadata hints (see hasGovernanceHint)
+  if (governanceHint) {
+    return CLASS_GOVERNANCE;
+  }
+
+  // Default to utility if well-distributed
+  if (centralizationRiskScore < 50 && !hasActiveAuthorities) {
+    return CLASS_UTILITY;
+  }
+
+  // Otherwise unknown
+  return CLASS_UNKNOWN;
+}
+
+function riskLevel(score: number): 'LOW' | 'MEDIUM' | 'HIGH' | 'CRITICAL' {
+  if (score < 25) return 'LOW';
+  if (score < 50) return 'MEDIUM';
+  if (score < 75) return 'HIGH';
+  return 'CRITICAL';
+}
+
+/**
+ * Scores for a TokenBatch, one typed-array column per factor. Detail strings,
+ * red flags and recommendations are built per token only when requested.
+ */
+export class BatchScores {
+  constructor(
+    public readonly batch: TokenBatch,
+    public readonly centralizedOwnership: Uint8Array,
+    public readonly authorityRisk: Uint8Array,
+    public readonly whaleConcentration: Uint8Array,
+    public readonly liquidityRisk: Uint8Array,
+    public readonly overall: Uint8Array,
+    public readonly redFlagMasks: Uint8Array,
+    private classificationCodes: Uint8Array
+  ) {}
+
+  get length(): number {
+    return this.overall.length;
+  }
+
+  riskLevel(i: number): 'LOW' | 'MEDIUM' | 'HIGH' | 'CRITICAL' {
+    return riskLevel(this.overall[i]);
+  }
+
+  classification(i: number): TokenClassification {
+    return CLASSIFICATIONS[this.classificationCodes[i]];
+  }
+
+  /**
+   * Whether token i has a CRITICAL red flag (without building the flags)
+   */
+  hasCriticalFlag(i: number): boolean {
+    return (this.redFlagMasks[i] & CRITICAL_FLAGS) !== 0;
+  }
+
+  riskFactors(i: number): RiskFactors {
+    const { batch } = this;
+    const hasMintAuthority = (batch.authorities[i] & MINT_AUTHORITY) !== 0;
+    const hasFreezeAuthority = (batch.authorities[i] & FREEZE_AUTHORITY) !== 0;
+    const count = batch.summarizedCounts[i];
+
+    return {
+      centralizedOwnership: {
+        score: this.centralizedOwnership[i],
+        details: centralizationDetails(count, batch.topHolderPercentages[i], batch.top10HolderPercentages[i]),
+        topHolderPercentage: count > 0 ? batch.topHolderPercentages[i] : 0,
+        top10HolderPercentage: count > 0 ? batch.top10HolderPercentages[i] : 0
+      },
+      authorityRisk: {
+        score: this.authorityRisk[i],
+        details: authorityDetails(hasMintAuthority, hasFreezeAuthority),
+        hasMintAuthority,
+        hasFreezeAuthority
+      },
+      whaleConcentration: {
+        score: this.whaleConcentration[i],
+        details: whaleDetails(batch.whaleCounts[i], batch.whalePercentages[i]),
+        whaleCount: batch.whaleCounts[i],
+        whalePercentage: batch.whalePercentages[i]
+      },
+      liquidityRisk: {
+        score: this.liquidityRisk[i],
+        details: liquidityDetails(batch.holderCounts[i])
+      }
+    };
+  }
+
+  redFlags(i: number): RedFlag[] {
+    const { batch } = this;
+    return describeRedFlags(
+      this.redFlagMasks[i],
+      batch.topHolderPercentages[i],
+      batch.whaleCounts[i],
+      batch.whalePercentages[i],
+      batch.holderCounts[i]
+    );
+  }
+
+  recommendations(i: number): string[] {
+    const { batch } = this;
+    return buildRecommendations(
+      (batch.authorities[i] & MINT_AUTHORITY) !== 0,
+      (batch.authorities[i] & FREEZE_AUTHORITY) !== 0,
+      batch.topHolderPercentages[i],
+      batch.whalePercentages[i],
+      this.liquidityRisk[i],
+      this.hasCriticalFlag(i)
+    );
+  }
+}
 
 export class RiskScorer {
+  // One pass over the holders per token, shared by every factor
+  private summaries = new WeakMap<TokenData, HolderSummary>();
+
+  /**
+   * Holder aggregates for a token, computed once in a single pass
+   */
+  public summarizeHolders(tokenData: TokenData): HolderSummary {
+    if (tokenData.holderSummary) return tokenData.holderSummary;
+
+    let summary = this.summaries.get(tokenData);
+    if (!summary) {
+      const holderSet = tokenData.holderSet ?? HolderSet.from(tokenData.holders);
+      summary = holderSet.summarize(WHALE_THRESHOLD);
+      this.summaries.set(tokenData, summary);
+    }
+    return summary;
+  }
+
+  /**
+   * Total holder count, preferring the full count over the listed holders
+   */
+  private holderCount(tokenData: TokenData): number {
+    return tokenData.holderCount ?? this.summarizeHolders(tokenData).count;
+  }
+
   /**
    * Calculate overall risk score (0-100)
    * 0 = Lowest risk (most compliant)
    * 100 = Highest risk (least compliant)
    */
   public calculateOverallRisk(riskFactors: RiskFactors): number {
-    const weights = {
-      centralizedOwnership: 0.30,
-      authorityRisk: 0.35,
-      whaleConcentration: 0.25,
-      liquidityRisk: 0.10
-    };
-
-    const weightedScore = 
-      riskFactors.centralizedOwnership.score * weights.centralizedOwnership +
-      riskFactors.authorityRisk.score * weights.authorityRisk +
-      riskFactors.whaleConcentration.score * weights.whaleConcentration +
-      riskFactors.liquidityRisk.score * weights.liquidityRisk;
-
-    return Math.round(weightedScore);
+    return overallScore(
+      riskFactors.centralizedOwnership.score,
+      riskFactors.authorityRisk.score,
+      riskFactors.whaleConcentration.score,
+      riskFactors.liquidityRisk.score
+    );
   }
 
   /**
    * Determine risk level from score
    */
   public getRiskLevel(score: number): 'LOW' | 'MEDIUM' | 'HIGH' | 'CRITICAL' {
-    if (score < 25) return 'LOW';
-    if (score < 50) return 'MEDIUM';
-    if (score < 75) return 'HIGH';
-    return 'CRITICAL';
+    return riskLevel(score);
   }
 
   /**
    * Analyze centralized ownership risk
    */
   public analyzeCentralizedOwnership(tokenData: TokenData): RiskFactors['centralizedOwnership'] {
-    const holders = tokenData.holders;
-    
-    if (holders.length === 0) {
-      return {
-        score: 100,
-        details: 'No holder data available',
-        topHolderPercentage: 0,
-        top10HolderPercentage: 0
-      };
-    }
-
-    // Sort by percentage descending
-    const sortedHolders = [...holders].sort((a, b) => b.percentage - a.percentage);
-    
-    const topHolderPercentage = sortedHolders[0]?.percentage || 0;
-    const top10HolderPercentage = sortedHolders
-      .slice(0, 10)
-      .reduce((sum, h) => sum + h.percentage, 0);
-
-    let score = 0;
-    let details = '';
-
-    // Single holder > 50% is critical
-    if (topHolderPercentage > 50) {
-      score = 100;
-      details = `CRITICAL: Single holder owns ${topHolderPercentage.toFixed(2)}% of supply`;
-    } else if (topHolderPercentage > 30) {
-      score = 75;
-      details = `High centralization: Top holder owns ${topHolderPercentage.toFixed(2)}%`;
-    } else if (topHolderPercentage > 20) {
-      score = 50;
-      details = `Moderate centralization: Top holder owns ${topHolderPercentage.toFixed(2)}%`;
-    } else if (top10HolderPercentage > 70) {
-      score = 60;
-      details = `Top 10 holders control ${top10HolderPercentage.toFixed(2)}% of supply`;
-    } else if (top10HolderPercentage > 50) {
-      score = 40;
-      details = `Top 10 holders control ${top10HolderPercentage.toFixed(2)}% of supply`;
-    } else {
-      score = 20;
-      details = `Well-distributed: Top holder ${topHolderPercentage.toFixed(2)}%, top 10 holders ${top10HolderPercentage.toFixed(2)}%`;
-    }
+    const { count, topHolderPercentage, top10HolderPercentage } = this.summarizeHolders(tokenData);
 
     return {
-      score,
-      details,
-      topHolderPercentage,
-      top10HolderPercentage
+      score: centralizationScore(count, topHolderPercentage, top10HolderPercentage),
+      details: centralizationDetails(count, topHolderPercentage, top10HolderPercentage),
+      topHolderPercentage: count > 0 ? topHolderPercentage : 0,
+      top10HolderPercentage: count > 0 ? top10HolderPercentage : 0
     };
   }
 
@@ -100,26 +454,9 @@ export class RiskScorer {
     const hasMintAuthority = tokenData.mintAuthority !== null;
     const hasFreezeAuthority = tokenData.freezeAuthority !== null;
 
-    let score = 0;
-    let details = '';
-
-    if (hasMintAuthority && hasFreezeAuthority) {
-      score = 100;
-      details = 'CRITICAL: Both mint and freeze authorities are active - token can be inflated and accounts frozen';
-    } else if (hasMintAuthority) {
-      score = 70;
-      details = 'HIGH RISK: Mint authority active - supply can be inflated at any time';
-    } else if (hasFreezeAuthority) {
-      score = 60;
-      details = 'HIGH RISK: Freeze authority active - accounts can be frozen';
-    } else {
-      score = 0;
-      details = 'Authorities renounced - token supply is fixed and accounts cannot be frozen';
-    }
-
     return {
-      score,
-      details,
+      score: authorityScore(hasMintAuthority, hasFreezeAuthority),
+      details: authorityDetails(hasMintAuthority, hasFreezeAuthority),
       hasMintAuthority,
       hasFreezeAuthority
     };
@@ -130,35 +467,12 @@ export class RiskScorer {
    * A "whale" is defined as holding > 5% of supply
    */
   public analyzeWhaleConcentration(tokenData: TokenData): RiskFactors['whaleConcentration'] {
-    const WHALE_THRESHOLD = 5.0; // 5% of supply
-    
-    const whales = tokenData.holders.filter(h => h.percentage > WHALE_THRESHOLD);
-    const whalePercentage = whales.reduce((sum, h) => sum + h.percentage, 0);
-
-    let score = 0;
-    let details = '';
-
-    if (whales.length === 0) {
-      score = 0;
-      details = 'No whales detected (no holder > 5%)';
-    } else if (whalePercentage > 70) {
-      score = 90;
-      details = `${whales.length} whales control ${whalePercentage.toFixed(2)}% of supply`;
-    } else if (whalePercentage > 50) {
-      score = 70;
-      details = `${whales.length} whales control ${whalePercentage.toFixed(2)}% of supply`;
-    } else if (whalePercentage > 30) {
-      score = 50;
-      details = `${whales.length} whales control ${whalePercentage.toFixed(2)}% of supply`;
-    } else {
-      score = 25;
-      details = `${whales.length} whales control ${whalePercentage.toFixed(2)}% of supply - moderate risk`;
-    }
+    const { whaleCount, whalePercentage } = this.summarizeHolders(tokenData);
 
     return {
-      score,
-      details,
-      whaleCount: whales.length,
+      score: whaleScore(whaleCount, whalePercentage),
+      details: whaleDetails(whaleCount, whalePercentage),
+      whaleCount,
       whalePercentage
     };
   }
@@ -168,28 +482,11 @@ export class RiskScorer {
    * Based on number of holders and distribution
    */
   public analyzeLiquidityRisk(tokenData: TokenData): RiskFactors['liquidityRisk'] {
-    const holderCount = tokenData.holders.length;
-
-    let score = 0;
-    let details = '';
-
-    if (holderCount < 10) {
-      score = 90;
-      details = `Very low liquidity: only ${holderCount} holders`;
-    } else if (holderCount < 50) {
-      score = 60;
-      details = `Low liquidity: ${holderCount} holders`;
-    } else if (holderCount < 200) {
-      score = 30;
-      details = `Moderate liquidity: ${holderCount} holders`;
-    } else {
-      score = 10;
-      details = `Good liquidity: ${holderCount} holders`;
-    }
+    const holderCount = this.holderCount(tokenData);
 
     return {
-      score,
-      details
+      score: liquidityScore(holderCount),
+      details: liquidityDetails(holderCount)
     };
   }
 
@@ -197,134 +494,100 @@ export class RiskScorer {
    * Identify red flags based on risk factors
    */
   public identifyRedFlags(riskFactors: RiskFactors, tokenData: TokenData): RedFlag[] {
-    const redFlags: RedFlag[] = [];
-
-    // Centralized ownership red flags
-    if (riskFactors.centralizedOwnership.topHolderPercentage > 50) {
-      redFlags.push({
-        severity: 'CRITICAL',
-        category: 'Centralized Ownership',
-        description: `Single holder controls ${riskFactors.centralizedOwnership.topHolderPercentage.toFixed(2)}% of supply`,
-        impact: 'Potential for price manipulation and regulatory classification as security'
-      });
-    } else if (riskFactors.centralizedOwnership.topHolderPercentage > 30) {
-      redFlags.push({
-        severity: 'HIGH',
-        category: 'Centralized Ownership',
-        description: `Top holder owns ${riskFactors.centralizedOwnership.topHolderPercentage.toFixed(2)}% of supply`,
-        impact: 'May indicate centralized control and regulatory scrutiny'
-      });
-    }
-
-    // Authority red flags
-    if (riskFactors.authorityRisk.hasMintAuthority) {
-      redFlags.push({
-        severity: 'CRITICAL',
-        category: 'Mint Authority',
-        description: 'Mint authority is not renounced',
-        impact: 'Supply can be inflated at any time, undermining scarcity and value'
-      });
-    }
-
-    if (riskFactors.authorityRisk.hasFreezeAuthority) {
-      redFlags.push({
-        severity: 'HIGH',
-        category: 'Freeze Authority',
-        description: 'Freeze authority is not renounced',
-        impact: 'Token accounts can be frozen, preventing transfers'
-      });
-    }
-
-    // Whale concentration red flags
-    if (riskFactors.whaleConcentration.whalePercentage > 50) {
-      redFlags.push({
-        severity: 'HIGH',
-        category: 'Whale Concentration',
-        description: `${riskFactors.whaleConcentration.whaleCount} whales control ${riskFactors.whaleConcentration.whalePercentage.toFixed(2)}% of supply`,
-        impact: 'High risk of coordinated market manipulation'
-      });
-    }
-
-    // Liquidity red flags
-    if (tokenData.holders.length < 50) {
-      redFlags.push({
-        severity: 'MEDIUM',
-        category: 'Low Liquidity',
-        description: `Only ${tokenData.holders.length} token holders`,
-        impact: 'Low liquidity may result in high slippage and difficulty exiting positions'
-      });
-    }
+    const { topHolderPercentage } = riskFactors.centralizedOwnership;
+    const { hasMintAuthority, hasFreezeAuthority } = riskFactors.authorityRisk;
+    const { whaleCount, whalePercentage } = riskFactors.whaleConcentration;
+    const holderCount = this.holderCount(tokenData);
 
-    return redFlags;
+    return describeRedFlags(
+      redFlagMask(topHolderPercentage, hasMintAuthority, hasFreezeAuthority, whalePercentage, holderCount),
+      topHolderPercentage,
+      whaleCount,
+      whalePercentage,
+      holderCount
+    );
   }
 
   /**
    * Infer token classification based on characteristics
    */
   public inferTokenClassification(tokenData: TokenData, riskFactors: RiskFactors): TokenClassification {
-    // Security token indicators
-    const hasHighCentralization = riskFactors.centralizedOwnership.topHolderPercentage > 30;
-    const hasActiveAuthorities = riskFactors.authorityRisk.hasMintAuthority || 
-                                  riskFactors.authorityRisk.hasFreezeAuthority;
-    
-    // If highly centralized with active authorities, likely a security
-    if (hasHighCentralization && hasActiveAuthorities) {
-      return TokenClassification.SECURITY_TOKEN;
-    }
-
-    // Check metadata for hints
-    const name = tokenData.name?.toLowerCase() || '';
-    const symbol = tokenData.symbol?.toLowerCase() || '';
-
-    if (name.includes('governance') || symbol.includes('gov')) {
-      return TokenClassification.GOVERNANCE_TOKEN;
-    }
-
-    // Default to utility if well-distributed
-    if (riskFactors.centralizedOwnership.score < 50 && !hasActiveAuthorities) {
-      return TokenClassification.UTILITY_TOKEN;
-    }
-
-    // Otherwise unknown
-    return TokenClassification.UNKNOWN;
+    return CLASSIFICATIONS[classify(
+      riskFactors.centralizedOwnership.topHolderPercentage,
+      riskFactors.authorityRisk.hasMintAuthority || riskFactors.authorityRisk.hasFreezeAuthority,
+      riskFactors.centralizedOwnership.score,
+      hasGovernanceHint(tokenData.name, tokenData.symbol)
+    )];
   }
 
   /**
    * Generate recommendations based on risk factors
    */
   public generateRecommendations(riskFactors: RiskFactors, redFlags: RedFlag[]): string[] {
-    const recommendations: string[] = [];
-
-    // Authority recommendations
-    if (riskFactors.authorityRisk.hasMintAuthority) {
-      recommendations.push('🔑 Renounce mint authority to fix total supply and improve trust');
-    }
-    if (riskFactors.authorityRisk.hasFreezeAuthority) {
-      recommendations.push('🔑 Renounce freeze authority to prevent account freezing');
-    }
-
-    // Centralization recommendations
-    if (riskFactors.centralizedOwnership.topHolderPercentage > 30) {
-      recommendations.push('📊 Improve token distribution to reduce centralization risk');
-      recommendations.push('🔄 Consider vesting schedules or airdrops to increase holder diversity');
-    }
-
-    // Whale recommendations
-    if (riskFactors.whaleConcentration.whalePercentage > 50) {
-      recommendations.push('🐋 Encourage whale holders to diversify or implement anti-whale mechanisms');
-    }
+    return buildRecommendations(
+      riskFactors.authorityRisk.hasMintAuthority,
+      riskFactors.authorityRisk.hasFreezeAuthority,
+      riskFactors.centralizedOwnership.topHolderPercentage,
+      riskFactors.whaleConcentration.whalePercentage,
+      riskFactors.liquidityRisk.score,
+      redFlags.some(f => f.severity === 'CRITICAL')
+    );
+  }
 
-    // Liquidity recommendations
-    if (riskFactors.liquidityRisk.score > 50) {
-      recommendations.push('💧 Increase liquidity by adding to DEX pools or increasing holder count');
+  /**
+   * Columnar batch of tokens for scoreBatch, summarizing each token's holders
+   */
+  public toBatch(tokens: TokenData[]): TokenBatch {
+    const batch = new TokenBatch(tokens.length);
+    for (const tokenData of tokens) {
+      batch.add(tokenData, this.summarizeHolders(tokenData));
     }
+    return batch;
+  }
 
-    // Compliance recommendations
-    if (redFlags.some(f => f.severity === 'CRITICAL')) {
-      recommendations.push('⚖️ Consult with legal counsel regarding Japan PSA/FIEA compliance');
-      recommendations.push('📋 Consider registration with Japanese Financial Services Agency if classified as security');
+  /**
+   * Score many tokens at once: every factor, the weighted total, red flags
+   * and classification in one loop over typed arrays, with no strings built.
+   * Scores match the per-token analyzers; use BatchScores.riskFactors(i),
+   * redFlags(i) and recommendations(i) for the text of the tokens reported.
+   */
+  public scoreBatch(input: TokenBatch | TokenData[]): BatchScores {
+    const batch = Array.isArray(input) ? this.toBatch(input) : input;
+    const n = batch.length;
+    const centralized = new Uint8Array(n);
+    const authority = new Uint8Array(n);
+    const whale = new Uint8Array(n);
+    const liquidity = new Uint8Array(n);
+    const overall = new Uint8Array(n);
+    const flags = new Uint8Array(n);
+    const classifications = new Uint8Array(n);
+
+    const {
+      summarizedCounts,
+      holderCounts,
+      topHolderPercentages,
+      top10HolderPercentages,
+      whaleCounts,
+      whalePercentages,
+      authorities,
+      hints
+    } = batch;
+
+    for (let i = 0; i < n; i++) {
+      const top = summarizedCounts[i] > 0 ? topHolderPercentages[i] : 0;
+      const hasMintAuthority = (authorities[i] & MINT_AUTHORITY) !== 0;
+      const hasFreezeAuthority = (authorities[i] & FREEZE_AUTHORITY) !== 0;
+
+      centralized[i] = centralizationScore(summarizedCounts[i], top, top10HolderPercentages[i]);
+      authority[i] = authorityScore(hasMintAuthority, hasFreezeAuthority);
+      whale[i] = whaleScore(whaleCounts[i], whalePercentages[i]);
+      liquidity[i] = liquidityScore(holderCounts[i]);
+      overall[i] = overallScore(centralized[i], authority[i], whale[i], liquidity[i]);
+      flags[i] = redFlagMask(top, hasMintAuthority, hasFreezeAuthority, whalePercentages[i], holderCounts[i]);
+
+      classifications[i] = classify(top, authorities[i] !== 0, centralized[i], (hints[i] & GOVERNANCE_HINT) !== 0);
     }
 
-    return recommendations;
+    return new BatchScores(batch, centralized, authority, whale, liquidity, overall, flags, classifications);
   }
 }
@@ -0,0 +1,152 @@
+/**
+ * Re-audit Scheduler
+ * One Redis sorted set of mint -> next audit time (ms) shared by every
+ * process. Each tick atomically claims the due mints and enqueues them in
+ * bulk, so a watchlist of 100k tokens costs one timer, not 100k repeatable jobs.
+ */
+
+import type { Queue } from 'bull';
+
+/**
+ * Atomically take up to ARGV[2] members due by ARGV[1] and push their score
+ * to ARGV[3] (the lease), so concurrent schedulers never claim the same mint
+ * and a claimed mint whose audit never completes comes due again
+ */
+const CLAIM_DUE_SCRIPT = `
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+  redis.call('ZADD', KEYS[1], ARGV[3], member)
+end
+return due
+`;
+
+export interface AuditSchedulerConfig {
+  key: string; // sorted set of mint -> due time; priorities live in `${key}:priority`
+  tickMs: number; // how often due audits are collected (default: 5000)
+  batchSize: number; // max audits enqueued per tick (default: 1000)
+  leaseMs: number; // retry delay for claimed audits that never reschedule (default: 1 hour)
+  jitter: number; // fraction of the interval added at random to each due time (default: 0.1)
+}
+
+type Enqueue = (tokenAddresses: string[], priority: number) => Promise<unknown>;
+
+export class AuditScheduler {
+  private config: AuditSchedulerConfig;
+  private timer?: NodeJS.Timeout;
+  private ticking = false;
+
+  constructor(
+    private redis: Queue['client'],
+    private enqueue: Enqueue,
+    config?: Partial<AuditSchedulerConfig>
+  ) {
+    this.config = {
+      key: config?.key || 'audit-schedule',
+      tickMs: config?.tickMs || 5000,
+      batchSize: config?.batchSize || 1000,
+      leaseMs: config?.leaseMs || 60 * 60 * 1000,
+      jitter: config?.jitter ?? 0.1
+    };
+  }
+
+  /**
+   * Schedule (or reschedule) a mint's next audit. `intervalMs` is the period
+   * the due time was derived from; up to `jitter` of it is added at random so
+   * tokens audited together don't all come due together.
+   */
+  public async schedule(
+    tokenAddress: string,
+    dueAt: number,
+    intervalMs: number,
+    priority: number = 0
+  ): Promise<void> {
+    const score = Math.round(dueAt + Math.random() * this.config.jitter * intervalMs);
+    await this.redis
+      .multi()
+      .zadd(this.config.key, score, tokenAddress)
+      .hset(`${this.config.key}:priority`, tokenAddress, priority)
+      .exec();
+  }
+
+  public async unschedule(tokenAddress: string): Promise<void> {
+    await this.redis
+      .multi()
+      .zrem(this.config.key, tokenAddress)
+      .hdel(`${this.config.key}:priority`, tokenAddress)
+      .exec();
+  }
+
+  /**
+   * Next due time of a mint, or null if it isn't scheduled
+   */
+  public async getDueAt(tokenAddress: string): Promise<number | null> {
+    const score = await this.redis.zscore(this.config.key, tokenAddress);
+    return score === null ? null : Number(score);
+  }
+
+  public async count(): Promise<number> {
+    return this.redis.zcard(this.config.key);
+  }
+
+  /**
+   * Claim and enqueue due audits, grouped by priority. Returns how many
+   * were claimed.
+   */
+  public async tick(now: number = Date.now()): Promise<number> {
+    const due = (await this.redis.eval(
+      CLAIM_DUE_SCRIPT,
+      1,
+      this.config.key,
+      now,
+      this.config.batchSize,
+      now + this.config.leaseMs
+    )) as string[];
+    if (due.length === 0) return 0;
+
+    const priorities = await this.redis.hmget(`${this.config.key}:priority`, ...due);
+    const byPriority = new Map<number, string[]>();
+    due.forEach((tokenAddress, i) => {
+      const priority = Number(priorities[i]) || 0;
+      const group = byPriority.get(priority);
+      if (group) {
+        group.push(tokenAddress);
+      } else {
+        byPriority.set(priority, [tokenAddress]);
+      }
+    });
+
+    for (const [priority, tokenAddresses] of byPriority) {
+      await this.enqueue(tokenAddresses, priority);
+    }
+    return due.length;
+  }
+
+  /**
+   * Tick every `tickMs`; a full batch ticks again immediately to drain backlog
+   */
+  public start(): void {
+    if (this.timer) return;
+
+    const run = async () => {
+      if (this.ticking) return;
+      this.ticking = true;
+      try {
+        while ((await this.tick()) === this.config.batchSize) {
+          // Keep draining
+        }
+      } catch (error) {
+        console.error('⚠️ Audit scheduler tick failed:', error instanceof Error ? error.message : error);
+      } finally {
+        this.ticking = false;
+      }
+    };
+
+    this.timer = setInterval(run, this.config.tickMs);
+    this.timer.unref();
+  }
+
+  public stop(): void {
+    clearInterval(this.timer);
+    this.timer = undefined;
+  }
+}
@@ -5,7 +5,14 @@
 
 import { ComplianceAuditor } from './auditor.js';
 import { AuditQueue, createAuditQueue } from './queue.js';
-import { TokenData, TokenClassification } from './types.js';
+import { TokenData, TokenClassification, AuditReport, AuditProgress } from './types.js';
+import { RiskScorer, BatchScores } from './risk-scorer.js';
+import { HolderSet } from './holder-set.js';
+import { ToriiClient, CircuitOpenError } from './torii-client.js';
+import { encodeReport, decodeReport } from './report-codec.js';
+import { mapAnalysisToTokenData } from './token-mapper.js';
+import { TokenAnalyzer, PublicKey, TOKEN_PROGRAM_ID } from '../solana-fetcher/index.js';
+import http from 'node:http';
 
 /**
  * Mock token data for testing
@@ -108,6 +115,188 @@ async function testSingleAudit(auditor: ComplianceAuditor, tokenKey: string): Pr
   }
 }
 
+/**
+ * Test columnar holder scoring matches object scoring and scales to 1M holders
+ */
+function testHolderSet(): void {
+  console.log('\n' + '='.repeat(60));
+  console.log('Testing Columnar Holder Scoring');
+  console.log('='.repeat(60));
+
+  const scorer = new RiskScorer();
+  for (const [tokenKey, tokenData] of Object.entries(mockTokens)) {
+    const fromObjects = scorer.analyzeCentralizedOwnership(tokenData);
+    const fromSet = new RiskScorer().analyzeCentralizedOwnership({
+      ...tokenData,
+      holderSet: HolderSet.from(tokenData.holders)
+    });
+    const match = fromObjects.score === fromSet.score &&
+      fromObjects.top10HolderPercentage === fromSet.top10HolderPercentage;
+    console.log(`   ${match ? '✅' : '❌'} ${tokenKey}: top10 ${fromSet.top10HolderPercentage.toFixed(2)}%`);
+  }
+
+  const count = 1_000_000;
+  const holderSet = new HolderSet(count);
+  for (let i = 0; i < count; i++) {
+    holderSet.add(`Holder${i}`, count - i, (count - i) / (count * (count + 1) / 2) * 100);
+  }
+  const tokenData: TokenData = { ...mockTokens.safeToken, holders: [], holderSet };
+
+  const start = performance.now();
+  const riskFactors = {
+    centralizedOwnership: scorer.analyzeCentralizedOwnership(tokenData),
+    authorityRisk: scorer.analyzeAuthorityRisk(tokenData),
+    whaleConcentration: scorer.analyzeWhaleConcentration(tokenData),
+    liquidityRisk: scorer.analyzeLiquidityRisk(tokenData)
+  };
+  scorer.identifyRedFlags(riskFactors, tokenData);
+  console.log(`   ✅ Scored ${count.toLocaleString()} holders in ${(performance.now() - start).toFixed(1)}ms`);
+}
+
+/**
+ * Whether token i of a batch scored like the per-token analyzers score it
+ */
+function matchesAnalyzers(scorer: RiskScorer, scores: BatchScores, tokenData: TokenData, i: number): boolean {
+  const riskFactors = {
+    centralizedOwnership: scorer.analyzeCentralizedOwnership(tokenData),
+    authorityRisk: scorer.analyzeAuthorityRisk(tokenData),
+    whaleConcentration: scorer.analyzeWhaleConcentration(tokenData),
+    liquidityRisk: scorer.analyzeLiquidityRisk(tokenData)
+  };
+  const redFlags = scorer.identifyRedFlags(riskFactors, tokenData);
+  return scores.overall[i] === scorer.calculateOverallRisk(riskFactors) &&
+    scores.classification(i) === scorer.inferTokenClassification(tokenData, riskFactors) &&
+    JSON.stringify(scores.redFlags(i)) === JSON.stringify(redFlags) &&
+    JSON.stringify(scores.recommendations(i)) === JSON.stringify(scorer.generateRecommendations(riskFactors, redFlags));
+}
+
+/**
+ * Deterministic random token: holder counts, concentration, authorities and
+ * governance hints all vary (seeded, so failures reproduce)
+ */
+function randomToken(seed: number): TokenData {
+  let state = seed * 2654435761 + 1;
+  const next = (): number => {
+    state = Math.imul(state ^ (state >>> 15), 2246822519) + 0x6d2b79f5;
+    return ((state ^ (state >>> 13)) >>> 0) / 4294967296;
+  };
+
+  const supply = 1 + Math.floor(next() * 1e9);
+  // Skew varies per token, from a few whales past every threshold to an even spread
+  const skew = 1 + next() * 12;
+  const scale = next() < 0.5 ? 1 : 0.05;
+  const holders = Array.from({ length: Math.floor(next() * 150) }, (_, i) => {
+    const balance = Math.floor(supply * scale * next() ** skew);
+    return { address: `Holder${i}`.padEnd(44, '1'), balance, percentage: (balance / supply) * 100 };
+  });
+
+  return {
+    address: `Random${seed}`.padEnd(44, '1'),
+    name: next() < 0.1 ? 'Random Governance Token' : 'Random Token',
+    symbol: next() < 0.1 ? 'RGOV' : 'RND',
+    supply,
+    decimals: 9,
+    mintAuthority: next() < 0.3 ? 'Auth1111111111111111111111111111111111111' : null,
+    freezeAuthority: next() < 0.3 ? 'Auth1111111111111111111111111111111111111' : null,
+    holders,
+    holderCount: next() < 0.3 ? holders.length + Math.floor(next() * 5000) : undefined
+  };
+}
+
+/**
+ * Test batch scoring matches per-token scoring (on the mock tokens and 20k
+ * random ones) and scales to 50k tokens
+ */
+function testScoreBatch(): void {
+  console.log('\n' + '='.repeat(60));
+  console.log('Testing Batch Scoring');
+  console.log('='.repeat(60));
+
+  const scorer = new RiskScorer();
+  const tokens = Object.values(mockTokens);
+  const scores = scorer.scoreBatch(tokens);
+  tokens.forEach((tokenData, i) => {
+    const match = matchesAnalyzers(scorer, scores, tokenData, i);
+    console.log(`   ${match ? '✅' : '❌'} ${tokenData.symbol}: ${scores.overall[i]}/100 ${scores.riskLevel(i)}`);
+  });
+
+  // Random tokens reach the thresholds the mock tokens don't
+  const random = Array.from({ length: 20_000 }, (_, i) => randomToken(i));
+  const randomScores = scorer.scoreBatch(random);
+  const mismatches = random.filter((tokenData, i) => !matchesAnalyzers(scorer, randomScores, tokenData, i)).length;
+  console.log(`   ${mismatches === 0 ? '✅' : '❌'} ${random.length.toLocaleString()} random tokens: ${mismatches} differ from the per-token analyzers`);
+
+  const count = 50_000;
+  const sweep = Array.from({ length: count }, (_, i) => tokens[i % tokens.length]);
+  const batch = scorer.toBatch(sweep);
+  const start = performance.now();
+  const sweepScores = scorer.scoreBatch(batch);
+  let critical = 0;
+  for (let i = 0; i < sweepScores.length; i++) {
+    if (sweepScores.hasCriticalFlag(i)) critical++;
+  }
+  console.log(`   ✅ Scored ${count.toLocaleString()} tokens in ${(performance.now() - start).toFixed(1)}ms (${critical.toLocaleString()} with critical flags)`);
+}
+
+/**
+ * Test the binary report encoding round-trips and compare it with JSON
+ */
+async function testReportCodec(): Promise<void> {
+  console.log('\n' + '='.repeat(60));
+  console.log('Testing Report Encoding');
+  console.log('='.repeat(60));
+
+  const auditor = new ComplianceAuditor('', { mode: 'embedded' });
+  const reports: AuditReport[] = [];
+  for (const tokenData of Object.values(mockTokens)) {
+    const result = await auditor.auditToken({ ...tokenData, description: 'Governance token with staking rewards' });
+    if (result.report) reports.push(result.report);
+  }
+
+  let binaryBytes = 0;
+  let jsonBytes = 0;
+  for (const report of reports) {
+    const encoded = encodeReport(report);
+    const json = JSON.stringify(report);
+    binaryBytes += encoded.length;
+    jsonBytes += Buffer.byteLength(json);
+    const match = JSON.stringify(decodeReport(encoded)) === json;
+    console.log(`   ${match ? '✅' : '❌'} ${report.tokenSymbol}: ${encoded.length} bytes (JSON ${Buffer.byteLength(json)})`);
+  }
+  console.log(`   📦 ${(jsonBytes / binaryBytes).toFixed(1)}x smaller than JSON`);
+
+  const rounds = 20_000;
+  const encoded = reports.map(encodeReport);
+  const json = reports.map(report => JSON.stringify(report));
+  const rate = (run: (i: number) => unknown): string => {
+    const start = performance.now();
+    for (let i = 0; i < rounds; i++) run(i % reports.length);
+    return `${Math.round(rounds / (performance.now() - start) * 1000).toLocaleString()}/s`;
+  };
+  console.log(`   ⏱️ Encode ${rate(i => encodeReport(reports[i]))}, JSON.stringify ${rate(i => JSON.stringify(reports[i]))}`);
+  console.log(`   ⏱️ Decode ${rate(i => decodeReport(encoded[i]))}, JSON.parse ${rate(i => JSON.parse(json[i]))}`);
+}
+
+/**
+ * Test that an audit reports its scoring results before the Torii call
+ */
+async function testAuditProgress(): Promise<void> {
+  console.log('\n' + '='.repeat(60));
+  console.log('Testing Audit Progress');
+  console.log('='.repeat(60));
+
+  const auditor = new ComplianceAuditor('', { mode: 'embedded' });
+  const progress: AuditProgress[] = [];
+  const result = await auditor.auditToken(mockTokens.riskyToken, update => progress.push(update));
+
+  const [update] = progress;
+  const match = progress.length === 1 &&
+    update.stage === 'torii' &&
+    update.partial?.overallRiskScore === result.report?.overallRiskScore &&
+    update.partial?.redFlags?.length === result.report?.redFlags.length;
+  console.log(`   ${match ? '✅' : '❌'} Scoring results reported before Torii (${progress.length} update)`);
+}
+
 /**
  * Test all tokens
  */
@@ -155,6 +344,37 @@ async function testQueue(): Promise<void> {
     console.log(`   Failed: ${stats.failed}`);
 
     await queue.close();
+
+    // Test bulk insert deduplication (producer only, so nothing is processed)
+    console.log('\n📦 Testing batch deduplication...');
+    const producer = await createAuditQueue('http://localhost:3000/api/check', { processJobs: false });
+    const mints = [mockTokens.safeToken.address, mockTokens.safeToken.address, mockTokens.riskyToken.address];
+    const first = await producer.addBatchAudits(mints);
+    const second = await producer.addBatchAudits(mints);
+    console.log(`   ${first.length === 2 ? '✅' : '❌'} First batch added ${first.length} of ${mints.length}`);
+    console.log(`   ${second.length === 0 ? '✅' : '❌'} Repeat batch added ${second.length}`);
+    await producer.clear();
+
+    // Test report history paging and the risk level index
+    if (result.report) {
+      console.log('\n🗄️ Testing report store...');
+      const reports = producer.getReportStore();
+      const tokenAddress = `ReportStoreTest${Date.now()}`;
+      for (const [i, riskLevel] of (['LOW', 'HIGH', 'CRITICAL'] as const).entries()) {
+        await reports.save({ ...result.report, tokenAddress, riskLevel, timestamp: Date.now() + i }, 'fingerprint');
+      }
+      const page1 = await reports.getHistory(tokenAddress, { limit: 2 });
+      const page2 = await reports.getHistory(tokenAddress, { limit: 2, cursor: page1.nextCursor });
+      const paged = page1.items.length === 2 && page2.items.length === 1 && !page2.nextCursor &&
+        page1.items[0].report.riskLevel === 'CRITICAL' && page2.items[0].report.riskLevel === 'LOW';
+      console.log(`   ${paged ? '✅' : '❌'} History pages newest first (${page1.items.length} + ${page2.items.length})`);
+      const high = await reports.getByRiskLevel('HIGH', { limit: 1000 });
+      const moved = !high.items.some(item => item.report.tokenAddress === tokenAddress) &&
+        (await reports.getLatest(tokenAddress))?.report.riskLevel === 'CRITICAL';
+      console.log(`   ${moved ? '✅' : '❌'} Risk level index follows the latest report`);
+    }
+    await producer.close();
+
     console.log('\n✅ Queue tests completed');
 
   } catch (error) {
@@ -193,6 +413,170 @@ function printTestSummary(): void {
   console.log('');
 }
 
+/**
+ * Test the queue's audit path (analyzeSnapshot with prefetched holders, then
+ * mapAnalysisToTokenData, then auditToken) reaches Torii with the project
+ * description from the off-chain metadata JSON
+ */
+async function testToriiPipeline(): Promise<void> {
+  console.log('\n' + '='.repeat(60));
+  console.log('Testing Torii in the Audit Pipeline');
+  console.log('='.repeat(60));
+
+  const metadataUri = 'https://metadata.example/revenue-token.json';
+  const projectDescription = 'Holders receive a share of protocol revenue as dividends';
+  const fetchOriginal = globalThis.fetch;
+  globalThis.fetch = (async (input: string | URL | Request, init?: RequestInit) =>
+    String(input) === metadataUri
+      ? new Response(JSON.stringify({ name: 'Revenue Token', description: projectDescription }))
+      : fetchOriginal(input, init)) as typeof fetch;
+
+  let received: string | undefined;
+  const server = http.createServer((req, res) => {
+    let body = '';
+    req.on('data', chunk => (body += chunk));
+    req.on('end', () => {
+      received = JSON.parse(body).description;
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({
+        success: true,
+        data: {
+          classification: 'SECURITY TOKEN',
+          classificationJP: '電子記録移転権利',
+          riskScore: 55,
+          riskLevel: 'HIGH',
+          required: 'Type I or II Financial Instruments Business License',
+          governingLaw: 'Financial Instruments and Exchange Act',
+          risks: ['⚠️  Profit/revenue distribution detected'],
+          confidence: 0.9
+        }
+      }));
+    });
+  });
+  await new Promise<void>(resolve => server.listen(0, resolve));
+  const { port } = server.address() as { port: number };
+
+  try {
+    // Prefetched snapshot and holders, as fingerprintToken hands them over: no RPC
+    const analyzer = new TokenAnalyzer({ rpcUrl: 'http://127.0.0.1:9' });
+    const analysis = await analyzer.analyzeSnapshot(
+      {
+        mintAddress: 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+        programId: TOKEN_PROGRAM_ID.toBase58(),
+        decimals: 6,
+        supply: '1000000000000',
+        uiSupply: '1000000',
+        mintAuthority: null,
+        freezeAuthority: null,
+        isInitialized: true,
+        lamports: 1461600,
+        metadata: { name: 'Revenue Token', symbol: 'REV', uri: metadataUri }
+      },
+      {},
+      Array.from({ length: 20 }, (_, i) => ({
+        address: new PublicKey(i + 1),
+        amount: String(50_000_000_000 - i * 1_000_000_000),
+        decimals: 6,
+        uiAmount: 50_000 - i * 1000,
+        uiAmountString: String(50_000 - i * 1000)
+      }))
+    );
+    const tokenData = mapAnalysisToTokenData(analysis);
+    const auditor = new ComplianceAuditor(`http://localhost:${port}/api/check`, { demoMode: true });
+    const { report } = await auditor.auditToken(tokenData);
+
+    const described = tokenData.description === projectDescription && received === projectDescription;
+    console.log(`   ${described ? '✅' : '❌'} Torii classified the off-chain description (${received ?? 'nothing sent'})`);
+    const verdict = report?.toriiApiResponse?.classification === 'SECURITY TOKEN' &&
+      report.japanCompliance.compliant === false &&
+      report.japanCompliance.regulatoryStatus.startsWith('SECURITY TOKEN');
+    console.log(`   ${verdict ? '✅' : '❌'} Report carries Torii's verdict: ${report?.japanCompliance.regulatoryStatus}`);
+  } finally {
+    globalThis.fetch = fetchOriginal;
+    server.close();
+  }
+}
+
+/**
+ * Test Torii request coalescing and the circuit breaker against a local stub
+ */
+async function testToriiClient(): Promise<void> {
+  console.log('\n' + '='.repeat(60));
+  console.log('Testing Torii Client');
+  console.log('='.repeat(60));
+
+  let requests = 0;
+  let healthy = true;
+  const server = http.createServer((req, res) => {
+    requests++;
+    req.resume();
+    setTimeout(() => {
+      res.writeHead(healthy ? 200 : 503, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({
+        success: true,
+        data: {
+          classification: 'UTILITY TOKEN',
+          classificationJP: 'ユーティリティトークン',
+          riskScore: 0,
+          riskLevel: 'LOW',
+          required: 'Usually no registration',
+          governingLaw: 'Note: Verify no security characteristics',
+          risks: [],
+          confidence: 0.6
+        }
+      }));
+    }, 50);
+  });
+  await new Promise<void>(resolve => server.listen(0, resolve));
+  const { port } = server.address() as { port: number };
+
+  const client = new ToriiClient(`http://localhost:${port}/api/check`, { demoMode: true, failureThreshold: 2, cooldownMs: 200 });
+  const request = {
+    description: 'Utility token for in-app purchases',
+    tokenAddress: mockTokens.safeToken.address,
+    classification: TokenClassification.UTILITY_TOKEN,
+    supply: mockTokens.safeToken.supply,
+    holderCount: 1000
+  };
+
+  await Promise.all(Array.from({ length: 5 }, () => client.check(request)));
+  console.log(`   ${requests === 1 ? '✅' : '❌'} 5 concurrent identical checks sent ${requests} request(s)`);
+
+  healthy = false;
+  for (let i = 0; i < 2; i++) {
+    await client.check(request).catch(() => {});
+  }
+  requests = 0;
+  const start = performance.now();
+  const rejected = await client.check(request).catch(error => error);
+  const elapsed = performance.now() - start;
+  const failedFast = rejected instanceof CircuitOpenError && requests === 0;
+  console.log(`   ${failedFast ? '✅' : '❌'} Open circuit rejected in ${elapsed.toFixed(1)}ms without a request`);
+
+  healthy = true;
+  await new Promise(resolve => setTimeout(resolve, 250));
+  await client.check(request);
+  const closed = client.getStats().circuit === 'closed';
+  console.log(`   ${closed ? '✅' : '❌'} Probe after cooldown closed the circuit`);
+
+  // Unpaid checks are opt-in: without a proof or demo mode nothing is sent
+  requests = 0;
+  const unpaid = new ToriiClient(`http://localhost:${port}/api/check`);
+  const refused = await unpaid.check(request).then(() => false, () => requests === 0);
+  console.log(`   ${refused ? '✅' : '❌'} Check without payment proof or demo mode refused without a request`);
+
+  server.close();
+
+  // Embedded mode classifies in-process with no server at all
+  const embedded = new ToriiClient('', { mode: 'embedded' });
+  const verdict = await embedded.check({
+    ...request,
+    description: 'Token holders receive 2% of trading fees as dividend'
+  });
+  const flagged = !verdict.compliant && verdict.warnings.length > 0;
+  console.log(`   ${flagged ? '✅' : '❌'} Embedded engine: ${verdict.classification} (risk ${verdict.riskScore})`);
+}
+
 /**
  * Main test runner
  */
@@ -201,6 +585,24 @@ async function main(): Promise<void> {
     // Test individual audits
     await testAllTokens();
 
+    // Test columnar holder scoring
+    testHolderSet();
+
+    // Test batch scoring
+    testScoreBatch();
+
+    // Test binary report encoding
+    await testReportCodec();
+
+    // Test progress reporting
+    await testAuditProgress();
+
+    // Test Torii coalescing and circuit breaker
+    await testToriiClient();
+
+    // Test Torii through the queue's analysis path
+    await testToriiPipeline();
+
     // Test queue (if Redis available)
     await testQueue();
 
@@ -219,4 +621,4 @@ if (import.meta.url === `file://${process.argv[1]}`) {
   main();
 }
 
-export { testAllTokens, testQueue, testSingleAudit, mockTokens };
+export { testAllTokens, testQueue, testSingleAudit, testHolderSet, testScoreBatch, testReportCodec, testAuditProgress, testToriiClient, mockTokens };
@@ -0,0 +1,83 @@
+/**
+ * Columnar Token Batch
+ * Struct-of-arrays scoring input for many tokens at once (market-wide
+ * sweeps), holding only the per-token aggregates RiskScorer reads
+ */
+
+import { TokenData } from './types.js';
+import { HolderSummary } from './holder-set.js';
+
+/**
+ * Bits of TokenBatch.authorities
+ */
+export const MINT_AUTHORITY = 1;
+export const FREEZE_AUTHORITY = 2;
+
+/**
+ * Bits of TokenBatch.hints
+ */
+export const GOVERNANCE_HINT = 1;
+
+/**
+ * Whether a token's name or symbol marks it as a governance token
+ */
+export function hasGovernanceHint(name?: string, symbol?: string): boolean {
+  return (name?.toLowerCase() || '').includes('governance') || (symbol?.toLowerCase() || '').includes('gov');
+}
+
+export class TokenBatch {
+  public readonly addresses: string[];
+  public readonly names: Array<string | undefined>;
+  public readonly symbols: Array<string | undefined>;
+  public readonly holderCounts: Float64Array; // Total holders (for liquidity)
+  public readonly summarizedCounts: Uint32Array; // Holders the percentages were computed from
+  public readonly topHolderPercentages: Float64Array;
+  public readonly top10HolderPercentages: Float64Array;
+  public readonly whaleCounts: Uint32Array;
+  public readonly whalePercentages: Float64Array;
+  public readonly authorities: Uint8Array;
+  public readonly hints: Uint8Array; // Metadata hints, decoded once so scoring needs no strings
+  private size = 0;
+
+  constructor(capacity: number) {
+    this.addresses = new Array(capacity);
+    this.names = new Array(capacity);
+    this.symbols = new Array(capacity);
+    this.holderCounts = new Float64Array(capacity);
+    this.summarizedCounts = new Uint32Array(capacity);
+    this.topHolderPercentages = new Float64Array(capacity);
+    this.top10HolderPercentages = new Float64Array(capacity);
+    this.whaleCounts = new Uint32Array(capacity);
+    this.whalePercentages = new Float64Array(capacity);
+    this.authorities = new Uint8Array(capacity);
+    this.hints = new Uint8Array(capacity);
+  }
+
+  get length(): number {
+    return this.size;
+  }
+
+  /**
+   * Append a token with its holder summary (see RiskScorer.summarizeHolders)
+   */
+  add(tokenData: TokenData, summary: HolderSummary): number {
+    if (this.size === this.holderCounts.length) {
+      throw new RangeError(`TokenBatch capacity ${this.holderCounts.length} exceeded`);
+    }
+    const i = this.size++;
+    this.addresses[i] = tokenData.address;
+    this.names[i] = tokenData.name;
+    this.symbols[i] = tokenData.symbol;
+    this.holderCounts[i] = tokenData.holderCount ?? summary.count;
+    this.summarizedCounts[i] = summary.count;
+    this.topHolderPercentages[i] = summary.topHolderPercentage;
+    this.top10HolderPercentages[i] = summary.top10HolderPercentage;
+    this.whaleCounts[i] = summary.whaleCount;
+    this.whalePercentages[i] = summary.whalePercentage;
+    this.authorities[i] =
+      (tokenData.mintAuthority !== null ? MINT_AUTHORITY : 0) |
+      (tokenData.freezeAuthority !== null ? FREEZE_AUTHORITY : 0);
+    this.hints[i] = hasGovernanceHint(tokenData.name, tokenData.symbol) ? GOVERNANCE_HINT : 0;
+    return i;
+  }
+}
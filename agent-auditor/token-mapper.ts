@@ -0,0 +1,58 @@
+/**
+ * Token Data Mapping
+ * Converts solana-fetcher analysis results into auditor input
+ */
+
+import type { TokenAnalysis, HolderAggregates } from '../solana-fetcher/index.js';
+import { TokenData, HolderData } from './types.js';
+
+/**
+ * Map a TokenAnalysis from the fetcher to the TokenData shape used by RiskScorer
+ */
+export function mapAnalysisToTokenData(analysis: TokenAnalysis): TokenData {
+  const holders: HolderData[] = analysis.holderDistribution.largestHolders.map(holder => ({
+    address: holder.address,
+    balance: parseFloat(holder.balance) || 0,
+    percentage: holder.percentage
+  }));
+
+  return {
+    address: analysis.mintAddress,
+    name: analysis.metadata.name,
+    symbol: analysis.metadata.symbol,
+    description: analysis.metadata.description,
+    supply: parseFloat(analysis.supply.total) || 0,
+    decimals: analysis.metadata.decimals,
+    mintAuthority: analysis.metadata.mintAuthority,
+    freezeAuthority: analysis.metadata.freezeAuthority,
+    holders,
+    // Only a full holder scan yields a true holder count
+    holderCount: analysis.holderDistribution.totalAccounts !== undefined
+      ? analysis.holderDistribution.totalHolders
+      : undefined,
+    metadata: {
+      uri: analysis.metadata.uri,
+      programId: analysis.programOwnership.programId,
+      isToken2022: analysis.programOwnership.isToken2022
+    }
+  };
+}
+
+/**
+ * Attach incrementally tracked holder aggregates to token data, so RiskScorer
+ * can be re-run after each transfer without refetching holders
+ */
+export function withHolderAggregates(tokenData: TokenData, aggregates: HolderAggregates): TokenData {
+  return {
+    ...tokenData,
+    holderCount: aggregates.count,
+    holderSummary: {
+      count: aggregates.count,
+      topHolderPercentage: aggregates.topHolderPercentage,
+      top10HolderPercentage: aggregates.top10HolderPercentage,
+      whaleCount: aggregates.whaleCount,
+      whalePercentage: aggregates.whalePercentage,
+      gini: aggregates.gini
+    }
+  };
+}
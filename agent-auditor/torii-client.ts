@@ -0,0 +1,275 @@
+/**
+ * Torii API Client
+ * Runs Torii checks over keep-alive HTTP or in-process (embedded ToriiEngine),
+ * with single-flight coalescing of identical checks and a circuit breaker so
+ * audits fail fast while a remote Torii is down
+ */
+
+import http from 'node:http';
+import https from 'node:https';
+import axios, { AxiosError, AxiosInstance } from 'axios';
+import { metrics } from '../solana-fetcher/index.js';
+import type { ClassifyCache } from '../torii-api/classify-cache.js';
+import type { ClassificationResult } from '../torii-api/torii-engine.js';
+import { ToriiApiRequest, ToriiApiResponse, ToriiClientConfig } from './types.js';
+
+const toriiDuration = metrics.histogram(
+  'torii_request_duration_seconds',
+  'Torii compliance check duration by transport and outcome',
+  ['transport', 'outcome']
+);
+const toriiShortCircuits = metrics.counter(
+  'torii_circuit_rejections_total',
+  'Torii checks rejected without a request because the circuit was open'
+);
+const toriiCoalesced = metrics.counter(
+  'torii_coalesced_requests_total',
+  'Torii checks that joined an identical in-flight request'
+);
+
+export type CircuitState = 'closed' | 'open' | 'half_open';
+
+/**
+ * Thrown instead of calling Torii while the circuit is open
+ */
+export class CircuitOpenError extends Error {
+  constructor(public readonly retryAt: number) {
+    super(`Torii API circuit open, retrying after ${new Date(retryAt).toISOString()}`);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+/**
+ * Consecutive-failure circuit breaker. After `failureThreshold` failures the
+ * circuit opens for `cooldownMs`; then a single probe is let through and its
+ * outcome closes or re-opens the circuit.
+ */
+export class CircuitBreaker {
+  private state: CircuitState = 'closed';
+  private failures = 0;
+  private openedAt = 0;
+  private probing = false;
+
+  constructor(
+    private failureThreshold: number,
+    private cooldownMs: number
+  ) {}
+
+  /**
+   * Throw CircuitOpenError unless a request may go out now
+   */
+  public acquire(now: number = Date.now()): void {
+    if (this.state === 'closed') return;
+
+    if (this.state === 'open' && now - this.openedAt >= this.cooldownMs) {
+      this.state = 'half_open';
+    }
+    if (this.state === 'half_open' && !this.probing) {
+      this.probing = true;
+      return;
+    }
+    throw new CircuitOpenError(this.openedAt + this.cooldownMs);
+  }
+
+  public onSuccess(): void {
+    this.state = 'closed';
+    this.failures = 0;
+    this.probing = false;
+  }
+
+  public onFailure(now: number = Date.now()): void {
+    this.failures++;
+    this.probing = false;
+    if (this.state === 'half_open' || this.failures >= this.failureThreshold) {
+      if (this.state !== 'open') {
+        console.warn(`⚡ Torii API circuit opened after ${this.failures} consecutive failures`);
+      }
+      this.state = 'open';
+      this.openedAt = now;
+    }
+  }
+
+  public getState(): CircuitState {
+    return this.state;
+  }
+
+  public getFailures(): number {
+    return this.failures;
+  }
+}
+
+/**
+ * Whether a failed Torii call says Torii itself is unhealthy (network error,
+ * timeout, 5xx). Client errors such as 400/402 don't count against the breaker.
+ */
+function isOutage(error: unknown): boolean {
+  if (!axios.isAxiosError(error)) return true;
+  const status = (error as AxiosError).response?.status;
+  return status === undefined || status >= 500;
+}
+
+/**
+ * Map a Torii classification (the `data` of POST /api/check, or
+ * ToriiEngine.classify) to the verdict stored in audit reports. Only LOW risk
+ * classes need no registration or licence in Japan.
+ */
+export function toToriiApiResponse(result: ClassificationResult): ToriiApiResponse {
+  return {
+    compliant: result.riskLevel === 'LOW',
+    classification: result.classification,
+    warnings: result.risks,
+    recommendations: [result.required],
+    regulatoryNotes: `${result.classification} (${result.classificationJP}) - ${result.governingLaw}`,
+    riskScore: result.riskScore,
+    riskLevel: result.riskLevel,
+    confidence: result.confidence
+  };
+}
+
+export class ToriiClient {
+  private mode: ToriiClientConfig['mode'];
+  private paymentProof?: string;
+  private demoMode: boolean;
+  private warnedUnpaid = false;
+  private http?: AxiosInstance;
+  private embedded?: Promise<ClassifyCache>;
+  private breaker: CircuitBreaker;
+  private inFlight: Map<string, Promise<ToriiApiResponse>> = new Map();
+
+  constructor(
+    private apiUrl: string,
+    config: Partial<ToriiClientConfig> = {}
+  ) {
+    this.mode = config.mode || 'http';
+    this.paymentProof = config.paymentProof;
+    this.demoMode = config.demoMode ?? false;
+    this.breaker = new CircuitBreaker(config.failureThreshold || 5, config.cooldownMs || 30000);
+
+    if (this.mode === 'http') {
+      const agentOptions = { keepAlive: true, maxSockets: config.maxSockets || 32 };
+      this.http = axios.create({
+        timeout: config.timeout || 10000,
+        headers: {
+          'Content-Type': 'application/json'
+        },
+        httpAgent: new http.Agent(agentOptions),
+        httpsAgent: new https.Agent(agentOptions)
+      });
+    }
+  }
+
+  /**
+   * Whether checks can be sent: over HTTP that takes a payment proof, or
+   * demo mode explicitly turned on (warns once when neither is set)
+   */
+  public canCheck(): boolean {
+    if (this.mode === 'embedded' || this.paymentProof || this.demoMode) return true;
+
+    if (!this.warnedUnpaid) {
+      this.warnedUnpaid = true;
+      console.warn('⚠️ Torii checks skipped: set TORII_PAYMENT_PROOF, or TORII_DEMO_MODE=true for a demo server');
+    }
+    return false;
+  }
+
+  /**
+   * Check a token with Torii. Concurrent checks for the same token address and
+   * classification share one request.
+   */
+  public check(request: ToriiApiRequest): Promise<ToriiApiResponse> {
+    if (!this.canCheck()) {
+      return Promise.reject(new Error('Torii HTTP mode needs a payment proof, or demo mode turned on'));
+    }
+
+    const key = `${request.tokenAddress}:${request.classification}`;
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      toriiCoalesced.inc();
+      return pending;
+    }
+
+    if (this.mode === 'embedded') {
+      const response = toriiDuration
+        .time({ transport: 'embedded' }, () => this.classifyEmbedded(request))
+        .finally(() => this.inFlight.delete(key));
+      this.inFlight.set(key, response);
+      return response;
+    }
+
+    try {
+      this.breaker.acquire();
+    } catch (error) {
+      toriiShortCircuits.inc();
+      return Promise.reject(error);
+    }
+
+    const response = this.send(request).finally(() => this.inFlight.delete(key));
+    this.inFlight.set(key, response);
+    return response;
+  }
+
+  /**
+   * Classify in this process with the same engine and result cache the
+   * Torii server uses (loaded on first use)
+   */
+  private async classifyEmbedded(request: ToriiApiRequest): Promise<ToriiApiResponse> {
+    if (!this.embedded) {
+      this.embedded = Promise.all([
+        import('../torii-api/torii-engine.js'),
+        import('../torii-api/classify-cache.js')
+      ]).then(([{ ToriiEngine }, { ClassifyCache }]) => new ClassifyCache(new ToriiEngine()));
+    }
+    const cache = await this.embedded;
+    return toToriiApiResponse(cache.classify(request.description).result);
+  }
+
+  private async send(request: ToriiApiRequest): Promise<ToriiApiResponse> {
+    // Demo mode skips Torii's payment check, so it is only sent when asked for
+    const body: ToriiApiRequest = this.paymentProof
+      ? { ...request, paymentProof: this.paymentProof }
+      : { ...request, demoMode: true };
+
+    try {
+      const response = await toriiDuration.time({ transport: 'http' }, () =>
+        this.http!.post<{ success: boolean; data: ClassificationResult }>(this.apiUrl, body)
+      );
+      this.breaker.onSuccess();
+      return toToriiApiResponse(response.data.data);
+    } catch (error) {
+      if (isOutage(error)) {
+        this.breaker.onFailure();
+      } else {
+        // Torii answered, so it is up
+        this.breaker.onSuccess();
+      }
+
+      if (axios.isAxiosError(error)) {
+        const axiosError = error as AxiosError;
+        if (axiosError.code === 'ECONNREFUSED') {
+          throw new Error('Torii API is not running. Start the API server first.');
+        }
+        if (axiosError.response?.status === 404) {
+          throw new Error('Torii API endpoint not found. Check the API URL.');
+        }
+      }
+      throw error;
+    }
+  }
+
+  /**
+   * Transport, breaker state and requests currently in flight
+   */
+  public getStats(): {
+    mode: ToriiClientConfig['mode'];
+    circuit: CircuitState;
+    consecutiveFailures: number;
+    inFlight: number;
+  } {
+    return {
+      mode: this.mode,
+      circuit: this.breaker.getState(),
+      consecutiveFailures: this.breaker.getFailures(),
+      inFlight: this.inFlight.size
+    };
+  }
+}
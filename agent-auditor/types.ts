@@ -3,15 +3,23 @@
  * Colosseum Compliance Guardian - Japan Regulatory Compliance Checker
  */
 
+import type { HolderSet, HolderSummary } from './holder-set.js';
+import type { AuditSchedulerConfig } from './scheduler.js';
+import type { ReportStoreConfig } from './report-store.js';
+
 export interface TokenData {
   address: string;
   name?: string;
   symbol?: string;
+  description?: string; // Project description (e.g. from off-chain metadata); Torii is only called when one is known
   supply: number;
   decimals: number;
   mintAuthority: string | null;
   freezeAuthority: string | null;
   holders: HolderData[];
+  holderCount?: number; // Total distinct holders, when known (holders may only list the largest)
+  holderSet?: HolderSet; // Columnar holders for large lists; used instead of `holders` when present
+  holderSummary?: HolderSummary; // Precomputed aggregates (e.g. from HolderTracker); skips holder scans
   metadata?: {
     uri?: string;
     [key: string]: any;
@@ -49,19 +57,43 @@ export interface RiskFactors {
   };
 }
 
+/**
+ * Body of POST /api/check. Torii classifies `description`; the token fields
+ * are context for logs and coalescing.
+ */
 export interface ToriiApiRequest {
+  description: string; // 10-2000 characters
   tokenAddress: string;
   classification: TokenClassification;
   supply: number;
   holderCount: number;
+  paymentProof?: string;
+  demoMode?: boolean;
 }
 
+export interface ToriiClientConfig {
+  mode: 'http' | 'embedded'; // embedded runs ToriiEngine in-process (default: http)
+  paymentProof?: string; // x402 proof for a paid Torii deployment
+  demoMode?: boolean; // send unpaid demo-mode checks when there is no proof (default: false, checks are skipped)
+  timeout: number; // per-request timeout in ms (default: 10000)
+  maxSockets: number; // keep-alive sockets to Torii (default: 32)
+  failureThreshold: number; // consecutive failures that open the circuit (default: 5)
+  cooldownMs: number; // how long the circuit stays open before a probe (default: 30000)
+}
+
+/**
+ * Torii's verdict as used in audit reports, mapped from the engine's
+ * classification result (see toToriiApiResponse)
+ */
 export interface ToriiApiResponse {
   compliant: boolean;
   classification: string;
   warnings: string[];
   recommendations: string[];
   regulatoryNotes?: string;
+  riskScore?: number; // Torii description risk score (0-100)
+  riskLevel?: 'HIGH' | 'MEDIUM' | 'LOW';
+  confidence?: number;
 }
 
 export enum TokenClassification {
@@ -103,15 +135,56 @@ export interface AuditJobData {
   priority?: number;
   retryCount?: number;
   scheduledAudit?: boolean;
+  paymentSignature?: string; // Payment transaction that bought this audit
 }
 
 export interface AuditJobResult {
   success: boolean;
   report?: AuditReport;
+  unchanged?: boolean; // on-chain inputs matched the last audit; its report was reused
   error?: string;
   retryable?: boolean;
 }
 
+/**
+ * Audit job progress (Job.progress): the stage now running and the report
+ * fields known so far
+ */
+export interface AuditProgress {
+  stage: 'fetch' | 'score' | 'torii';
+  partial?: Partial<AuditReport>;
+  attempt?: number; // failed attempts before this one (job.attemptsMade); a retry starts its stages over
+}
+
+/**
+ * Where an audit job stands, for clients following it
+ */
+export interface AuditStatus {
+  jobId: string;
+  state: 'pending' | 'complete' | 'failed';
+  progress?: AuditProgress;
+  report?: AuditReport;
+  error?: string;
+}
+
+export interface StoredAudit {
+  id: string; // zero-padded audit time and token address (see reportId)
+  fingerprint?: string; // on-chain fingerprint the report was made from
+  report: AuditReport;
+}
+
+export interface ReportQuery {
+  limit?: number; // page size (default: 50, max: 1000)
+  cursor?: string; // nextCursor of the previous page
+  since?: number; // only reports at or after this time (ms)
+  until?: number; // only reports at or before this time (ms; newest-first queries)
+}
+
+export interface ReportPage {
+  items: StoredAudit[];
+  nextCursor?: string; // absent on the last page
+}
+
 export interface QueueConfig {
   redis: {
     host: string;
@@ -123,6 +196,23 @@ export interface QueueConfig {
     type: 'exponential' | 'fixed';
     delay: number;
   };
+  concurrency: number; // audit jobs processed in parallel per process
+  processJobs: boolean; // false for producer-only processes
+  fullHolderScan: boolean; // enumerate every holder with getProgramAccounts (expensive)
+  scheduler?: Partial<AuditSchedulerConfig>; // re-audit schedule (sorted set in Redis)
+  reportStore?: Partial<ReportStoreConfig>; // audit report history (hashes and sorted sets in Redis)
+}
+
+export interface WorkerPoolConfig {
+  workers: number; // number of worker processes (cluster mode)
+  concurrency: number; // audit jobs per worker process
+  toriiApiUrl?: string;
+  torii?: Partial<ToriiClientConfig>;
+  rpcUrl?: string;
+  cacheDir?: string; // on-disk snapshot cache shared by all workers (default: per-process memory)
+  fullHolderScan?: boolean; // see QueueConfig.fullHolderScan
+  metricsPort?: number; // serve Prometheus /metrics (cluster: from the primary, merged across workers)
+  queue?: Partial<QueueConfig>;
 }
 
 export interface ScheduledAuditConfig {
@@ -0,0 +1,203 @@
+/**
+ * Audit Worker Pool
+ * Runs the Bull audit processor across multiple processes using Node cluster
+ */
+
+import cluster from 'node:cluster';
+import os from 'node:os';
+import {
+  TokenAnalyzer,
+  MemoryCache,
+  FileCache,
+  metrics,
+  mergeMetrics,
+  renderMetrics,
+  serveMetrics
+} from '../solana-fetcher/index.js';
+import type { MetricSnapshot } from '../solana-fetcher/index.js';
+import { ComplianceAuditor } from './auditor.js';
+import { AuditQueue } from './queue.js';
+import { WorkerPoolConfig } from './types.js';
+
+const RESTART_DELAY_MS = 1000;
+const METRICS_COLLECT_TIMEOUT_MS = 2000;
+
+interface MetricsMessage {
+  type: 'metrics:collect' | 'metrics:snapshot';
+  id: number;
+  snapshot?: MetricSnapshot[];
+}
+
+/**
+ * Answer snapshot requests from the primary (cluster workers only)
+ */
+function answerMetricsRequests(): void {
+  process.on('message', async (message: MetricsMessage) => {
+    if (message?.type !== 'metrics:collect') return;
+    const snapshot = await metrics.snapshot();
+    process.send?.({ type: 'metrics:snapshot', id: message.id, snapshot });
+  });
+}
+
+/**
+ * Ask every worker for its metrics and merge them with the primary's own
+ * (queue gauges). Workers that don't answer in time are left out.
+ */
+async function collectClusterMetrics(nextId: () => number): Promise<string> {
+  const workers = Object.values(cluster.workers || {}).filter((worker) => worker?.isConnected());
+  const id = nextId();
+
+  const snapshots = await Promise.all(
+    workers.map(
+      (worker) =>
+        new Promise<MetricSnapshot[]>((resolve) => {
+          const timer = setTimeout(() => {
+            worker!.off('message', onMessage);
+            resolve([]);
+          }, METRICS_COLLECT_TIMEOUT_MS);
+          const onMessage = (message: MetricsMessage) => {
+            if (message?.type !== 'metrics:snapshot' || message.id !== id) return;
+            clearTimeout(timer);
+            worker!.off('message', onMessage);
+            resolve(message.snapshot || []);
+          };
+          worker!.on('message', onMessage);
+          worker!.send({ type: 'metrics:collect', id });
+        })
+    )
+  );
+
+  return renderMetrics(mergeMetrics([await metrics.snapshot(), ...snapshots]));
+}
+
+/**
+ * Start a single in-process worker that drains the audit queue
+ */
+export function startAuditWorker(config: WorkerPoolConfig): AuditQueue {
+  const auditor = new ComplianceAuditor(config.toriiApiUrl, config.torii);
+  const analyzer = new TokenAnalyzer({
+    rpcUrl: config.rpcUrl,
+    // A cache directory is shared by every worker on the host
+    cache: config.cacheDir ? new FileCache(config.cacheDir) : new MemoryCache()
+  });
+
+  const queue = new AuditQueue(
+    auditor,
+    {
+      ...config.queue,
+      concurrency: config.concurrency,
+      processJobs: true,
+      fullHolderScan: config.fullHolderScan ?? config.queue?.fullHolderScan
+    },
+    analyzer
+  );
+
+  // Idempotent, so every worker may run it
+  queue.migrateRepeatableAudits().catch((error) =>
+    console.error('⚠️ Repeatable audit migration failed:', error.message)
+  );
+
+  const shutdown = async () => {
+    await queue.close();
+    process.exit(0);
+  };
+  process.once('SIGTERM', shutdown);
+  process.once('SIGINT', shutdown);
+
+  if (cluster.isWorker) {
+    answerMetricsRequests();
+  } else if (config.metricsPort) {
+    queue.registerMetrics();
+    serveMetrics(config.metricsPort);
+    console.log(`📈 Metrics at http://localhost:${config.metricsPort}/metrics`);
+  }
+
+  console.log(`👷 Audit worker ${process.pid} started (concurrency: ${config.concurrency})`);
+  return queue;
+}
+
+/**
+ * Start the worker pool
+ * With workers > 1 the primary forks one process per worker and restarts
+ * any that exit unexpectedly; each process runs its own Bull processor.
+ */
+export function startAuditWorkers(config: WorkerPoolConfig): void {
+  if (config.workers <= 1) {
+    startAuditWorker(config);
+    return;
+  }
+
+  if (!cluster.isPrimary) {
+    startAuditWorker(config);
+    return;
+  }
+
+  let shuttingDown = false;
+
+  console.log(`🚀 Starting ${config.workers} audit workers (concurrency ${config.concurrency} each)`);
+
+  // The primary serves /metrics for the whole pool; queue gauges come from
+  // its own producer-only queue so they are counted once
+  if (config.metricsPort) {
+    const statsQueue = new AuditQueue(
+      new ComplianceAuditor(config.toriiApiUrl),
+      { ...config.queue, processJobs: false }
+    );
+    statsQueue.registerMetrics();
+    let requestId = 0;
+    serveMetrics(config.metricsPort, () => collectClusterMetrics(() => ++requestId));
+    console.log(`📈 Metrics at http://localhost:${config.metricsPort}/metrics`);
+  }
+
+  for (let i = 0; i < config.workers; i++) {
+    cluster.fork();
+  }
+
+  cluster.on('exit', (worker, code, signal) => {
+    if (shuttingDown) return;
+    console.error(`⚠️ Audit worker ${worker.process.pid} exited (${signal || code}), restarting`);
+    setTimeout(() => cluster.fork(), RESTART_DELAY_MS);
+  });
+
+  const shutdown = () => {
+    shuttingDown = true;
+    for (const worker of Object.values(cluster.workers || {})) {
+      worker?.kill('SIGTERM');
+    }
+  };
+  process.once('SIGTERM', shutdown);
+  process.once('SIGINT', shutdown);
+}
+
+/**
+ * Read worker pool configuration from the environment
+ */
+export function workerConfigFromEnv(env: NodeJS.ProcessEnv = process.env): WorkerPoolConfig {
+  return {
+    workers: parseInt(env.AUDIT_WORKERS || '', 10) || os.availableParallelism(),
+    concurrency: parseInt(env.AUDIT_CONCURRENCY || '', 10) || 4,
+    toriiApiUrl: env.TORII_API_URL,
+    torii: {
+      mode: env.TORII_MODE === 'embedded' ? 'embedded' : 'http',
+      paymentProof: env.TORII_PAYMENT_PROOF,
+      demoMode: env.TORII_DEMO_MODE === 'true',
+      timeout: parseInt(env.TORII_TIMEOUT_MS || '', 10) || undefined,
+      maxSockets: parseInt(env.TORII_MAX_SOCKETS || '', 10) || undefined
+    },
+    rpcUrl: env.SOLANA_RPC_URL,
+    cacheDir: env.SOLANA_CACHE_DIR,
+    fullHolderScan: env.AUDIT_FULL_HOLDER_SCAN === 'true',
+    metricsPort: parseInt(env.METRICS_PORT || '', 10) || undefined,
+    queue: {
+      redis: {
+        host: env.REDIS_HOST || 'localhost',
+        port: parseInt(env.REDIS_PORT || '', 10) || 6379
+      }
+    }
+  };
+}
+
+// Run if executed directly
+if (import.meta.url === `file://${process.argv[1]}`) {
+  startAuditWorkers(workerConfigFromEnv());
+}
@@ -0,0 +1,93 @@
+import { getAuditQueue, getAuditStatus, queueUnavailable, toAuditResult } from '@/lib/server/audit-queue';
+import type { AuditQueue } from '../../../../../../agent-auditor/queue';
+import type { AuditStatus as JobStatus } from '../../../../../../agent-auditor/types';
+import type { AuditStage } from '@/lib/types';
+
+export const runtime = 'nodejs';
+export const dynamic = 'force-dynamic';
+
+const STAGES: AuditStage[] = ['queued', 'fetch', 'score', 'torii', 'done'];
+const HEARTBEAT_MS = 15000;
+
+/**
+ * Server-sent events for one audit: its current state, a `progress` event
+ * per stage (fetch, score, torii) with the partial report, then `complete`
+ * or `failed` with the full result, after which the stream closes
+ */
+export async function GET(request: Request, { params }: { params: { id: string } }) {
+  let queue: AuditQueue;
+  try {
+    queue = await getAuditQueue();
+  } catch (error) {
+    return queueUnavailable(error);
+  }
+
+  const encoder = new TextEncoder();
+  let stop = () => {};
+
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      let closed = false;
+      let lastAttempt = -1;
+      let lastStage = -1;
+
+      const close = () => {
+        if (closed) return;
+        closed = true;
+        unwatch();
+        clearInterval(heartbeat);
+        request.signal.removeEventListener('abort', close);
+        try {
+          controller.close();
+        } catch {
+          // Already closed by the client disconnecting
+        }
+      };
+
+      const send = (status: JobStatus) => {
+        if (closed) return;
+        const result = toAuditResult(status);
+        if (status.state === 'pending') {
+          // The snapshot read below can land after a newer progress event. A
+          // retry starts its stages over, so order by attempt, then stage
+          const attempt = status.progress?.attempt ?? 0;
+          const stage = STAGES.indexOf(result.stage ?? 'queued');
+          if (attempt < lastAttempt || (attempt === lastAttempt && stage < lastStage)) return;
+          lastAttempt = attempt;
+          lastStage = stage;
+        }
+
+        const event = status.state === 'pending' ? 'progress' : status.state;
+        controller.enqueue(encoder.encode(`event: ${event}\ndata: ${JSON.stringify(result)}\n\n`));
+        if (status.state !== 'pending') close();
+      };
+
+      // Watch before reading the current state so no update falls in between
+      const unwatch = queue.watchAudit(params.id, send);
+      const heartbeat = setInterval(() => {
+        if (!closed) controller.enqueue(encoder.encode(': keep-alive\n\n'));
+      }, HEARTBEAT_MS);
+      stop = close;
+      request.signal.addEventListener('abort', close);
+
+      try {
+        const status = await getAuditStatus(params.id);
+        send(status ?? { jobId: params.id, state: 'failed', error: 'Audit not found' });
+      } catch (error) {
+        send({ jobId: params.id, state: 'failed', error: 'Audit service unavailable' });
+      }
+    },
+    cancel() {
+      stop();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      Connection: 'keep-alive',
+      'X-Accel-Buffering': 'no',
+    },
+  });
+}
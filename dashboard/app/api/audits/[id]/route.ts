@@ -0,0 +1,20 @@
+import { NextResponse } from 'next/server';
+import { getAuditStatus, queueUnavailable, toAuditResult } from '@/lib/server/audit-queue';
+
+export const runtime = 'nodejs';
+export const dynamic = 'force-dynamic';
+
+/**
+ * Current state of an audit job or stored report
+ */
+export async function GET(_request: Request, { params }: { params: { id: string } }) {
+  try {
+    const status = await getAuditStatus(params.id);
+    if (!status) {
+      return NextResponse.json({ error: 'Audit not found' }, { status: 404 });
+    }
+    return NextResponse.json(toAuditResult(status));
+  } catch (error) {
+    return queueUnavailable(error);
+  }
+}
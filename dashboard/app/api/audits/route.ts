@@ -0,0 +1,112 @@
+import { createHash } from 'node:crypto';
+import { NextResponse } from 'next/server';
+import { getAuditQueue, queueUnavailable, toAuditResult } from '@/lib/server/audit-queue';
+import { verifyPayment } from '@/lib/server/payment';
+import type { AuditReport, ReportPage } from '../../../../agent-auditor/types';
+
+export const runtime = 'nodejs';
+export const dynamic = 'force-dynamic';
+
+const SOLANA_ADDRESS = /^[1-9A-HJ-NP-Za-km-z]{32,44}$/;
+const RISK_LEVELS: AuditReport['riskLevel'][] = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL'];
+const DEFAULT_PAGE_SIZE = 20;
+const MAX_PAGE_SIZE = 100;
+
+/**
+ * Queue an audit and return its job ID at once; follow it at
+ * /api/audits/[id]/events. Each audit needs a verified x402 payment proof,
+ * spent once; unpaid audits are only accepted with AUDIT_DEMO_MODE=true.
+ * A payment is only spent on a new job: if the token already has an audit
+ * waiting or running, its job ID is returned and the payment stays unused.
+ */
+export async function POST(request: Request) {
+  const body = await request.json().catch(() => null);
+  const tokenAddress = typeof body?.tokenAddress === 'string' ? body.tokenAddress.trim() : '';
+  if (!SOLANA_ADDRESS.test(tokenAddress)) {
+    return NextResponse.json({ error: 'Invalid Solana address format' }, { status: 400 });
+  }
+
+  const unpaidDemo = !body?.paymentProof && process.env.AUDIT_DEMO_MODE === 'true';
+  const payment = unpaidDemo ? null : await verifyPayment(body?.paymentProof);
+  if (payment && !payment.valid) {
+    return NextResponse.json({ error: 'Payment required', reason: payment.reason }, { status: 402 });
+  }
+
+  try {
+    const queue = await getAuditQueue();
+    if (payment && !(await queue.claimPayment(payment.signature))) {
+      return NextResponse.json({ error: 'Payment required', reason: 'Payment already used' }, { status: 402 });
+    }
+    // Bull runs priority 1 first, so requested audits go ahead of scheduled re-audits
+    const job = await queue
+      .addAudit(tokenAddress, 1, undefined, { paymentSignature: payment?.signature })
+      .catch(async (error) => {
+        if (payment) await queue.releasePayment(payment.signature).catch(() => undefined);
+        throw error;
+      });
+    // An audit of this token already in progress is shared, not paid for again
+    if (payment && job.data.paymentSignature !== payment.signature) {
+      await queue.releasePayment(payment.signature);
+    }
+    return NextResponse.json({ jobId: job.id }, { status: 202 });
+  } catch (error) {
+    return queueUnavailable(error);
+  }
+}
+
+/**
+ * Recent audits, newest first, one page at a time. Query parameters:
+ * `limit` (default 20, max 100), `cursor` (nextCursor of the previous page),
+ * `risk` (tokens whose latest audit is at that level) and `since`/`until`
+ * (ISO date or epoch ms). Pages are cached briefly and served stale while
+ * revalidating; pages past the first rarely change, so they are cached longer.
+ */
+export async function GET(request: Request) {
+  const params = new URL(request.url).searchParams;
+  const limit = Math.min(Math.max(parseInt(params.get('limit') || '', 10) || DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+  const cursor = params.get('cursor') || undefined;
+  const risk = params.get('risk')?.toUpperCase();
+  const since = parseTime(params.get('since'));
+  const until = parseTime(params.get('until'));
+
+  if (risk && !RISK_LEVELS.includes(risk as AuditReport['riskLevel'])) {
+    return NextResponse.json({ error: `risk must be one of ${RISK_LEVELS.join(', ').toLowerCase()}` }, { status: 400 });
+  }
+  if (Number.isNaN(since) || Number.isNaN(until)) {
+    return NextResponse.json({ error: 'since and until must be ISO dates or epoch milliseconds' }, { status: 400 });
+  }
+
+  let page: ReportPage;
+  try {
+    const store = (await getAuditQueue()).getReportStore();
+    const query = { limit, cursor, since, until };
+    page = risk ? await store.getByRiskLevel(risk as AuditReport['riskLevel'], query) : await store.getRecent(query);
+  } catch (error) {
+    return queueUnavailable(error);
+  }
+
+  // Report IDs are immutable, so the IDs on the page identify its content
+  const etag = `"${createHash('sha1').update(page.items.map(item => item.id).join(',')).digest('base64url')}"`;
+  const headers = {
+    'Cache-Control': cursor
+      ? 'public, max-age=60, stale-while-revalidate=600'
+      : 'public, max-age=5, stale-while-revalidate=60',
+    ETag: etag,
+  };
+  if (request.headers.get('if-none-match') === etag) {
+    return new Response(null, { status: 304, headers });
+  }
+
+  return NextResponse.json(
+    {
+      audits: page.items.map(({ id, report }) => toAuditResult({ jobId: id, state: 'complete', report })),
+      nextCursor: page.nextCursor,
+    },
+    { headers },
+  );
+}
+
+function parseTime(value: string | null): number | undefined {
+  if (!value) return undefined;
+  return /^\d+$/.test(value) ? Number(value) : Date.parse(value);
+}
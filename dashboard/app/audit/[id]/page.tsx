@@ -7,39 +7,29 @@ import { Button } from '@/components/ui/button';
 import { Alert, AlertDescription } from '@/components/ui/alert';
 import { StatusBadge } from '@/components/status-badge';
 import { RiskScore } from '@/components/risk-score';
-import { getAudit } from '@/lib/api';
-import type { AuditResult } from '@/lib/types';
+import { watchAudit } from '@/lib/api';
+import type { AuditResult, AuditStage } from '@/lib/types';
+
+const STAGES: { stage: AuditStage; label: string }[] = [
+  { stage: 'fetch', label: 'Fetching on-chain data' },
+  { stage: 'score', label: 'Scoring risk' },
+  { stage: 'torii', label: 'Torii compliance analysis' },
+];
+const STAGE_ORDER: AuditStage[] = ['queued', 'fetch', 'score', 'torii', 'done'];
 
 export default function AuditPage() {
   const params = useParams();
   const router = useRouter();
   const [audit, setAudit] = useState<AuditResult | null>(null);
   const [loading, setLoading] = useState(true);
-  const [error, setError] = useState('');
 
   useEffect(() => {
-    const fetchAudit = async () => {
-      try {
-        const id = params.id as string;
-        let result = await getAudit(id);
-        
-        // Retry up to 5 times if audit not found (it might be being created)
-        let retries = 0;
-        while (!result && retries < 5) {
-          await new Promise(resolve => setTimeout(resolve, 500));
-          result = await getAudit(id);
-          retries++;
-        }
-        
-        setAudit(result);
-      } catch {
-        setError('Failed to load audit results');
-      } finally {
-        setLoading(false);
-      }
-    };
-
-    fetchAudit();
+    // Progress is pushed as each stage finishes, so partial results render as they arrive
+    const stop = watchAudit(decodeURIComponent(params.id as string), (result) => {
+      setAudit(result);
+      setLoading(false);
+    });
+    return stop;
   }, [params.id]);
 
   if (loading) {
@@ -53,12 +43,12 @@ export default function AuditPage() {
     );
   }
 
-  if (error || !audit) {
+  if (!audit) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-purple-900 via-violet-900 to-black flex items-center justify-center">
         <Card className="max-w-md w-full mx-4 bg-purple-900/50 border-purple-700">
           <CardContent className="pt-6">
-            <p className="text-red-400 mb-4">{error || 'Audit not found'}</p>
+            <p className="text-red-400 mb-4">Audit not found</p>
             <Button onClick={() => router.push('/')} className="w-full bg-gradient-to-r from-purple-600 to-violet-600 hover:from-purple-700 hover:to-violet-700">
               Back to Home
             </Button>
@@ -101,25 +91,49 @@ export default function AuditPage() {
                 <p className="font-mono text-sm break-all text-purple-100">{audit.tokenAddress}</p>
               </div>
               
-              {audit.status === 'complete' && (
+              {audit.status === 'pending' && (
+                <ol className="space-y-2 my-4">
+                  {STAGES.map(({ stage, label }) => {
+                    const current = STAGE_ORDER.indexOf(audit.stage ?? 'queued');
+                    const position = STAGE_ORDER.indexOf(stage);
+                    return (
+                      <li
+                        key={stage}
+                        className={`text-sm flex items-center gap-2 ${
+                          position < current ? 'text-green-300' : position === current ? 'text-purple-100' : 'text-purple-400'
+                        }`}
+                      >
+                        <span>{position < current ? '✓' : position === current ? '…' : '○'}</span>
+                        {label}
+                      </li>
+                    );
+                  })}
+                </ol>
+              )}
+
+              {audit.riskScore !== undefined && (
                 <>
                   <div className="grid grid-cols-1 md:grid-cols-2 gap-4 my-6">
                     <RiskScore score={audit.riskScore} />
-                    <div className="text-center p-4 bg-gradient-to-br from-green-500/20 to-emerald-500/20 rounded-lg border border-green-500/30 solana-glow-green">
-                      <div className="text-3xl font-bold bg-gradient-to-r from-green-400 to-emerald-400 bg-clip-text text-transparent">
-                        {Math.round(audit.compliance.confidence * 100)}%
+                    {audit.compliance && (
+                      <div className="text-center p-4 bg-gradient-to-br from-green-500/20 to-emerald-500/20 rounded-lg border border-green-500/30 solana-glow-green">
+                        <div className="text-3xl font-bold bg-gradient-to-r from-green-400 to-emerald-400 bg-clip-text text-transparent">
+                          {Math.round(audit.compliance.confidence * 100)}%
+                        </div>
+                        <div className="text-sm text-green-300 mt-1">Confidence</div>
                       </div>
-                      <div className="text-sm text-green-300 mt-1">Confidence</div>
-                    </div>
+                    )}
                   </div>
 
-                  <div className="mb-6">
-                    <h3 className="font-semibold text-lg mb-2 text-purple-100">📋 Analysis</h3>
-                    <div className="bg-purple-800/30 p-4 rounded-lg border border-purple-700">
-                      <p className="text-sm font-medium text-purple-200 mb-1">Category: {audit.compliance.category}</p>
-                      <p className="text-sm text-purple-300">{audit.compliance.reasoning}</p>
+                  {audit.compliance && (
+                    <div className="mb-6">
+                      <h3 className="font-semibold text-lg mb-2 text-purple-100">📋 Analysis</h3>
+                      <div className="bg-purple-800/30 p-4 rounded-lg border border-purple-700">
+                        <p className="text-sm font-medium text-purple-200 mb-1">Category: {audit.compliance.category}</p>
+                        <p className="text-sm text-purple-300">{audit.compliance.reasoning}</p>
+                      </div>
                     </div>
-                  </div>
+                  )}
 
                   {audit.redFlags.length > 0 && (
                     <div>
@@ -143,7 +157,7 @@ export default function AuditPage() {
               {audit.status === 'failed' && (
                 <div className="bg-red-900/30 p-4 rounded border-l-4 border-red-500">
                   <p className="text-red-200 font-medium">Audit Failed</p>
-                  <p className="text-red-300 text-sm mt-1">An error occurred during the audit. Please try again.</p>
+                  <p className="text-red-300 text-sm mt-1">{audit.error || 'An error occurred during the audit. Please try again.'}</p>
                 </div>
               )}
 
@@ -0,0 +1,117 @@
+'use client';
+
+import { useState } from 'react';
+import Link from 'next/link';
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
+import { Button } from '@/components/ui/button';
+import { Input } from '@/components/ui/input';
+import { StatusBadge } from '@/components/status-badge';
+import { RiskScore } from '@/components/risk-score';
+import { useAuditHistory } from '@/lib/queries';
+import type { RiskLevel } from '@/lib/types';
+
+const RISK_LEVELS: RiskLevel[] = ['low', 'medium', 'high', 'critical'];
+const PAGE_SIZE = 20;
+
+export default function HistoryPage() {
+  const [riskLevel, setRiskLevel] = useState<RiskLevel | ''>('');
+  const [since, setSince] = useState('');
+  const [until, setUntil] = useState('');
+
+  const { data, error, isPending, fetchNextPage, hasNextPage, isFetchingNextPage } = useAuditHistory({
+    limit: PAGE_SIZE,
+    riskLevel: riskLevel || undefined,
+    // Whole days, in local time
+    since: since ? new Date(`${since}T00:00:00`).toISOString() : undefined,
+    until: until ? new Date(`${until}T23:59:59.999`).toISOString() : undefined,
+  });
+  const audits = data?.pages.flatMap((page) => page.audits) ?? [];
+
+  return (
+    <Card className="max-w-4xl mx-auto bg-purple-900/50 border-purple-600 backdrop-blur-sm">
+      <CardHeader>
+        <CardTitle className="text-purple-100">Audit History</CardTitle>
+        <CardDescription className="text-purple-300">Every token compliance analysis, newest first</CardDescription>
+      </CardHeader>
+      <CardContent>
+        <div className="grid grid-cols-1 md:grid-cols-3 gap-4 mb-6">
+          <select
+            value={riskLevel}
+            onChange={(e) => setRiskLevel(e.target.value as RiskLevel | '')}
+            className="h-10 rounded-md px-3 text-sm bg-purple-950/50 border border-purple-500 text-purple-100"
+          >
+            <option value="">All risk levels</option>
+            {RISK_LEVELS.map((level) => (
+              <option key={level} value={level}>
+                {level.charAt(0).toUpperCase() + level.slice(1)} risk (current)
+              </option>
+            ))}
+          </select>
+          <Input
+            type="date"
+            value={since}
+            onChange={(e) => setSince(e.target.value)}
+            aria-label="From"
+            className="bg-purple-950/50 border-purple-500 text-purple-100"
+          />
+          <Input
+            type="date"
+            value={until}
+            onChange={(e) => setUntil(e.target.value)}
+            aria-label="To"
+            className="bg-purple-950/50 border-purple-500 text-purple-100"
+          />
+        </div>
+
+        {isPending && <p className="text-purple-300 text-sm">Loading audits...</p>}
+        {error && <p className="text-red-400 text-sm">{error.message}</p>}
+        {!isPending && !error && audits.length === 0 && (
+          <p className="text-purple-300 text-sm">No audits match these filters.</p>
+        )}
+
+        <div className="space-y-4">
+          {audits.map((audit) => (
+            <Link key={audit.id} href={`/audit/${encodeURIComponent(audit.id)}`} className="block">
+              <Card className="hover:shadow-lg hover:shadow-purple-500/30 transition-all cursor-pointer border-purple-600 hover:border-green-400 bg-purple-950/50">
+                <CardContent className="pt-6">
+                  <div className="flex items-center justify-between">
+                    <div className="space-y-1 flex-1">
+                      <div className="flex items-center gap-2">
+                        <span className="font-mono text-sm text-purple-300">
+                          {audit.tokenAddress.slice(0, 10)}...{audit.tokenAddress.slice(-8)}
+                        </span>
+                        <StatusBadge status={audit.status} />
+                      </div>
+                      {audit.tokenName && (
+                        <p className="font-semibold text-purple-100">{audit.tokenName} ({audit.tokenSymbol})</p>
+                      )}
+                      <p className="text-xs text-purple-400">{new Date(audit.createdAt).toLocaleString()}</p>
+                    </div>
+                    {audit.riskScore !== undefined && (
+                      <div className="w-48">
+                        <RiskScore score={audit.riskScore} size="sm" showLabel={false} />
+                      </div>
+                    )}
+                  </div>
+                </CardContent>
+              </Card>
+            </Link>
+          ))}
+        </div>
+
+        {hasNextPage && (
+          <div className="mt-6 text-center">
+            <Button
+              variant="outline"
+              onClick={() => fetchNextPage()}
+              disabled={isFetchingNextPage}
+              className="border-purple-500 text-purple-200 hover:bg-purple-800/50 hover:border-green-400 hover:text-white"
+            >
+              {isFetchingNextPage ? 'Loading...' : 'Load More'}
+            </Button>
+          </div>
+        )}
+      </CardContent>
+    </Card>
+  );
+}
@@ -8,8 +8,8 @@ import { Button } from '@/components/ui/button';
 import { Alert, AlertDescription } from '@/components/ui/alert';
 import { Skeleton } from '@/components/ui/skeleton';
 import { Shield, Search, AlertTriangle, CheckCircle, TrendingUp, DollarSign } from 'lucide-react';
-import { submitAudit, getAudits } from '@/lib/api';
-import { AuditResult } from '@/lib/types';
+import { submitAudit } from '@/lib/api';
+import { useRecentAudits } from '@/lib/queries';
 import { useRouter } from 'next/navigation';
 import { StatusBadge } from '@/components/status-badge';
 import { RiskScore } from '@/components/risk-score';
@@ -25,7 +25,6 @@ export default function Home() {
   const [tokenAddress, setTokenAddress] = useState('');
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
-  const [recentAudits, setRecentAudits] = useState<AuditResult[]>([]);
   const [showPaymentModal, setShowPaymentModal] = useState(false);
   const [pendingToken, setPendingToken] = useState('');
   const [demoMode, setDemoMode] = useState(false);
@@ -69,20 +68,19 @@ export default function Home() {
     setLoading(true);
     setError('');
     try {
-      const result = await submitAudit(address, paymentProof);
-      router.push(`/audit/${result.id}`);
-    } catch {
-      setError('Failed to submit audit. Please try again.');
+      const { jobId } = await submitAudit(address, paymentProof);
+      router.push(`/audit/${encodeURIComponent(jobId)}`);
+    } catch (err) {
+      setError(err instanceof Error ? `Failed to submit audit: ${err.message}` : 'Failed to submit audit. Please try again.');
     } finally {
       setLoading(false);
       setPendingToken('');
     }
   };
 
-  // Load recent audits on mount
-  useState(() => {
-    getAudits().then(audits => setRecentAudits(audits.slice(0, 3)));
-  });
+  // Only the first three are fetched, however long the history
+  const { data: recent } = useRecentAudits({ limit: 3 });
+  const recentAudits = recent?.audits ?? [];
 
   return (
     <div className="space-y-8">
@@ -338,7 +336,7 @@ export default function Home() {
               {recentAudits.map((audit) => (
                 <Link 
                   key={audit.id} 
-                  href={`/audit/${audit.id}`}
+                  href={`/audit/${encodeURIComponent(audit.id)}`}
                   className="block"
                 >
                   <Card className="hover:shadow-lg hover:shadow-purple-500/30 transition-all cursor-pointer border-purple-600 hover:border-green-400 bg-purple-950/50">
@@ -355,7 +353,7 @@ export default function Home() {
                             <p className="font-semibold text-purple-100">{audit.tokenName} ({audit.tokenSymbol})</p>
                           )}
                         </div>
-                        {audit.status === 'complete' && (
+                        {audit.riskScore !== undefined && (
                           <div className="w-48">
                             <RiskScore score={audit.riskScore} size="sm" showLabel={false} />
                           </div>
@@ -0,0 +1,21 @@
+'use client';
+
+import { useState, ReactNode } from 'react';
+import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
+
+export function QueryProvider({ children }: { children: ReactNode }) {
+  // One client per browser session; cached pages render at once and refetch in the background once stale
+  const [queryClient] = useState(
+    () =>
+      new QueryClient({
+        defaultOptions: {
+          queries: {
+            staleTime: 10_000,
+            refetchOnWindowFocus: true,
+          },
+        },
+      })
+  );
+
+  return <QueryClientProvider client={queryClient}>{children}</QueryClientProvider>;
+}
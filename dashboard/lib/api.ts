@@ -1,129 +1,66 @@
-import { AuditResult } from './types';
+import { AuditPage, AuditQuery, AuditResult } from './types';
 
-// Mock API - Replace with actual API calls
-const mockAudits: AuditResult[] = [
-  {
-    id: '1',
-    tokenAddress: '0x1234567890abcdef1234567890abcdef12345678',
-    tokenName: 'Safe Token',
-    tokenSymbol: 'SAFE',
-    status: 'complete',
-    riskScore: 25,
-    riskLevel: 'low',
-    compliance: {
-      category: 'Compliant',
-      confidence: 0.95,
-      reasoning: 'Token follows standard ERC-20 implementation with no suspicious patterns detected.'
-    },
-    redFlags: [],
-    createdAt: new Date(Date.now() - 86400000).toISOString(),
-    completedAt: new Date(Date.now() - 86000000).toISOString(),
-  },
-  {
-    id: '2',
-    tokenAddress: '0xabcdef1234567890abcdef1234567890abcdef12',
-    tokenName: 'Suspicious Token',
-    tokenSymbol: 'SUS',
-    status: 'complete',
-    riskScore: 85,
-    riskLevel: 'high',
-    compliance: {
-      category: 'High Risk',
-      confidence: 0.89,
-      reasoning: 'Multiple red flags detected including hidden minting functions and suspicious ownership transfers.'
-    },
-    redFlags: [
-      {
-        id: 'rf1',
-        severity: 'high',
-        category: 'Hidden Functions',
-        description: 'Hidden mint function detected',
-        details: 'Contract contains a mint function that is not visible in the standard interface.'
-      },
-      {
-        id: 'rf2',
-        severity: 'medium',
-        category: 'Ownership',
-        description: 'Centralized ownership',
-        details: 'Single address has excessive control over contract functions.'
-      }
-    ],
-    createdAt: new Date(Date.now() - 172800000).toISOString(),
-    completedAt: new Date(Date.now() - 172400000).toISOString(),
+async function request<T>(url: string, init?: RequestInit): Promise<T> {
+  const response = await fetch(url, init);
+  if (!response.ok) {
+    const body = await response.json().catch(() => null);
+    throw new Error(body?.reason || body?.error || `Request failed (${response.status})`);
   }
-];
+  return response.json();
+}
 
-export async function submitAudit(tokenAddress: string, paymentProof?: string): Promise<AuditResult> {
-  // Simulate API call
-  await new Promise(resolve => setTimeout(resolve, 2000));
-  
-  // In production, verify payment with backend API
-  if (paymentProof) {
-    console.log('Payment verified:', JSON.parse(paymentProof));
-    // Backend would verify the payment here
-  }
-  
-  // Simulate BONK token audit results
-  const newAudit: AuditResult = {
-    id: Date.now().toString(),
-    tokenAddress,
-    tokenName: 'BONK',
-    tokenSymbol: 'BONK',
-    status: 'complete',
-    riskScore: 55,
-    riskLevel: 'medium',
-    compliance: {
-      category: 'Medium Risk - PSA Registration Recommended',
-      confidence: 0.82,
-      reasoning: 'Token exhibits characteristics requiring Payment Services Act consideration. Holder concentration and centralized control present regulatory compliance concerns.'
-    },
-    redFlags: [
-      {
-        id: 'rf1',
-        severity: 'high',
-        category: 'Holder Concentration',
-        description: 'Top holder owns 35% of supply',
-        details: 'Excessive concentration in single wallet creates market manipulation risk and raises concerns under PSA Article 2 regarding proper asset custody.'
-      },
-      {
-        id: 'rf2',
-        severity: 'medium',
-        category: 'Centralized Authority',
-        description: 'Single wallet controls upgrade authority',
-        details: 'Upgrade authority concentrated in one address. Consider multi-signature governance per FIEA guidelines on operational transparency.'
-      },
-      {
-        id: 'rf3',
-        severity: 'low',
-        category: 'Liquidity',
-        description: 'Limited liquidity depth',
-        details: 'Potential for price volatility. Recommend maintaining adequate market depth to meet PSA user protection standards.'
-      }
-    ],
-    createdAt: new Date().toISOString(),
-    completedAt: new Date(Date.now() + 2000).toISOString(),
-  };
-  
-  mockAudits.unshift(newAudit);
-  return newAudit;
+/**
+ * Queue an audit; resolves with its job ID as soon as it is queued (follow
+ * it with watchAudit)
+ */
+export async function submitAudit(tokenAddress: string, paymentProof?: string): Promise<{ jobId: string }> {
+  return request('/api/audits', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ tokenAddress, paymentProof }),
+  });
 }
 
 export async function getAudit(id: string): Promise<AuditResult | null> {
-  // Simulate API call
-  await new Promise(resolve => setTimeout(resolve, 500));
-  return mockAudits.find(audit => audit.id === id) || null;
+  const response = await fetch(`/api/audits/${encodeURIComponent(id)}`);
+  if (response.status === 404) return null;
+  if (!response.ok) throw new Error(`Request failed (${response.status})`);
+  return response.json();
 }
 
-export async function getAudits(): Promise<AuditResult[]> {
-  // Simulate API call
-  await new Promise(resolve => setTimeout(resolve, 500));
-  return [...mockAudits];
+/**
+ * One page of recent audits, newest first; pass nextCursor back for the next
+ */
+export async function getAudits(query: AuditQuery = {}): Promise<AuditPage> {
+  const params = new URLSearchParams();
+  if (query.limit) params.set('limit', String(query.limit));
+  if (query.cursor) params.set('cursor', query.cursor);
+  if (query.riskLevel) params.set('risk', query.riskLevel);
+  if (query.since) params.set('since', query.since);
+  if (query.until) params.set('until', query.until);
+  return request(`/api/audits?${params}`);
 }
 
 export async function getAuditByAddress(address: string): Promise<AuditResult | null> {
-  // Simulate API call
-  await new Promise(resolve => setTimeout(resolve, 500));
-  return mockAudits.find(audit => 
-    audit.tokenAddress.toLowerCase() === address.toLowerCase()
-  ) || null;
+  return getAudit(`audit:${address}`);
+}
+
+/**
+ * Follow an audit over server-sent events: onUpdate gets the current state,
+ * then the partial result after each stage, then the final result.
+ * Returns a function that stops watching.
+ */
+export function watchAudit(id: string, onUpdate: (audit: AuditResult) => void): () => void {
+  const source = new EventSource(`/api/audits/${encodeURIComponent(id)}/events`);
+  const update = (event: MessageEvent<string>) => onUpdate(JSON.parse(event.data));
+  const finish = (event: MessageEvent<string>) => {
+    // Stop here, or EventSource reconnects when the server closes the stream
+    source.close();
+    update(event);
+  };
+
+  source.addEventListener('progress', update);
+  source.addEventListener('complete', finish);
+  source.addEventListener('failed', finish);
+  return () => source.close();
 }
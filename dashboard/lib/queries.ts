@@ -0,0 +1,25 @@
+import { useInfiniteQuery, useQuery } from '@tanstack/react-query';
+import { getAudits } from './api';
+import type { AuditQuery } from './types';
+
+/**
+ * First page of recent audits (stale-while-revalidate via React Query)
+ */
+export function useRecentAudits(query: Omit<AuditQuery, 'cursor'> = {}) {
+  return useQuery({
+    queryKey: ['audits', query],
+    queryFn: () => getAudits(query),
+  });
+}
+
+/**
+ * Recent audits a page at a time, following nextCursor
+ */
+export function useAuditHistory(query: Omit<AuditQuery, 'cursor'> = {}) {
+  return useInfiniteQuery({
+    queryKey: ['audits', 'history', query],
+    queryFn: ({ pageParam }) => getAudits({ ...query, cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (page) => page.nextCursor,
+  });
+}
@@ -0,0 +1,77 @@
+import { createAuditQueue, type AuditQueue } from '../../../agent-auditor/queue';
+import type { AuditReport, AuditStatus as JobStatus } from '../../../agent-auditor/types';
+import type { AuditResult, AuditStage, RiskLevel } from '../types';
+
+// Survives dev-server hot reloads, so each reload doesn't open new Redis connections
+const globalForQueue = globalThis as unknown as { auditQueue?: Promise<AuditQueue> };
+
+/**
+ * Producer-only audit queue shared by the route handlers (server only)
+ */
+export function getAuditQueue(): Promise<AuditQueue> {
+  // Producer only: audits (and Torii calls) run in the agent-auditor workers
+  globalForQueue.auditQueue ??= createAuditQueue(undefined, {
+    redis: {
+      host: process.env.REDIS_HOST || 'localhost',
+      port: parseInt(process.env.REDIS_PORT || '', 10) || 6379,
+    },
+    processJobs: false,
+  });
+  return globalForQueue.auditQueue;
+}
+
+/**
+ * An audit job's status, or a stored report's (report IDs from the recent
+ * audits list), or null if the ID is unknown
+ */
+export async function getAuditStatus(id: string): Promise<JobStatus | null> {
+  const queue = await getAuditQueue();
+  const status = await queue.getAuditStatus(id);
+  if (status) return status;
+
+  const stored = await queue.getReportStore().get(id);
+  return stored ? { jobId: id, state: 'complete', report: stored.report } : null;
+}
+
+/**
+ * Dashboard view of an audit job: whatever the report holds so far
+ */
+export function toAuditResult(status: JobStatus): AuditResult {
+  const report: Partial<AuditReport> = status.report ?? status.progress?.partial ?? {};
+  const torii = report.toriiApiResponse;
+  const stage: AuditStage = status.state === 'pending' ? status.progress?.stage ?? 'queued' : 'done';
+
+  return {
+    id: status.jobId,
+    tokenAddress: report.tokenAddress ?? status.jobId.replace(/^audit:/, ''),
+    tokenName: report.tokenName,
+    tokenSymbol: report.tokenSymbol,
+    status: status.state,
+    stage,
+    riskScore: report.overallRiskScore,
+    riskLevel: report.riskLevel?.toLowerCase() as RiskLevel | undefined,
+    compliance: report.japanCompliance && {
+      category: torii?.classification ?? report.japanCompliance.classification,
+      confidence: torii?.confidence ?? 0.5,
+      reasoning: report.japanCompliance.regulatoryStatus,
+    },
+    redFlags: (report.redFlags ?? []).map((flag, i) => ({
+      id: `rf${i + 1}`,
+      severity: flag.severity.toLowerCase() as RiskLevel,
+      category: flag.category,
+      description: flag.description,
+      details: flag.impact,
+    })),
+    createdAt: new Date(report.timestamp ?? Date.now()).toISOString(),
+    completedAt: status.state === 'complete' && report.timestamp ? new Date(report.timestamp).toISOString() : undefined,
+    error: status.error,
+  };
+}
+
+/**
+ * 503 for requests made while the queue (Redis) can't be reached
+ */
+export function queueUnavailable(error: unknown): Response {
+  console.error('Audit queue unavailable:', error instanceof Error ? error.message : error);
+  return Response.json({ error: 'Audit service unavailable' }, { status: 503 });
+}
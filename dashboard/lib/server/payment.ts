@@ -0,0 +1,69 @@
+import { Connection, type TokenBalance } from '@solana/web3.js';
+import { getX402SolanaConfig } from '../x402-solana-config';
+
+export type PaymentVerification = { valid: true; payer: string; signature: string } | { valid: false; reason: string };
+
+// Survives dev-server hot reloads, like the audit queue
+const globalForPayment = globalThis as unknown as { paymentConnection?: Connection };
+
+function getConnection(): Connection {
+  globalForPayment.paymentConnection ??= new Connection(
+    process.env.SOLANA_RPC_URL || getX402SolanaConfig().RPC_ENDPOINT,
+    'confirmed',
+  );
+  return globalForPayment.paymentConnection;
+}
+
+/**
+ * Verify the x402 payment proof the payment modal sends for an audit (server
+ * only): the same checks as torii-api's verifyPayment, then the transaction
+ * itself, which must be confirmed, signed by the payer and have moved at
+ * least the audit price in USDC to the pay-to wallet. Nothing on chain ties
+ * a payment to a token, so any unspent payment buys one audit of any token.
+ */
+export async function verifyPayment(paymentProof: unknown): Promise<PaymentVerification> {
+  if (!paymentProof) return { valid: false, reason: 'No payment proof provided' };
+  if (typeof paymentProof !== 'string') return { valid: false, reason: 'Malformed payment proof' };
+
+  let proof;
+  try {
+    proof = JSON.parse(paymentProof);
+  } catch {
+    return { valid: false, reason: 'Malformed payment proof' };
+  }
+
+  const config = getX402SolanaConfig();
+  if (typeof proof?.signature !== 'string' || typeof proof.from !== 'string' || proof.to !== config.PAY_TO_ADDRESS) {
+    return { valid: false, reason: 'Invalid payment proof structure' };
+  }
+
+  let transaction;
+  try {
+    transaction = await getConnection().getParsedTransaction(proof.signature, {
+      commitment: 'confirmed',
+      maxSupportedTransactionVersion: 0,
+    });
+  } catch {
+    return { valid: false, reason: 'Payment transaction could not be read' };
+  }
+  if (!transaction?.meta || transaction.meta.err) {
+    return { valid: false, reason: 'Payment transaction not found or failed' };
+  }
+
+  const signer = transaction.transaction.message.accountKeys.find((key) => key.signer);
+  if (signer?.pubkey.toBase58() !== proof.from) {
+    return { valid: false, reason: 'Payment was not signed by the payer' };
+  }
+
+  // What the pay-to wallet's USDC balance gained in this transaction
+  const received = (balances?: TokenBalance[] | null) =>
+    (balances ?? [])
+      .filter((balance) => balance.mint === config.USDC_MINT && balance.owner === config.PAY_TO_ADDRESS)
+      .reduce((total, balance) => total + BigInt(balance.uiTokenAmount.amount), BigInt(0));
+  const paid = received(transaction.meta.postTokenBalances) - received(transaction.meta.preTokenBalances);
+  if (paid < BigInt(config.AUDIT_PRICE_LAMPORTS)) {
+    return { valid: false, reason: `Payment below the ${config.AUDIT_PRICE} audit price` };
+  }
+
+  return { valid: true, payer: proof.from, signature: proof.signature };
+}
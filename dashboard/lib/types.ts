@@ -1,5 +1,8 @@
 export type AuditStatus = 'pending' | 'complete' | 'failed';
 
+// Where a pending audit is: waiting, fetching on-chain data, scoring, asking Torii
+export type AuditStage = 'queued' | 'fetch' | 'score' | 'torii' | 'done';
+
 export type RiskLevel = 'low' | 'medium' | 'high' | 'critical';
 
 export interface RedFlag {
@@ -22,10 +25,26 @@ export interface AuditResult {
   tokenName?: string;
   tokenSymbol?: string;
   status: AuditStatus;
-  riskScore: number;
-  riskLevel: RiskLevel;
-  compliance: ComplianceClassification;
+  stage?: AuditStage;
+  // Filled in as the audit progresses; all present once complete
+  riskScore?: number;
+  riskLevel?: RiskLevel;
+  compliance?: ComplianceClassification;
   redFlags: RedFlag[];
   createdAt: string;
   completedAt?: string;
+  error?: string;
+}
+
+export interface AuditQuery {
+  limit?: number;
+  cursor?: string;
+  riskLevel?: RiskLevel;
+  since?: string; // ISO date
+  until?: string; // ISO date
+}
+
+export interface AuditPage {
+  audits: AuditResult[];
+  nextCursor?: string; // absent on the last page
 }
@@ -1,4 +1,19 @@
+import { fileURLToPath } from 'node:url';
+
 /** @type {import('next').NextConfig} */
-const nextConfig = {};
+const nextConfig = {
+  experimental: {
+    // The API routes run the agent-auditor queue from ../agent-auditor
+    externalDir: true,
+    serverComponentsExternalPackages: ['bull', '@solana/web3.js', '@solana/spl-token'],
+  },
+  webpack: (config) => {
+    // agent-auditor is ESM TypeScript and imports its modules as './x.js'
+    config.resolve.extensionAlias = { '.js': ['.ts', '.js'] };
+    // ...and its packages resolve from here, as it has no node_modules of its own
+    config.resolve.modules = [...(config.resolve.modules || ['node_modules']), fileURLToPath(new URL('./node_modules', import.meta.url))];
+    return config;
+  },
+};
 
 export default nextConfig;
@@ -0,0 +1,213 @@
+/**
+ * Load Generation Primitives
+ * Closed-loop (fixed concurrency) and open-loop (fixed arrival rate) drivers
+ * with latency percentiles, shared by the performance harness.
+ */
+
+import http from 'node:http';
+
+/**
+ * Growable Float64Array of latency samples (ms)
+ */
+class Samples {
+  constructor() {
+    this.values = new Float64Array(4096);
+    this.length = 0;
+  }
+
+  push(value) {
+    if (this.length === this.values.length) {
+      const grown = new Float64Array(this.values.length * 2);
+      grown.set(this.values);
+      this.values = grown;
+    }
+    this.values[this.length++] = value;
+  }
+
+  sorted() {
+    return this.values.slice(0, this.length).sort();
+  }
+}
+
+/**
+ * Nearest-rank percentile of ascending samples
+ */
+export function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+}
+
+const round = value => Math.round(value * 1000) / 1000;
+
+/**
+ * Drive `request` for `durationMs` after a `warmupMs` warm-up whose samples
+ * are discarded.
+ *
+ * Closed loop (default): `concurrency` callers, each issuing its next request
+ * when the previous one completes.
+ * Open loop (`rate` set): requests start on a fixed schedule regardless of
+ * completions, and latency is measured from the scheduled start so queueing
+ * delay is not hidden (no coordinated omission). Arrivals that would exceed
+ * `maxInFlight` outstanding requests are counted as dropped.
+ *
+ * @param {object} options
+ * @param {function(number): Promise<void>} options.request - Issues request n; rejects on failure
+ * @param {number} options.durationMs - Measured duration
+ * @param {number} [options.warmupMs] - Unmeasured warm-up
+ * @param {number} [options.concurrency] - Closed-loop callers
+ * @param {number} [options.rate] - Open-loop arrivals per second
+ * @param {number} [options.maxInFlight] - Open-loop outstanding request cap
+ * @param {boolean} [options.keepSamples] - Also return the sorted latencies as `samples`, to merge runs
+ * @returns {Promise<object>} - Throughput, latency percentiles and error counts
+ */
+export async function runLoad(options) {
+  const {
+    request,
+    durationMs,
+    warmupMs = 0,
+    concurrency = 1,
+    rate = null,
+    maxInFlight = 10000,
+    keepSamples = false
+  } = options;
+  const samples = new Samples();
+  const errorKinds = {};
+  let errors = 0;
+  let dropped = 0;
+  let counter = 0;
+
+  const start = performance.now();
+  const measureFrom = start + warmupMs;
+  const end = measureFrom + durationMs;
+
+  const issue = async (scheduledAt) => {
+    const n = counter++;
+    try {
+      await request(n);
+      if (scheduledAt >= measureFrom) samples.push(performance.now() - scheduledAt);
+    } catch (error) {
+      if (scheduledAt >= measureFrom) {
+        errors++;
+        const kind = error.code || error.message;
+        errorKinds[kind] = (errorKinds[kind] || 0) + 1;
+      }
+    }
+  };
+
+  if (rate === null) {
+    await Promise.all(Array.from({ length: concurrency }, async () => {
+      while (performance.now() < end) {
+        await issue(performance.now());
+      }
+    }));
+  } else {
+    const interval = 1000 / rate;
+    const inFlight = new Set();
+    let next = start;
+
+    while (next < end) {
+      const now = performance.now();
+      // Catch up on every arrival that is due (timers fire late under load)
+      while (next <= now && next < end) {
+        if (inFlight.size >= maxInFlight) {
+          if (next >= measureFrom) dropped++;
+        } else {
+          const pending = issue(next).finally(() => inFlight.delete(pending));
+          inFlight.add(pending);
+        }
+        next += interval;
+      }
+      await new Promise(resolve => setTimeout(resolve, Math.max(0, Math.min(next - performance.now(), 10))));
+    }
+    await Promise.all(inFlight);
+  }
+
+  const measuredMs = Math.max(performance.now(), end) - measureFrom;
+  const sorted = samples.sorted();
+  const total = sorted.reduce((sum, value) => sum + value, 0);
+
+  return {
+    mode: rate === null ? 'closed' : 'open',
+    concurrency: rate === null ? concurrency : null,
+    targetRate: rate,
+    requests: sorted.length,
+    errors,
+    dropped,
+    errorKinds,
+    throughput: round(sorted.length / (measuredMs / 1000)),
+    latencyMs: {
+      mean: round(sorted.length ? total / sorted.length : 0),
+      p50: round(percentile(sorted, 50)),
+      p95: round(percentile(sorted, 95)),
+      p99: round(percentile(sorted, 99)),
+      max: round(sorted.length ? sorted[sorted.length - 1] : 0)
+    },
+    ...(keepSamples && { samples: sorted })
+  };
+}
+
+/**
+ * Minimal keep-alive HTTP client; resolves with status and body, rejects on
+ * network errors and non-2xx/3xx statuses
+ */
+export function createHttpClient(baseUrl, { maxSockets = 256 } = {}) {
+  const agent = new http.Agent({ keepAlive: true, maxSockets });
+  const { hostname, port } = new URL(baseUrl);
+
+  const send = (method, path, { body, headers = {} } = {}) => new Promise((resolve, reject) => {
+    const payload = body === undefined ? undefined : typeof body === 'string' ? body : JSON.stringify(body);
+    const req = http.request({
+      hostname,
+      port,
+      method,
+      path,
+      agent,
+      headers: payload === undefined
+        ? headers
+        : { 'Content-Type': 'application/json', 'Content-Length': Buffer.byteLength(payload), ...headers }
+    }, res => {
+      const chunks = [];
+      res.on('data', chunk => chunks.push(chunk));
+      res.on('end', () => {
+        if (res.statusCode >= 400) {
+          reject(Object.assign(new Error(`HTTP ${res.statusCode}`), { code: `HTTP_${res.statusCode}` }));
+        } else {
+          resolve({ status: res.statusCode, headers: res.headers, body: Buffer.concat(chunks) });
+        }
+      });
+      res.on('error', reject);
+    });
+    req.on('error', reject);
+    req.end(payload);
+  });
+
+  return {
+    get: (path, options) => send('GET', path, options),
+    post: (path, body, options = {}) => send('POST', path, { ...options, body }),
+    close: () => agent.destroy()
+  };
+}
+
+/**
+ * Compare a run against a baseline run. A scenario regresses when its p99
+ * grows, or its throughput falls, by more than `tolerance` (fraction).
+ * @returns {string[]} - Human-readable regressions
+ */
+export function findRegressions(current, baseline, tolerance) {
+  const regressions = [];
+  for (const [name, result] of Object.entries(current.scenarios)) {
+    const before = baseline.scenarios?.[name];
+    if (!before || result.skipped || before.skipped) continue;
+    // Only like-for-like load is comparable
+    if (before.concurrency !== result.concurrency || before.targetRate !== result.targetRate) continue;
+
+    if (result.latencyMs.p99 > before.latencyMs.p99 * (1 + tolerance)) {
+      regressions.push(`${name}: p99 ${before.latencyMs.p99}ms → ${result.latencyMs.p99}ms`);
+    }
+    // Open-loop throughput is pinned to the target rate, so only closed loop is compared
+    if (result.mode === 'closed' && result.throughput < before.throughput * (1 - tolerance)) {
+      regressions.push(`${name}: throughput ${before.throughput}/s → ${result.throughput}/s`);
+    }
+  }
+  return regressions;
+}
@@ -0,0 +1,208 @@
+/**
+ * Mock Solana JSON-RPC Server
+ * Deterministic stand-in for a mainnet endpoint so the performance harness
+ * can run offline. Serves the methods solana-fetcher uses, for a fixed set
+ * of synthetic SPL mints, with configurable latency.
+ */
+
+import http from 'node:http';
+import { createHash, randomBytes } from 'node:crypto';
+
+const TOKEN_PROGRAM_ID = 'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA';
+const BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz';
+const MINT_SIZE = 82;
+const SLOT = 250_000_000;
+
+/**
+ * Base58-encode bytes (Solana address format)
+ */
+export function toBase58(bytes) {
+  let value = BigInt('0x' + (Buffer.from(bytes).toString('hex') || '0'));
+  let encoded = '';
+  while (value > 0n) {
+    encoded = BASE58_ALPHABET[Number(value % 58n)] + encoded;
+    value /= 58n;
+  }
+  for (const byte of bytes) {
+    if (byte !== 0) break;
+    encoded = '1' + encoded;
+  }
+  return encoded;
+}
+
+/**
+ * Deterministic 32-byte address derived from a seed
+ */
+function addressOf(seed) {
+  return createHash('sha256').update(seed).digest();
+}
+
+/**
+ * SPL mint account data: no mint/freeze authority, initialized
+ */
+function mintData(supply, decimals) {
+  const data = Buffer.alloc(MINT_SIZE);
+  data.writeBigUInt64LE(BigInt(supply), 36);
+  data.writeUInt8(decimals, 44);
+  data.writeUInt8(1, 45);
+  return data;
+}
+
+function account(data, owner = TOKEN_PROGRAM_ID) {
+  return {
+    data: [data.toString('base64'), 'base64'],
+    executable: false,
+    lamports: 1_461_600,
+    owner,
+    rentEpoch: 0,
+    space: data.length
+  };
+}
+
+/**
+ * Holder balances for a mint: a few whales, then a long tail
+ */
+function holderAmounts(count, supply) {
+  const weights = Array.from({ length: count }, (_, i) => 1 / (i + 1) ** 1.2);
+  const total = weights.reduce((sum, weight) => sum + weight, 0);
+  return weights.map(weight => Math.floor((weight / total) * supply));
+}
+
+/**
+ * Start the mock RPC server
+ * @param {object} options
+ * @param {number} [options.port] - Port (default: random free port)
+ * @param {number} [options.mints] - Number of synthetic mints
+ * @param {number} [options.holders] - Token accounts per mint
+ * @param {number} [options.latencyMs] - Base response latency
+ * @param {number} [options.jitterMs] - Uniform random extra latency
+ * @returns {Promise<{ url: string, mints: string[], calls: object, close: function }>}
+ */
+export async function startMockRpc(options = {}) {
+  const { port = 0, mints: mintCount = 20, holders = 1000, latencyMs = 5, jitterMs = 5 } = options;
+  const supply = 1_000_000_000_000_000;
+  const decimals = 6;
+
+  const mints = new Map();
+  for (let i = 0; i < mintCount; i++) {
+    const address = toBase58(addressOf(`mock-mint-${i}`));
+    const amounts = holderAmounts(holders, supply);
+    mints.set(address, {
+      data: mintData(supply, decimals),
+      accounts: amounts.map((amount, n) => ({
+        address: toBase58(addressOf(`${address}-account-${n}`)),
+        owner: addressOf(`${address}-owner-${n}`),
+        amount
+      }))
+    });
+  }
+
+  const calls = {};
+
+  const handlers = {
+    getHealth: () => 'ok',
+    getSlot: () => SLOT,
+    getVersion: () => ({ 'solana-core': '1.18.0', 'feature-set': 0 }),
+    getLatestBlockhash: () => ({
+      context: { slot: SLOT },
+      value: { blockhash: toBase58(randomBytes(32)), lastValidBlockHeight: SLOT + 150 }
+    }),
+    getAccountInfo: ([address]) => {
+      const mint = mints.get(address);
+      return { context: { slot: SLOT }, value: mint ? account(mint.data) : null };
+    },
+    getMultipleAccounts: ([addresses]) => ({
+      context: { slot: SLOT },
+      value: addresses.map(address => {
+        const mint = mints.get(address);
+        return mint ? account(mint.data) : null;
+      })
+    }),
+    getTokenSupply: ([address]) => {
+      if (!mints.has(address)) throw { code: -32602, message: 'Invalid param: not a Token mint' };
+      return {
+        context: { slot: SLOT },
+        value: { amount: String(supply), decimals, uiAmount: supply / 10 ** decimals, uiAmountString: String(supply / 10 ** decimals) }
+      };
+    },
+    getTokenLargestAccounts: ([address]) => {
+      const mint = mints.get(address);
+      if (!mint) throw { code: -32602, message: 'Invalid param: not a Token mint' };
+      return {
+        context: { slot: SLOT },
+        value: mint.accounts.slice(0, 20).map(({ address: tokenAccount, amount }) => ({
+          address: tokenAccount,
+          amount: String(amount),
+          decimals,
+          uiAmount: amount / 10 ** decimals,
+          uiAmountString: String(amount / 10 ** decimals)
+        }))
+      };
+    },
+    getProgramAccounts: ([, config = {}]) => {
+      const filter = config.filters?.find(f => f.memcmp?.offset === 0);
+      const mint = filter && mints.get(filter.memcmp.bytes);
+      if (!mint) return [];
+
+      // Honour the owner + amount data slice the holder scanner requests
+      return mint.accounts.map(({ address: tokenAccount, owner, amount }) => {
+        const data = Buffer.alloc(40);
+        owner.copy(data, 0);
+        data.writeBigUInt64LE(BigInt(amount), 32);
+        return { pubkey: tokenAccount, account: account(data) };
+      });
+    }
+  };
+
+  const respond = ({ id, method, params = [] }) => {
+    calls[method] = (calls[method] || 0) + 1;
+    const handler = handlers[method];
+    if (!handler) {
+      return { jsonrpc: '2.0', id, error: { code: -32601, message: `Method not found: ${method}` } };
+    }
+    try {
+      return { jsonrpc: '2.0', id, result: handler(params) };
+    } catch (error) {
+      return { jsonrpc: '2.0', id, error };
+    }
+  };
+
+  const server = http.createServer((req, res) => {
+    const chunks = [];
+    req.on('data', chunk => chunks.push(chunk));
+    req.on('end', () => {
+      let body;
+      try {
+        const payload = JSON.parse(Buffer.concat(chunks).toString());
+        body = JSON.stringify(Array.isArray(payload) ? payload.map(respond) : respond(payload));
+      } catch {
+        body = JSON.stringify({ jsonrpc: '2.0', id: null, error: { code: -32700, message: 'Parse error' } });
+      }
+
+      setTimeout(() => {
+        res.writeHead(200, { 'Content-Type': 'application/json' });
+        res.end(body);
+      }, latencyMs + Math.random() * jitterMs);
+    });
+  });
+  server.keepAliveTimeout = 60_000;
+
+  await new Promise(resolve => server.listen(port, '127.0.0.1', resolve));
+
+  return {
+    url: `http://127.0.0.1:${server.address().port}`,
+    mints: [...mints.keys()],
+    calls,
+    close: () => new Promise(resolve => {
+      server.closeAllConnections();
+      server.close(resolve);
+    })
+  };
+}
+
+// Standalone: node perf/mock-rpc.mjs [port]
+if (import.meta.url === `file://${process.argv[1]}`) {
+  const rpc = await startMockRpc({ port: parseInt(process.argv[2], 10) || 8899 });
+  console.log(`🧪 Mock Solana RPC at ${rpc.url}`);
+  console.log(`   Mints: ${rpc.mints.slice(0, 3).join(', ')}, ...`);
+}
@@ -0,0 +1,285 @@
+#!/usr/bin/env node
+/**
+ * Performance Test Harness
+ * Colosseum Compliance Guardian
+ *
+ * Runs offline: starts a local Torii API and a mock Solana RPC, drives each
+ * scenario at a fixed concurrency (closed loop) or arrival rate (open loop),
+ * and reports throughput and p50/p95/p99/max latency per scenario.
+ *
+ * Usage: node performance-test.mjs [options]
+ *   --scenarios a,b       Scenarios to run (default: all, see below)
+ *   --duration 10         Measured seconds per scenario
+ *   --warmup 2            Unmeasured warm-up seconds per scenario
+ *   --concurrency 16      Closed-loop callers
+ *   --rate 500            Open-loop requests/second instead of closed loop
+ *   --out results.json    Write results as JSON
+ *   --baseline old.json   Compare against a previous run; exit 1 on regression
+ *   --tolerance 0.15      Allowed p99 increase / throughput drop (fraction)
+ *   --torii-url URL       Use a running Torii API instead of starting one
+ *   --rpc-latency 5       Mock RPC base latency (ms)
+ *
+ * The solana-analyze scenario imports solana-fetcher from TypeScript, so run
+ * with `npx tsx performance-test.mjs` to include it; plain node skips it.
+ */
+
+import { spawn } from 'node:child_process';
+import { writeFileSync, readFileSync } from 'node:fs';
+import { availableParallelism, cpus } from 'node:os';
+import { fileURLToPath } from 'node:url';
+import { runLoad, createHttpClient, findRegressions } from './perf/load.mjs';
+import { startMockRpc } from './perf/mock-rpc.mjs';
+
+const COLORS = {
+  reset: '\x1b[0m',
+  bright: '\x1b[1m',
+  green: '\x1b[32m',
+  red: '\x1b[31m',
+  yellow: '\x1b[33m',
+  cyan: '\x1b[36m'
+};
+
+const LATENCY_TARGET_MS = 2000; // p99 target per request
+
+const DESCRIPTIONS = [
+  'Governance token for DAO voting and treasury management',
+  'Investment token with profit sharing and dividend distribution',
+  'ERC-721 NFT collectible with unique artwork and metadata',
+  'Digital currency for peer-to-peer payments and remittance transfers',
+  'Community token for the decentralized ecosystem built on Solana with low fees and fast finality'
+];
+
+function log(message, color = COLORS.reset) {
+  console.log(`${color}${message}${COLORS.reset}`);
+}
+
+function parseArgs(argv) {
+  const options = {
+    scenarios: null,
+    duration: 10,
+    warmup: 2,
+    concurrency: 16,
+    rate: null,
+    out: null,
+    baseline: null,
+    tolerance: 0.15,
+    toriiUrl: null,
+    toriiPort: 3100,
+    rpcLatency: 5
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    const value = () => argv[++i];
+    switch (arg) {
+      case '--scenarios': options.scenarios = value().split(','); break;
+      case '--duration': options.duration = Number(value()); break;
+      case '--warmup': options.warmup = Number(value()); break;
+      case '--concurrency': options.concurrency = Number(value()); break;
+      case '--rate': options.rate = Number(value()); break;
+      case '--out': options.out = value(); break;
+      case '--baseline': options.baseline = value(); break;
+      case '--tolerance': options.tolerance = Number(value()); break;
+      case '--torii-url': options.toriiUrl = value(); break;
+      case '--torii-port': options.toriiPort = Number(value()); break;
+      case '--rpc-latency': options.rpcLatency = Number(value()); break;
+      default: throw new Error(`Unknown argument: ${arg}`);
+    }
+  }
+  return options;
+}
+
+/**
+ * Start torii-api/server.js and wait for /health
+ */
+async function startTorii(port) {
+  const child = spawn(process.execPath, [fileURLToPath(new URL('./torii-api/server.js', import.meta.url))], {
+    env: { ...process.env, PORT: String(port), ACCESS_LOG: 'off' },
+    stdio: ['ignore', 'ignore', 'pipe']
+  });
+  let stderr = '';
+  child.stderr.on('data', chunk => { stderr += chunk; });
+
+  const url = `http://127.0.0.1:${port}`;
+  const client = createHttpClient(url);
+  try {
+    for (let attempt = 0; attempt < 100; attempt++) {
+      if (child.exitCode !== null) {
+        throw new Error(`Torii API exited (code ${child.exitCode}); did you run npm install in torii-api?\n${stderr}`);
+      }
+      try {
+        await client.get('/health');
+        return { url, stop: () => child.kill('SIGTERM') };
+      } catch {
+        await new Promise(resolve => setTimeout(resolve, 100));
+      }
+    }
+    child.kill('SIGKILL');
+    throw new Error('Torii API did not become healthy within 10s');
+  } finally {
+    client.close();
+  }
+}
+
+/**
+ * Scenario definitions: setup returns the per-request function
+ */
+function defineScenarios(context) {
+  const { torii } = context;
+
+  return {
+    'torii-health': async () => n => torii.get('/health'),
+
+    'torii-classify': async () => n => torii.get('/api/classify/governance'),
+
+    // Unique text per request: every request runs the classifier
+    'torii-check': async () => n => torii.post('/api/check', {
+      demoMode: true,
+      description: `${DESCRIPTIONS[n % DESCRIPTIONS.length]} (request ${n})`
+    }),
+
+    // Repeated texts: served from the classification cache
+    'torii-check-cached': async () => n => torii.post('/api/check', {
+      demoMode: true,
+      description: DESCRIPTIONS[n % DESCRIPTIONS.length]
+    }),
+
+    'torii-batch': async () => n => torii.post('/api/check/batch', {
+      demoMode: true,
+      descriptions: Array.from({ length: 20 }, (_, i) => `${DESCRIPTIONS[i % DESCRIPTIONS.length]} (batch ${n}.${i})`)
+    }),
+
+    // Full token analysis against the mock RPC (needs a TypeScript loader)
+    'solana-analyze': async () => {
+      let fetcher;
+      try {
+        fetcher = await import('./solana-fetcher/index.ts');
+      } catch {
+        return { skipped: 'solana-fetcher needs a TypeScript loader; run with npx tsx' };
+      }
+      const analyzer = new fetcher.TokenAnalyzer({ rpcUrl: context.rpc.url, maxRetries: 1 });
+      const { mints } = context.rpc;
+      return n => analyzer.analyzeToken(mints[n % mints.length]);
+    }
+  };
+}
+
+function formatRow(name, result) {
+  if (result.skipped) {
+    return `${name.padEnd(20)} ${COLORS.yellow}skipped: ${result.skipped}${COLORS.reset}`;
+  }
+  const { latencyMs: l } = result;
+  return [
+    name.padEnd(20),
+    result.throughput.toFixed(1).padStart(10),
+    l.p50.toFixed(2).padStart(9),
+    l.p95.toFixed(2).padStart(9),
+    l.p99.toFixed(2).padStart(9),
+    l.max.toFixed(2).padStart(9),
+    String(result.errors + result.dropped).padStart(7)
+  ].join(' ');
+}
+
+async function main() {
+  const options = parseArgs(process.argv.slice(2));
+
+  log('\n⚡ Colosseum Compliance Guardian - Performance Test', COLORS.bright + COLORS.cyan);
+  log(`   ${options.rate ? `open loop at ${options.rate} req/s` : `closed loop, ${options.concurrency} concurrent`}, ${options.duration}s per scenario (+${options.warmup}s warm-up)\n`);
+
+  const rpc = await startMockRpc({ latencyMs: options.rpcLatency });
+  const server = options.toriiUrl ? null : await startTorii(options.toriiPort);
+  const torii = createHttpClient(options.toriiUrl || server.url);
+  const scenarios = defineScenarios({ torii, rpc });
+
+  const selected = options.scenarios || Object.keys(scenarios);
+  const unknown = selected.filter(name => !scenarios[name]);
+  if (unknown.length) throw new Error(`Unknown scenarios: ${unknown.join(', ')}`);
+
+  const results = {
+    timestamp: new Date().toISOString(),
+    node: process.version,
+    cpus: availableParallelism(),
+    cpuModel: cpus()[0]?.model,
+    config: {
+      duration: options.duration,
+      warmup: options.warmup,
+      concurrency: options.concurrency,
+      rate: options.rate,
+      rpcLatencyMs: options.rpcLatency
+    },
+    scenarios: {}
+  };
+
+  log(`${'scenario'.padEnd(20)} ${'req/s'.padStart(10)} ${'p50 ms'.padStart(9)} ${'p95 ms'.padStart(9)} ${'p99 ms'.padStart(9)} ${'max ms'.padStart(9)} ${'errors'.padStart(7)}`, COLORS.bright);
+
+  const consoleLog = console.log;
+  try {
+    for (const name of selected) {
+      const request = await scenarios[name]();
+      if (typeof request !== 'function') {
+        results.scenarios[name] = request;
+        log(formatRow(name, request));
+        continue;
+      }
+
+      // The analyzer logs every token; keep the table readable
+      console.log = () => {};
+      let result;
+      try {
+        result = await runLoad({
+          request,
+          durationMs: options.duration * 1000,
+          warmupMs: options.warmup * 1000,
+          concurrency: options.concurrency,
+          rate: options.rate
+        });
+      } finally {
+        console.log = consoleLog;
+      }
+      results.scenarios[name] = result;
+      log(formatRow(name, result));
+    }
+  } finally {
+    torii.close();
+    server?.stop();
+    await rpc.close();
+  }
+  results.rpcCalls = rpc.calls;
+
+  if (options.out) {
+    writeFileSync(options.out, JSON.stringify(results, null, 2) + '\n');
+    log(`\n📄 Results written to ${options.out}`);
+  }
+
+  // Verdict: absolute target, error rate, and regressions against a baseline
+  const failures = [];
+  for (const [name, result] of Object.entries(results.scenarios)) {
+    if (result.skipped) continue;
+    if (result.latencyMs.p99 > LATENCY_TARGET_MS) {
+      failures.push(`${name}: p99 ${result.latencyMs.p99}ms exceeds ${LATENCY_TARGET_MS}ms target`);
+    }
+    const attempts = result.requests + result.errors + result.dropped;
+    if (attempts === 0 || (result.errors + result.dropped) / attempts > 0.01) {
+      failures.push(`${name}: ${result.errors} errors, ${result.dropped} dropped of ${attempts} requests`);
+    }
+  }
+  if (options.baseline) {
+    const baseline = JSON.parse(readFileSync(options.baseline, 'utf8'));
+    failures.push(...findRegressions(results, baseline, options.tolerance));
+  }
+
+  console.log('');
+  if (failures.length === 0) {
+    log(`✅ All scenarios within target (p99 < ${LATENCY_TARGET_MS}ms${options.baseline ? `, no regression beyond ${options.tolerance * 100}%` : ''})`, COLORS.green);
+    return 0;
+  }
+  for (const failure of failures) log(`❌ ${failure}`, COLORS.red);
+  return 1;
+}
+
+main()
+  .then(code => process.exit(code))
+  .catch(error => {
+    log(`\n❌ Performance test failed: ${error.message}`, COLORS.red);
+    process.exit(1);
+  });
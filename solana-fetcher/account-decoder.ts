@@ -0,0 +1,104 @@
+import { AccountInfo, PublicKey } from '@solana/web3.js';
+import { TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID, unpackMint } from '@solana/spl-token';
+import { MintSnapshot } from './types.js';
+
+/**
+ * Metaplex Token Metadata program
+ */
+export const METADATA_PROGRAM_ID = new PublicKey(
+  'metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s'
+);
+
+/**
+ * Metadata account layout: key (1) + update authority (32) + mint (32),
+ * followed by borsh strings name, symbol, uri (u32 length + bytes)
+ */
+const METADATA_STRINGS_OFFSET = 1 + 32 + 32;
+
+/**
+ * Derive the Metaplex metadata PDA for a mint
+ */
+export function findMetadataAddress(mintPubkey: PublicKey): PublicKey {
+  const [metadataPDA] = PublicKey.findProgramAddressSync(
+    [Buffer.from('metadata'), METADATA_PROGRAM_ID.toBuffer(), mintPubkey.toBuffer()],
+    METADATA_PROGRAM_ID
+  );
+  return metadataPDA;
+}
+
+/**
+ * Decode name, symbol and uri from raw Metaplex metadata account data
+ */
+export function decodeMetaplexMetadata(
+  data: Buffer
+): { name?: string; symbol?: string; uri?: string } | null {
+  let offset = METADATA_STRINGS_OFFSET;
+
+  const readString = (): string | undefined => {
+    if (offset + 4 > data.length) return undefined;
+    const length = data.readUInt32LE(offset);
+    offset += 4;
+    if (offset + length > data.length) return undefined;
+    const value = data.toString('utf8', offset, offset + length);
+    offset += length;
+    // Metaplex pads fixed-width fields with NUL bytes
+    return value.replace(/\0/g, '').trim() || undefined;
+  };
+
+  const name = readString();
+  const symbol = readString();
+  const uri = readString();
+
+  if (!name && !symbol && !uri) return null;
+  return { name, symbol, uri };
+}
+
+/**
+ * Format a raw base-unit amount as a UI amount string, matching the RPC's
+ * `uiAmountString` (no trailing zeros, no exponent notation)
+ */
+export function formatTokenAmount(raw: bigint, decimals: number): string {
+  if (decimals === 0) return raw.toString();
+
+  const digits = raw.toString().padStart(decimals + 1, '0');
+  const whole = digits.slice(0, -decimals);
+  const fraction = digits.slice(-decimals).replace(/0+$/, '');
+  return fraction ? `${whole}.${fraction}` : whole;
+}
+
+/**
+ * Decode a mint account (and optional metadata account) into a snapshot.
+ * Returns null if the account is missing or not an SPL Token / Token-2022 mint.
+ */
+export function decodeMintSnapshot(
+  mintPubkey: PublicKey,
+  mintAccount: AccountInfo<Buffer> | null,
+  metadataAccount: AccountInfo<Buffer> | null
+): MintSnapshot | null {
+  if (!mintAccount) return null;
+
+  const owner = mintAccount.owner;
+  if (!owner.equals(TOKEN_PROGRAM_ID) && !owner.equals(TOKEN_2022_PROGRAM_ID)) {
+    return null;
+  }
+
+  let mint;
+  try {
+    mint = unpackMint(mintPubkey, mintAccount, owner);
+  } catch {
+    return null;
+  }
+
+  return {
+    mintAddress: mintPubkey.toBase58(),
+    programId: owner.toBase58(),
+    decimals: mint.decimals,
+    supply: mint.supply.toString(),
+    uiSupply: formatTokenAmount(mint.supply, mint.decimals),
+    mintAuthority: mint.mintAuthority?.toBase58() || null,
+    freezeAuthority: mint.freezeAuthority?.toBase58() || null,
+    isInitialized: mint.isInitialized,
+    lamports: mintAccount.lamports,
+    metadata: metadataAccount ? decodeMetaplexMetadata(metadataAccount.data) : null,
+  };
+}
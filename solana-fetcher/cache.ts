@@ -0,0 +1,185 @@
+import { createHash } from 'node:crypto';
+import { promises as fs } from 'node:fs';
+import path from 'node:path';
+
+/**
+ * Pluggable key/value cache used by SolanaClient.
+ * Values must be JSON-serializable so they can be shared across processes.
+ * A ttlMs of Infinity means the entry never expires.
+ */
+export interface CacheStore {
+  get<T>(key: string): Promise<T | undefined>;
+  set<T>(key: string, value: T, ttlMs: number): Promise<void>;
+  delete(key: string): Promise<void>;
+}
+
+/**
+ * Cache lifetimes per data class (milliseconds)
+ */
+export interface CacheTtlConfig {
+  immutable: number; // Decimals, owner program - never change
+  authorities: number; // Supply, mint/freeze authority
+  metadata: number; // Metaplex name/symbol/uri
+  holders: number; // Largest token accounts
+}
+
+export const DEFAULT_CACHE_TTL: CacheTtlConfig = {
+  immutable: Infinity,
+  authorities: 5 * 60 * 1000,
+  metadata: 60 * 60 * 1000,
+  holders: 30 * 1000,
+};
+
+export type CacheDataClass = keyof CacheTtlConfig;
+
+/**
+ * Hit/miss counters per data class
+ */
+export type CacheStats = Record<CacheDataClass, { hits: number; misses: number }>;
+
+interface MemoryEntry {
+  value: unknown;
+  expiresAt: number;
+  size: number;
+}
+
+/**
+ * In-memory LRU cache with entry-count and approximate byte-size limits.
+ * Map insertion order doubles as recency order.
+ */
+export class MemoryCache implements CacheStore {
+  private entries = new Map<string, MemoryEntry>();
+  private bytes = 0;
+  public evictions = 0;
+
+  constructor(
+    private maxEntries: number = 10000,
+    private maxBytes: number = 64 * 1024 * 1024
+  ) {}
+
+  async get<T>(key: string): Promise<T | undefined> {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.remove(key, entry);
+      return undefined;
+    }
+
+    // Move to most-recently-used position
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value as T;
+  }
+
+  async set<T>(key: string, value: T, ttlMs: number): Promise<void> {
+    const existing = this.entries.get(key);
+    if (existing) this.remove(key, existing);
+
+    // UTF-16 estimate of the serialized size
+    const size = JSON.stringify(value).length * 2;
+    if (size > this.maxBytes) return;
+
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs, size });
+    this.bytes += size;
+
+    while (this.entries.size > this.maxEntries || this.bytes > this.maxBytes) {
+      const oldest = this.entries.keys().next().value as string;
+      this.remove(oldest, this.entries.get(oldest)!);
+      this.evictions++;
+    }
+  }
+
+  async delete(key: string): Promise<void> {
+    const entry = this.entries.get(key);
+    if (entry) this.remove(key, entry);
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get sizeBytes(): number {
+    return this.bytes;
+  }
+
+  private remove(key: string, entry: MemoryEntry): void {
+    this.entries.delete(key);
+    this.bytes -= entry.size;
+  }
+}
+
+/**
+ * On-disk cache, one JSON file per key. Shared by all workers on a host.
+ */
+export class FileCache implements CacheStore {
+  constructor(private directory: string) {}
+
+  async get<T>(key: string): Promise<T | undefined> {
+    try {
+      const raw = await fs.readFile(this.fileFor(key), 'utf8');
+      const entry = JSON.parse(raw) as { expiresAt: number | null; value: T };
+      if (entry.expiresAt !== null && entry.expiresAt <= Date.now()) {
+        await this.delete(key);
+        return undefined;
+      }
+      return entry.value;
+    } catch {
+      return undefined;
+    }
+  }
+
+  async set<T>(key: string, value: T, ttlMs: number): Promise<void> {
+    const expiresAt = Number.isFinite(ttlMs) ? Date.now() + ttlMs : null;
+    const file = this.fileFor(key);
+    const tmp = `${file}.${process.pid}.tmp`;
+
+    await fs.mkdir(this.directory, { recursive: true });
+    // Write-then-rename so concurrent readers never see a partial file
+    await fs.writeFile(tmp, JSON.stringify({ expiresAt, value }));
+    await fs.rename(tmp, file);
+  }
+
+  async delete(key: string): Promise<void> {
+    await fs.rm(this.fileFor(key), { force: true });
+  }
+
+  private fileFor(key: string): string {
+    const digest = createHash('sha1').update(key).digest('hex');
+    return path.join(this.directory, `${digest}.json`);
+  }
+}
+
+/**
+ * Minimal Redis client surface (compatible with ioredis and node-redis v4 legacy mode)
+ */
+export interface RedisLike {
+  get(key: string): Promise<string | null>;
+  set(key: string, value: string, ...args: Array<string | number>): Promise<unknown>;
+  del(key: string): Promise<unknown>;
+}
+
+/**
+ * Redis-backed cache shared by all workers
+ */
+export class RedisCache implements CacheStore {
+  constructor(private client: RedisLike, private prefix: string = 'solana-fetcher:') {}
+
+  async get<T>(key: string): Promise<T | undefined> {
+    const raw = await this.client.get(this.prefix + key);
+    return raw === null ? undefined : (JSON.parse(raw) as T);
+  }
+
+  async set<T>(key: string, value: T, ttlMs: number): Promise<void> {
+    const raw = JSON.stringify(value);
+    if (Number.isFinite(ttlMs)) {
+      await this.client.set(this.prefix + key, raw, 'PX', Math.max(1, Math.round(ttlMs)));
+    } else {
+      await this.client.set(this.prefix + key, raw);
+    }
+  }
+
+  async delete(key: string): Promise<void> {
+    await this.client.del(this.prefix + key);
+  }
+}
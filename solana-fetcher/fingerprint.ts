@@ -0,0 +1,31 @@
+import { createHash } from 'node:crypto';
+import { HolderSource, MintAccounts } from './types.js';
+
+/**
+ * Hash of what an audit reads from chain: the raw mint account (owning
+ * program, lamports and data, so Token-2022 extensions and authorities are
+ * covered whether or not they are decoded), the raw Metaplex metadata
+ * account and the holders the analysis scores (largest accounts or a full
+ * scan). The off-chain metadata JSON the uri points to is not covered, and
+ * an approximate full scan can change without the chain changing, so equal
+ * fingerprints mean equal on-chain inputs, not an identical report.
+ */
+export function fingerprintMint(accounts: MintAccounts, holders: HolderSource): string {
+  const hash = createHash('sha256');
+  for (const account of [accounts.mint, accounts.metadata]) {
+    if (!account) {
+      hash.update('-');
+      continue;
+    }
+    hash.update(`${account.owner.toBase58()}:${account.lamports}:${account.data.length}:`);
+    hash.update(account.data);
+  }
+  hash.update(
+    JSON.stringify(
+      Array.isArray(holders)
+        ? holders.map((holder) => [holder.address.toBase58(), holder.amount])
+        : holders
+    )
+  );
+  return hash.digest('hex');
+}
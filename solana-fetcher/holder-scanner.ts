@@ -0,0 +1,232 @@
+import http from 'node:http';
+import https from 'node:https';
+import { PublicKey } from '@solana/web3.js';
+import { TOKEN_PROGRAM_ID } from '@solana/spl-token';
+import type { RpcTarget } from './rpc-pool.js';
+
+/**
+ * SPL token account layout: mint (32) | owner (32) | amount (u64) | ...
+ * Only owner + amount are requested via dataSlice.
+ */
+const TOKEN_ACCOUNT_SIZE = 165;
+const OWNER_OFFSET = 32;
+const SLICE_LENGTH = 32 + 8;
+
+/**
+ * Matches the base64 payload of each account in a getProgramAccounts response
+ */
+const DATA_FIELD = /"data":\s*\[\s*"([A-Za-z0-9+/=]*)"/g;
+
+/**
+ * Longest tail kept between chunks; must exceed one `"data":["...` field
+ */
+const CARRY_LIMIT = 256;
+
+/**
+ * Aggregated holder set from a full scan
+ */
+export interface HolderScanResult {
+  totalAccounts: number; // Token accounts seen (including empty ones)
+  totalHolders: number; // Distinct owners with a non-zero balance
+  largestHolders: Array<{ owner: string; amount: number }>; // Raw base units, descending
+  approximate: boolean; // True if the owner budget was exceeded
+}
+
+/**
+ * Aggregates balances per owner under a fixed owner budget.
+ * Owner keys are 32-char latin1 strings (one byte per char) to keep the map
+ * compact. When the budget is exceeded, the smaller half of owners is folded
+ * into an anonymous tail: they still count as holders, but owners seen again
+ * afterwards may be counted twice, so the result is marked approximate.
+ */
+export class HolderAggregator {
+  private owners = new Map<string, number>();
+  private tailHolders = 0;
+  private tailFloor = 0; // New owners below this balance go straight to the tail
+  private accounts = 0;
+  private pruned = false;
+
+  constructor(private maxOwners: number = 1_000_000) {}
+
+  add(owner: string, amount: number): void {
+    this.accounts++;
+    if (amount === 0) return;
+
+    const current = this.owners.get(owner);
+    if (current !== undefined) {
+      this.owners.set(owner, current + amount);
+      return;
+    }
+
+    if (amount < this.tailFloor) {
+      this.tailHolders++;
+      return;
+    }
+
+    this.owners.set(owner, amount);
+    if (this.owners.size > this.maxOwners) {
+      this.prune();
+    }
+  }
+
+  result(topN: number = 20): HolderScanResult {
+    const top: Array<[string, number]> = [];
+
+    for (const entry of this.owners) {
+      if (top.length < topN) {
+        top.push(entry);
+        top.sort((a, b) => b[1] - a[1]);
+      } else if (entry[1] > top[top.length - 1][1]) {
+        top[top.length - 1] = entry;
+        top.sort((a, b) => b[1] - a[1]);
+      }
+    }
+
+    return {
+      totalAccounts: this.accounts,
+      totalHolders: this.owners.size + this.tailHolders,
+      largestHolders: top.map(([owner, amount]) => ({
+        owner: new PublicKey(Buffer.from(owner, 'latin1')).toBase58(),
+        amount,
+      })),
+      approximate: this.pruned,
+    };
+  }
+
+  private prune(): void {
+    const balances = Float64Array.from(this.owners.values()).sort();
+    const median = balances[balances.length >> 1];
+
+    for (const [owner, amount] of this.owners) {
+      if (amount < median) {
+        this.owners.delete(owner);
+        this.tailHolders++;
+      }
+    }
+
+    this.tailFloor = Math.max(this.tailFloor, median);
+    this.pruned = true;
+  }
+}
+
+/**
+ * Build the getProgramAccounts request for all token accounts of a mint
+ */
+export function buildHolderScanRequest(mintPubkey: PublicKey, programId: PublicKey): string {
+  const filters: object[] = [{ memcmp: { offset: 0, bytes: mintPubkey.toBase58() } }];
+  // Token-2022 accounts carry extensions, so their size varies
+  if (programId.equals(TOKEN_PROGRAM_ID)) {
+    filters.push({ dataSize: TOKEN_ACCOUNT_SIZE });
+  }
+
+  return JSON.stringify({
+    jsonrpc: '2.0',
+    id: 1,
+    method: 'getProgramAccounts',
+    params: [
+      programId.toBase58(),
+      {
+        encoding: 'base64',
+        commitment: 'confirmed',
+        dataSlice: { offset: OWNER_OFFSET, length: SLICE_LENGTH },
+        filters,
+      },
+    ],
+  });
+}
+
+/**
+ * Stream all token accounts of a mint from one endpoint, decoding each
+ * account's owner and amount straight from the response bytes without
+ * materializing the JSON document.
+ */
+export function scanTokenHolders(
+  target: RpcTarget,
+  mintPubkey: PublicKey,
+  programId: PublicKey,
+  aggregator: HolderAggregator
+): Promise<void> {
+  const body = buildHolderScanRequest(mintPubkey, programId);
+  const transport = target.url.startsWith('https:') ? https : http;
+
+  return new Promise((resolve, reject) => {
+    const req = transport.request(
+      target.url,
+      {
+        method: 'POST',
+        agent: target.agent,
+        headers: {
+          'Content-Type': 'application/json',
+          'Content-Length': Buffer.byteLength(body),
+        },
+        signal: target.signal,
+      },
+      (res) => {
+        if (res.statusCode && res.statusCode >= 400) {
+          res.resume();
+          reject(new Error(`${res.statusCode} ${res.statusMessage}: getProgramAccounts failed`));
+          return;
+        }
+
+        let carry = '';
+        let head = '';
+        let matched = false;
+
+        res.setEncoding('latin1');
+        res.on('data', (chunk: string) => {
+          if (!matched && head.length < 4096) head += chunk.slice(0, 4096 - head.length);
+
+          const text = carry + chunk;
+          DATA_FIELD.lastIndex = 0;
+          let consumed = 0;
+          let match: RegExpExecArray | null;
+
+          while ((match = DATA_FIELD.exec(text)) !== null) {
+            matched = true;
+            const data = Buffer.from(match[1], 'base64');
+            if (data.length >= SLICE_LENGTH) {
+              aggregator.add(
+                data.toString('latin1', 0, 32),
+                Number(data.readBigUInt64LE(32))
+              );
+            }
+            consumed = DATA_FIELD.lastIndex;
+          }
+
+          carry = text.slice(Math.max(consumed, text.length - CARRY_LIMIT));
+        });
+        res.on('end', () => {
+          if (!matched) {
+            const error = parseRpcError(head);
+            if (error) {
+              reject(error);
+              return;
+            }
+          }
+          resolve();
+        });
+        res.on('error', reject);
+      }
+    );
+
+    req.on('error', reject);
+    req.end(body);
+  });
+}
+
+/**
+ * Extract a JSON-RPC error from a (small) response, if any
+ */
+function parseRpcError(text: string): Error | null {
+  try {
+    const response = JSON.parse(text);
+    if (response.error) {
+      return new Error(`getProgramAccounts error ${response.error.code}: ${response.error.message}`);
+    }
+  } catch {
+    if (/"error"/.test(text)) {
+      return new Error(`getProgramAccounts failed: ${text.slice(0, 200)}`);
+    }
+  }
+  return null;
+}
@@ -0,0 +1,460 @@
+import { createReadStream } from 'node:fs';
+import { createInterface } from 'node:readline';
+import {
+  Connection,
+  PublicKey,
+  KeyedAccountInfo,
+  Context,
+  GetProgramAccountsFilter,
+} from '@solana/web3.js';
+import { TOKEN_PROGRAM_ID } from '@solana/spl-token';
+
+/**
+ * A token account balance change for one mint.
+ * `amount` is the account's new absolute balance in raw base units.
+ */
+export interface HolderChange {
+  mint: string;
+  account: string; // Token account address
+  owner: string; // Wallet owning the token account
+  amount: number;
+  slot?: number; // Older updates for the same account are ignored
+}
+
+/**
+ * Holder aggregates for one mint, maintained incrementally
+ */
+export interface HolderAggregates {
+  count: number; // Owners with a non-zero balance
+  totalBalance: number; // Sum of tracked balances (raw units)
+  supply: number; // Supply used for percentages (raw units)
+  topHolderPercentage: number;
+  top10HolderPercentage: number;
+  whaleCount: number;
+  whalePercentage: number;
+  gini: number; // 0 = perfectly equal, → 1 = one holder owns everything
+  updates: number; // Changes applied so far
+  lastSlot: number;
+}
+
+/**
+ * Options for holder tracking
+ */
+export interface HolderTrackerOptions {
+  whaleThreshold?: number; // % of supply (default: 5)
+}
+
+/**
+ * Treap node keyed by (balance, seq); subtree size and sum enable
+ * rank and range-sum queries in O(log n)
+ */
+interface TreapNode {
+  balance: number;
+  seq: number;
+  priority: number;
+  left: TreapNode | null;
+  right: TreapNode | null;
+  size: number;
+  sum: number;
+}
+
+/**
+ * Order-statistic multiset of owner balances
+ */
+class BalanceTreap {
+  private root: TreapNode | null = null;
+
+  get size(): number {
+    return this.root ? this.root.size : 0;
+  }
+
+  get total(): number {
+    return this.root ? this.root.sum : 0;
+  }
+
+  insert(balance: number, seq: number): void {
+    const node: TreapNode = {
+      balance,
+      seq,
+      priority: Math.random(),
+      left: null,
+      right: null,
+      size: 1,
+      sum: balance,
+    };
+    this.root = this.insertInto(this.root, node);
+  }
+
+  remove(balance: number, seq: number): void {
+    this.root = this.removeFrom(this.root, balance, seq);
+  }
+
+  /**
+   * Number of balances <= value
+   */
+  countAtMost(value: number): number {
+    let node = this.root;
+    let count = 0;
+    while (node) {
+      if (node.balance <= value) {
+        count += size(node.left) + 1;
+        node = node.right;
+      } else {
+        node = node.left;
+      }
+    }
+    return count;
+  }
+
+  /**
+   * Sum of balances > value
+   */
+  sumAbove(value: number): number {
+    let node = this.root;
+    let total = 0;
+    while (node) {
+      if (node.balance > value) {
+        total += sum(node.right) + node.balance;
+        node = node.left;
+      } else {
+        node = node.right;
+      }
+    }
+    return total;
+  }
+
+  /**
+   * Sum of the k largest balances
+   */
+  sumLargest(k: number): number {
+    let node = this.root;
+    let remaining = k;
+    let total = 0;
+    while (node && remaining > 0) {
+      const rightSize = size(node.right);
+      if (rightSize >= remaining) {
+        node = node.right;
+      } else {
+        total += sum(node.right) + node.balance;
+        remaining -= rightSize + 1;
+        node = node.left;
+      }
+    }
+    return total;
+  }
+
+  max(): number {
+    let node = this.root;
+    if (!node) return 0;
+    while (node.right) node = node.right;
+    return node.balance;
+  }
+
+  private insertInto(node: TreapNode | null, inserted: TreapNode): TreapNode {
+    if (!node) return inserted;
+
+    if (precedes(inserted, node)) {
+      node.left = this.insertInto(node.left, inserted);
+      if (node.left.priority > node.priority) {
+        return rotateRight(node);
+      }
+    } else {
+      node.right = this.insertInto(node.right, inserted);
+      if (node.right.priority > node.priority) {
+        return rotateLeft(node);
+      }
+    }
+    update(node);
+    return node;
+  }
+
+  private merge(left: TreapNode | null, right: TreapNode | null): TreapNode | null {
+    if (!left) return right;
+    if (!right) return left;
+    if (left.priority > right.priority) {
+      left.right = this.merge(left.right, right);
+      update(left);
+      return left;
+    }
+    right.left = this.merge(left, right.left);
+    update(right);
+    return right;
+  }
+
+  private removeFrom(node: TreapNode | null, balance: number, seq: number): TreapNode | null {
+    if (!node) return null;
+    if (node.balance === balance && node.seq === seq) {
+      return this.merge(node.left, node.right);
+    }
+    if (node.balance < balance || (node.balance === balance && node.seq < seq)) {
+      node.right = this.removeFrom(node.right, balance, seq);
+    } else {
+      node.left = this.removeFrom(node.left, balance, seq);
+    }
+    update(node);
+    return node;
+  }
+}
+
+function size(node: TreapNode | null): number {
+  return node ? node.size : 0;
+}
+
+function sum(node: TreapNode | null): number {
+  return node ? node.sum : 0;
+}
+
+function update(node: TreapNode): void {
+  node.size = size(node.left) + size(node.right) + 1;
+  node.sum = sum(node.left) + sum(node.right) + node.balance;
+}
+
+function precedes(a: TreapNode, b: TreapNode): boolean {
+  return a.balance < b.balance || (a.balance === b.balance && a.seq < b.seq);
+}
+
+function rotateRight(node: TreapNode): TreapNode {
+  const pivot = node.left!;
+  node.left = pivot.right;
+  pivot.right = node;
+  update(node);
+  update(pivot);
+  return pivot;
+}
+
+function rotateLeft(node: TreapNode): TreapNode {
+  const pivot = node.right!;
+  node.right = pivot.left;
+  pivot.left = node;
+  update(node);
+  update(pivot);
+  return pivot;
+}
+
+/**
+ * Holder state for a single mint
+ */
+class MintHolders {
+  readonly balances = new BalanceTreap();
+  readonly owners = new Map<string, { balance: number; seq: number }>();
+  readonly accounts = new Map<string, { owner: string; amount: number; slot: number }>();
+  // Σ rank·balance over balances sorted ascending (1-based), for the Gini coefficient
+  rankWeightedSum = 0;
+  supply: number | null = null;
+  updates = 0;
+  lastSlot = 0;
+  private nextSeq = 0;
+
+  apply(change: HolderChange): boolean {
+    const slot = change.slot ?? 0;
+    const previous = this.accounts.get(change.account);
+    if (previous && slot < previous.slot) return false;
+
+    if (previous) {
+      this.adjustOwner(previous.owner, -previous.amount);
+    }
+    // Closed/empty accounts keep their slot so stale updates can't revive them
+    this.accounts.set(change.account, { owner: change.owner, amount: change.amount, slot });
+    this.adjustOwner(change.owner, change.amount);
+
+    this.updates++;
+    this.lastSlot = Math.max(this.lastSlot, slot);
+    return true;
+  }
+
+  private adjustOwner(owner: string, delta: number): void {
+    if (delta === 0) return;
+
+    const current = this.owners.get(owner);
+    if (current) {
+      this.removeBalance(current.balance, current.seq);
+    }
+
+    const balance = (current?.balance ?? 0) + delta;
+    if (balance > 0) {
+      const seq = this.nextSeq++;
+      this.insertBalance(balance, seq);
+      this.owners.set(owner, { balance, seq });
+    } else {
+      this.owners.delete(owner);
+    }
+  }
+
+  /**
+   * Insert after all equal balances: every larger balance moves up one rank
+   */
+  private insertBalance(balance: number, seq: number): void {
+    const rank = this.balances.countAtMost(balance) + 1;
+    this.rankWeightedSum += rank * balance + this.balances.sumAbove(balance);
+    this.balances.insert(balance, seq);
+  }
+
+  /**
+   * Equal balances are interchangeable, so treat the removed one as the last of them
+   */
+  private removeBalance(balance: number, seq: number): void {
+    this.balances.remove(balance, seq);
+    const rank = this.balances.countAtMost(balance) + 1;
+    this.rankWeightedSum -= rank * balance + this.balances.sumAbove(balance);
+  }
+}
+
+/**
+ * Incrementally maintained holder distribution per mint.
+ * Each change costs O(log n) in the number of holders, and every aggregate
+ * (top holder, top 10, whales, Gini) is read in O(log n), so risk factors
+ * can be refreshed after every transfer without refetching holders.
+ */
+export class HolderTracker {
+  private mints = new Map<string, MintHolders>();
+  private whaleThreshold: number;
+
+  constructor(options: HolderTrackerOptions = {}) {
+    this.whaleThreshold = options.whaleThreshold ?? 5;
+  }
+
+  /**
+   * Apply one balance change; returns false if it was stale
+   */
+  apply(change: HolderChange): boolean {
+    return this.stateFor(change.mint).apply(change);
+  }
+
+  /**
+   * Fix the supply used for percentages (raw units). Without it the sum of
+   * tracked balances is used, which is exact once every account is seeded.
+   */
+  setSupply(mint: string, supply: number): void {
+    this.stateFor(mint).supply = supply;
+  }
+
+  /**
+   * Mints with tracked state
+   */
+  trackedMints(): string[] {
+    return [...this.mints.keys()];
+  }
+
+  /**
+   * Current aggregates for a mint, or null if nothing was tracked
+   */
+  getAggregates(mint: string): HolderAggregates | null {
+    const state = this.mints.get(mint);
+    if (!state) return null;
+
+    const { balances } = state;
+    const count = balances.size;
+    const totalBalance = balances.total;
+    const supply = state.supply ?? totalBalance;
+    const percent = (value: number) => (supply > 0 ? (value / supply) * 100 : 0);
+
+    const whaleFloor = (supply * this.whaleThreshold) / 100;
+    const gini =
+      count > 0 && totalBalance > 0
+        ? (2 * state.rankWeightedSum) / (count * totalBalance) - (count + 1) / count
+        : 0;
+
+    return {
+      count,
+      totalBalance,
+      supply,
+      topHolderPercentage: percent(balances.max()),
+      top10HolderPercentage: percent(balances.sumLargest(10)),
+      whaleCount: count - balances.countAtMost(whaleFloor),
+      whalePercentage: percent(balances.sumAbove(whaleFloor)),
+      gini: Math.max(0, gini),
+      updates: state.updates,
+      lastSlot: state.lastSlot,
+    };
+  }
+
+  /**
+   * Drop all state for a mint
+   */
+  reset(mint: string): void {
+    this.mints.delete(mint);
+  }
+
+  private stateFor(mint: string): MintHolders {
+    let state = this.mints.get(mint);
+    if (!state) {
+      state = new MintHolders();
+      this.mints.set(mint, state);
+    }
+    return state;
+  }
+}
+
+/**
+ * Decode a token account (owner at 32, u64 amount at 64) into a change
+ */
+export function decodeTokenAccountChange(
+  mint: string,
+  account: string,
+  data: Buffer,
+  slot?: number
+): HolderChange | null {
+  if (data.length < 72) return null;
+  return {
+    mint,
+    account,
+    owner: new PublicKey(data.subarray(32, 64)).toBase58(),
+    amount: Number(data.readBigUInt64LE(64)),
+    slot,
+  };
+}
+
+/**
+ * Feed a tracker from a programSubscribe websocket on the mint's token
+ * accounts. Returns a function that removes the subscription.
+ */
+export function subscribeHolderChanges(
+  connection: Connection,
+  mintPubkey: PublicKey,
+  tracker: HolderTracker,
+  options: { programId?: PublicKey; onChange?: (change: HolderChange) => void } = {}
+): () => Promise<void> {
+  const programId = options.programId ?? TOKEN_PROGRAM_ID;
+  const mint = mintPubkey.toBase58();
+  const filters: GetProgramAccountsFilter[] = [{ memcmp: { offset: 0, bytes: mint } }];
+  if (programId.equals(TOKEN_PROGRAM_ID)) {
+    filters.push({ dataSize: 165 });
+  }
+
+  const subscriptionId = connection.onProgramAccountChange(
+    programId,
+    (keyed: KeyedAccountInfo, context: Context) => {
+      const change = decodeTokenAccountChange(
+        mint,
+        keyed.accountId.toBase58(),
+        keyed.accountInfo.data,
+        context.slot
+      );
+      if (change && tracker.apply(change)) {
+        options.onChange?.(change);
+      }
+    },
+    'confirmed',
+    filters
+  );
+
+  return () => connection.removeProgramAccountChangeListener(subscriptionId);
+}
+
+/**
+ * Replay a newline-delimited JSON log of HolderChange records into a
+ * tracker (local stand-in for the websocket feed). Returns lines applied.
+ */
+export async function replayHolderLog(path: string, tracker: HolderTracker): Promise<number> {
+  const lines = createInterface({ input: createReadStream(path), crlfDelay: Infinity });
+  let applied = 0;
+
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+    if (tracker.apply(JSON.parse(line) as HolderChange)) {
+      applied++;
+    }
+  }
+
+  return applied;
+}
@@ -6,15 +6,55 @@
 
 export { TokenAnalyzer } from './token-analyzer.js';
 export { SolanaClient } from './solana-client.js';
+export { TokenBucket } from './rate-limiter.js';
+export { RpcPool, isTransientError } from './rpc-pool.js';
+export type { RpcEndpointConfig, RpcEndpointStats, RpcPoolOptions, RpcTarget } from './rpc-pool.js';
+export { HolderAggregator, buildHolderScanRequest } from './holder-scanner.js';
+export type { HolderScanResult } from './holder-scanner.js';
 export {
+  HolderTracker,
+  decodeTokenAccountChange,
+  subscribeHolderChanges,
+  replayHolderLog,
+} from './holder-tracker.js';
+export type { HolderChange, HolderAggregates, HolderTrackerOptions } from './holder-tracker.js';
+export {
+  MetricsRegistry,
+  Counter,
+  Gauge,
+  Histogram,
+  metrics,
+  mergeMetrics,
+  renderMetrics,
+  serveMetrics,
+  DEFAULT_BUCKETS,
+} from './metrics.js';
+export type { MetricSnapshot, MetricType } from './metrics.js';
+export { MemoryCache, FileCache, RedisCache, DEFAULT_CACHE_TTL } from './cache.js';
+export type { CacheStore, CacheTtlConfig, CacheStats, RedisLike } from './cache.js';
+export { fingerprintMint } from './fingerprint.js';
+export {
+  decodeMintSnapshot,
+  decodeMetaplexMetadata,
+  findMetadataAddress,
+  formatTokenAmount,
+} from './account-decoder.js';
+export { TokenFetchError, TokenDataError } from './types.js';
+export type {
   TokenMetadata,
   TokenSupply,
   HolderDistribution,
   ProgramOwnership,
   TokenAnalysis,
-  TokenFetchError,
-  TokenDataError,
   SolanaClientConfig,
+  BatchAnalysisOptions,
+  BatchAnalysisResult,
+  MintSnapshot,
+  AnalyzeOptions,
+  AnalysisTimings,
+  TokenFingerprint,
+  HolderSource,
+  MintAccounts,
 } from './types.js';
 
 // Re-export commonly used Solana types
@@ -0,0 +1,325 @@
+import http from 'node:http';
+
+/**
+ * Minimal Prometheus-style metrics: counters, gauges and histograms with
+ * labels, rendered in the text exposition format. Snapshots are plain JSON
+ * so per-process registries can be merged (e.g. across cluster workers).
+ */
+
+export type MetricType = 'counter' | 'gauge' | 'histogram';
+
+/**
+ * Latency buckets in seconds, from 1ms RPC cache hits to 30s holder scans
+ */
+export const DEFAULT_BUCKETS = [
+  0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30,
+];
+
+/**
+ * JSON form of one metric and all its label combinations
+ */
+export interface MetricSnapshot {
+  name: string;
+  help: string;
+  type: MetricType;
+  labelNames: string[];
+  buckets?: number[];
+  series: Array<{
+    labels: string[];
+    value?: number; // Counters and gauges
+    counts?: number[]; // Histograms: per bucket (not cumulative), then +Inf
+    sum?: number;
+    count?: number;
+  }>;
+}
+
+type Series = MetricSnapshot['series'][number];
+type LabelValues = Record<string, string | number>;
+
+abstract class Metric {
+  protected series = new Map<string, Series>();
+
+  constructor(
+    public readonly name: string,
+    public readonly help: string,
+    public readonly type: MetricType,
+    public readonly labelNames: string[]
+  ) {}
+
+  protected seriesFor(labels: LabelValues = {}): Series {
+    const values = this.labelNames.map((name) => String(labels[name] ?? ''));
+    const key = values.join('\u0001');
+    let series = this.series.get(key);
+    if (!series) {
+      series = this.createSeries(values);
+      this.series.set(key, series);
+    }
+    return series;
+  }
+
+  protected createSeries(labels: string[]): Series {
+    return { labels, value: 0 };
+  }
+
+  snapshot(): MetricSnapshot {
+    return {
+      name: this.name,
+      help: this.help,
+      type: this.type,
+      labelNames: this.labelNames,
+      series: [...this.series.values()].map((series) => ({
+        ...series,
+        labels: [...series.labels],
+        counts: series.counts && [...series.counts],
+      })),
+    };
+  }
+}
+
+export class Counter extends Metric {
+  constructor(name: string, help: string, labelNames: string[] = []) {
+    super(name, help, 'counter', labelNames);
+  }
+
+  inc(labels?: LabelValues, value: number = 1): void {
+    this.seriesFor(labels).value! += value;
+  }
+}
+
+export class Gauge extends Metric {
+  constructor(name: string, help: string, labelNames: string[] = []) {
+    super(name, help, 'gauge', labelNames);
+  }
+
+  set(labels: LabelValues, value: number): void {
+    this.seriesFor(labels).value = value;
+  }
+
+  inc(labels?: LabelValues, value: number = 1): void {
+    this.seriesFor(labels).value! += value;
+  }
+
+  dec(labels?: LabelValues, value: number = 1): void {
+    this.seriesFor(labels).value! -= value;
+  }
+}
+
+export class Histogram extends Metric {
+  constructor(
+    name: string,
+    help: string,
+    labelNames: string[] = [],
+    public readonly buckets: number[] = DEFAULT_BUCKETS
+  ) {
+    super(name, help, 'histogram', labelNames);
+  }
+
+  protected createSeries(labels: string[]): Series {
+    return { labels, counts: new Array(this.buckets.length + 1).fill(0), sum: 0, count: 0 };
+  }
+
+  /**
+   * Record one observation (seconds)
+   */
+  observe(labels: LabelValues | undefined, seconds: number): void {
+    const series = this.seriesFor(labels);
+    let bucket = 0;
+    while (bucket < this.buckets.length && seconds > this.buckets[bucket]) bucket++;
+    series.counts![bucket]++;
+    series.sum! += seconds;
+    series.count!++;
+  }
+
+  /**
+   * Start timing; the returned function records the elapsed time with the
+   * given labels (merged over the start labels) and returns it in seconds
+   */
+  startTimer(labels: LabelValues = {}): (endLabels?: LabelValues) => number {
+    const start = performance.now();
+    return (endLabels) => {
+      const seconds = (performance.now() - start) / 1000;
+      this.observe(endLabels ? { ...labels, ...endLabels } : labels, seconds);
+      return seconds;
+    };
+  }
+
+  /**
+   * Time a promise, labelling the observation with outcome="ok" or "error"
+   */
+  async time<T>(labels: LabelValues, work: () => Promise<T>): Promise<T> {
+    const end = this.startTimer(labels);
+    try {
+      const result = await work();
+      end({ outcome: 'ok' });
+      return result;
+    } catch (error) {
+      end({ outcome: 'error' });
+      throw error;
+    }
+  }
+
+  snapshot(): MetricSnapshot {
+    return { ...super.snapshot(), buckets: this.buckets };
+  }
+}
+
+/**
+ * A set of named metrics plus collectors that refresh gauges right before
+ * each scrape
+ */
+export class MetricsRegistry {
+  private metrics = new Map<string, Metric>();
+  private collectors: Array<() => void | Promise<void>> = [];
+
+  counter(name: string, help: string, labelNames?: string[]): Counter {
+    return this.getOrCreate(name, () => new Counter(name, help, labelNames));
+  }
+
+  gauge(name: string, help: string, labelNames?: string[]): Gauge {
+    return this.getOrCreate(name, () => new Gauge(name, help, labelNames));
+  }
+
+  histogram(name: string, help: string, labelNames?: string[], buckets?: number[]): Histogram {
+    return this.getOrCreate(name, () => new Histogram(name, help, labelNames, buckets));
+  }
+
+  /**
+   * Run `collect` before every snapshot (e.g. to poll queue depth)
+   */
+  onCollect(collect: () => void | Promise<void>): void {
+    this.collectors.push(collect);
+  }
+
+  async snapshot(): Promise<MetricSnapshot[]> {
+    await Promise.all(
+      this.collectors.map(async (collect) => {
+        try {
+          await collect();
+        } catch {
+          // A failing collector leaves its gauges at their last values
+        }
+      })
+    );
+    return [...this.metrics.values()].map((metric) => metric.snapshot());
+  }
+
+  async render(): Promise<string> {
+    return renderMetrics(await this.snapshot());
+  }
+
+  private getOrCreate<T extends Metric>(name: string, create: () => T): T {
+    let metric = this.metrics.get(name);
+    if (!metric) {
+      metric = create();
+      this.metrics.set(name, metric);
+    }
+    return metric as T;
+  }
+}
+
+/**
+ * Process-wide registry used by the built-in instrumentation
+ */
+export const metrics = new MetricsRegistry();
+
+/**
+ * Sum snapshots from several processes: counters, gauges and histogram
+ * buckets with the same name and labels are added together
+ */
+export function mergeMetrics(snapshots: MetricSnapshot[][]): MetricSnapshot[] {
+  const merged = new Map<string, MetricSnapshot>();
+
+  for (const snapshot of snapshots) {
+    for (const metric of snapshot) {
+      let target = merged.get(metric.name);
+      if (!target) {
+        target = { ...metric, series: [] };
+        merged.set(metric.name, target);
+      }
+
+      for (const series of metric.series) {
+        const key = series.labels.join('\u0001');
+        const existing = target.series.find((s) => s.labels.join('\u0001') === key);
+        if (!existing) {
+          target.series.push({ ...series, counts: series.counts && [...series.counts] });
+        } else if (series.counts) {
+          series.counts.forEach((count, i) => (existing.counts![i] += count));
+          existing.sum! += series.sum!;
+          existing.count! += series.count!;
+        } else {
+          existing.value! += series.value!;
+        }
+      }
+    }
+  }
+
+  return [...merged.values()];
+}
+
+function escapeLabel(value: string): string {
+  return value.replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+}
+
+function formatLabels(names: string[], values: string[], extra?: string): string {
+  const pairs = names.map((name, i) => `${name}="${escapeLabel(values[i])}"`);
+  if (extra) pairs.push(extra);
+  return pairs.length ? `{${pairs.join(',')}}` : '';
+}
+
+/**
+ * Render snapshots in the Prometheus text exposition format (0.0.4)
+ */
+export function renderMetrics(snapshot: MetricSnapshot[]): string {
+  const lines: string[] = [];
+
+  for (const metric of snapshot) {
+    lines.push(`# HELP ${metric.name} ${metric.help}`);
+    lines.push(`# TYPE ${metric.name} ${metric.type}`);
+
+    for (const series of metric.series) {
+      if (metric.type !== 'histogram') {
+        lines.push(`${metric.name}${formatLabels(metric.labelNames, series.labels)} ${series.value}`);
+        continue;
+      }
+
+      let cumulative = 0;
+      metric.buckets!.forEach((bound, i) => {
+        cumulative += series.counts![i];
+        lines.push(
+          `${metric.name}_bucket${formatLabels(metric.labelNames, series.labels, `le="${bound}"`)} ${cumulative}`
+        );
+      });
+      lines.push(
+        `${metric.name}_bucket${formatLabels(metric.labelNames, series.labels, 'le="+Inf"')} ${series.count}`
+      );
+      lines.push(`${metric.name}_sum${formatLabels(metric.labelNames, series.labels)} ${series.sum}`);
+      lines.push(`${metric.name}_count${formatLabels(metric.labelNames, series.labels)} ${series.count}`);
+    }
+  }
+
+  return lines.join('\n') + '\n';
+}
+
+/**
+ * Serve GET /metrics over HTTP. `render` defaults to the process registry.
+ */
+export function serveMetrics(
+  port: number,
+  render: () => Promise<string> = () => metrics.render()
+): http.Server {
+  const server = http.createServer(async (req, res) => {
+    if (req.method !== 'GET' || req.url?.split('?')[0] !== '/metrics') {
+      res.writeHead(404).end();
+      return;
+    }
+    try {
+      const body = await render();
+      res.writeHead(200, { 'Content-Type': 'text/plain; version=0.0.4; charset=utf-8' });
+      res.end(body);
+    } catch (error) {
+      res.writeHead(500).end((error as Error).message);
+    }
+  });
+  server.listen(port);
+  return server;
+}
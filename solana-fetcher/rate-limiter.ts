@@ -0,0 +1,82 @@
+/**
+ * Token bucket rate limiter for RPC requests
+ *
+ * Tokens refill continuously at `ratePerSecond` up to `burst`. Callers
+ * await `take()` before issuing a request; waiters are served in FIFO order.
+ */
+export class TokenBucket {
+  private tokens: number;
+  private lastRefill: number;
+  private waiters: Array<{ count: number; resolve: () => void }> = [];
+  private timer: ReturnType<typeof setTimeout> | null = null;
+
+  constructor(
+    private ratePerSecond: number,
+    private burst: number = Math.max(1, Math.ceil(ratePerSecond))
+  ) {
+    if (ratePerSecond <= 0) {
+      throw new RangeError('ratePerSecond must be greater than 0');
+    }
+    this.tokens = this.burst;
+    this.lastRefill = Date.now();
+  }
+
+  /**
+   * Wait until `count` tokens are available and consume them
+   */
+  take(count: number = 1): Promise<void> {
+    count = Math.min(count, this.burst);
+    this.refill();
+    if (this.waiters.length === 0 && this.tokens >= count) {
+      this.tokens -= count;
+      return Promise.resolve();
+    }
+
+    return new Promise((resolve) => {
+      this.waiters.push({ count, resolve });
+      this.schedule();
+    });
+  }
+
+  /**
+   * Tokens currently available (after refill)
+   */
+  available(): number {
+    this.refill();
+    return this.tokens;
+  }
+
+  private refill(): void {
+    const now = Date.now();
+    const elapsed = (now - this.lastRefill) / 1000;
+    if (elapsed > 0) {
+      this.tokens = Math.min(this.burst, this.tokens + elapsed * this.ratePerSecond);
+      this.lastRefill = now;
+    }
+  }
+
+  private schedule(): void {
+    if (this.timer) return;
+
+    const head = this.waiters[0];
+    const deficit = Math.max(0, head.count - this.tokens);
+    const delay = Math.ceil((deficit / this.ratePerSecond) * 1000);
+
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.drain();
+    }, delay);
+  }
+
+  private drain(): void {
+    this.refill();
+    while (this.waiters.length > 0 && this.tokens >= this.waiters[0].count) {
+      const waiter = this.waiters.shift()!;
+      this.tokens -= waiter.count;
+      waiter.resolve();
+    }
+    if (this.waiters.length > 0) {
+      this.schedule();
+    }
+  }
+}
@@ -0,0 +1,340 @@
+import http from 'node:http';
+import https from 'node:https';
+import { Connection, Commitment } from '@solana/web3.js';
+import { TokenBucket } from './rate-limiter.js';
+
+/**
+ * One RPC provider in the pool
+ */
+export interface RpcEndpointConfig {
+  url: string;
+  weight?: number; // Relative share of traffic (default: 1)
+}
+
+/**
+ * Retry/failover policy shared by every request through the pool
+ */
+export interface RpcPoolOptions {
+  commitment?: Commitment;
+  timeout?: number; // Per-attempt timeout in ms (default: 30000)
+  maxRetries?: number; // Attempts per request across endpoints (default: 3)
+  retryDelayMs?: number; // Base exponential backoff delay (default: 250)
+  maxSockets?: number; // Keep-alive sockets per endpoint (default: 64)
+  limiter?: TokenBucket; // Rate limit taken before every attempt, retries included (default: none)
+}
+
+/**
+ * Per-endpoint health and latency statistics
+ */
+export interface RpcEndpointStats {
+  url: string;
+  weight: number;
+  health: number; // 0-1, moving average of attempt outcomes
+  requests: number;
+  failures: number;
+  throttled: number; // 429 responses
+  timeouts: number;
+  latencyMs: {
+    avg: number;
+    p50: number;
+    p95: number;
+  };
+  coolingDown: boolean;
+  lastError?: string;
+}
+
+/**
+ * Transport details of the endpoint chosen for an attempt, for requests
+ * that bypass web3.js (e.g. streamed responses)
+ */
+export interface RpcTarget {
+  url: string;
+  agent: http.Agent;
+  connection: Connection;
+  signal: AbortSignal; // Aborted when the attempt times out
+}
+
+interface Endpoint extends Omit<RpcTarget, 'signal'> {
+  health: number;
+  requests: number;
+  failures: number;
+  throttled: number;
+  timeouts: number;
+  latencies: number[]; // Ring buffer of recent successful latencies
+  latencyCursor: number;
+  latencySum: number;
+  latencyCount: number;
+  consecutiveThrottles: number;
+  cooldownUntil: number;
+  lastError?: string;
+}
+
+const HEALTH_ALPHA = 0.2;
+const MIN_HEALTH = 0.05;
+const LATENCY_WINDOW = 256;
+const MAX_COOLDOWN_MS = 30000;
+
+class RpcTimeoutError extends Error {
+  constructor(url: string, timeout: number) {
+    super(`RPC request to ${url} timed out after ${timeout}ms`);
+    this.name = 'RpcTimeoutError';
+  }
+}
+
+/**
+ * Pool of RPC endpoints with weighted load balancing, keep-alive agents and
+ * health-scored failover on 429 / 5xx / network errors / timeouts
+ */
+export class RpcPool {
+  private endpoints: Endpoint[];
+  private timeout: number;
+  private maxRetries: number;
+  private retryDelayMs: number;
+  private limiter: TokenBucket | null;
+
+  constructor(endpoints: Array<string | RpcEndpointConfig>, options: RpcPoolOptions = {}) {
+    if (endpoints.length === 0) {
+      throw new Error('RpcPool requires at least one endpoint');
+    }
+
+    this.timeout = options.timeout || 30000;
+    this.maxRetries = Math.max(1, options.maxRetries ?? 3);
+    this.retryDelayMs = options.retryDelayMs ?? 250;
+    this.limiter = options.limiter || null;
+
+    this.endpoints = endpoints.map((endpoint) => {
+      const { url, weight = 1 } = typeof endpoint === 'string' ? { url: endpoint } : endpoint;
+      const agentOptions = { keepAlive: true, maxSockets: options.maxSockets || 64 };
+      const httpAgent = url.startsWith('https:')
+        ? new https.Agent(agentOptions)
+        : new http.Agent(agentOptions);
+
+      return {
+        url,
+        weight,
+        agent: httpAgent,
+        connection: new Connection(url, {
+          commitment: options.commitment || 'confirmed',
+          confirmTransactionInitialTimeout: this.timeout,
+          httpAgent,
+          // Throttling is handled here by failing over, not by sleeping in place
+          disableRetryOnRateLimit: true,
+        }),
+        health: 1,
+        requests: 0,
+        failures: 0,
+        throttled: 0,
+        timeouts: 0,
+        latencies: [],
+        latencyCursor: 0,
+        latencySum: 0,
+        latencyCount: 0,
+        consecutiveThrottles: 0,
+        cooldownUntil: 0,
+      };
+    });
+  }
+
+  /**
+   * Connection of the first (primary) endpoint
+   */
+  get primary(): Connection {
+    return this.endpoints[0].connection;
+  }
+
+  /**
+   * Run a request against a healthy endpoint, failing over to others on
+   * transient errors with exponential backoff
+   */
+  async request<T>(
+    send: (connection: Connection) => Promise<T>,
+    maxRetries: number = this.maxRetries
+  ): Promise<T> {
+    return this.requestTarget((target) => send(target.connection), { maxRetries });
+  }
+
+  /**
+   * Like request(), but hands the sender the endpoint URL and keep-alive
+   * agent so it can issue its own HTTP request
+   */
+  async requestTarget<T>(
+    send: (target: RpcTarget) => Promise<T>,
+    options: { maxRetries?: number; timeout?: number } = {}
+  ): Promise<T> {
+    const maxRetries = Math.max(1, options.maxRetries ?? this.maxRetries);
+    const timeout = options.timeout ?? this.timeout;
+    let lastError: unknown;
+    const tried = new Set<Endpoint>();
+
+    for (let attempt = 0; attempt < maxRetries; attempt++) {
+      if (attempt > 0) {
+        const backoff = this.retryDelayMs * Math.pow(2, attempt - 1);
+        await new Promise((resolve) => setTimeout(resolve, backoff * (0.5 + Math.random())));
+      }
+
+      // Every attempt is a request on the wire, so a 429 burst can't multiply the rate
+      if (this.limiter) {
+        await this.limiter.take();
+      }
+
+      const endpoint = this.pick(tried);
+      tried.add(endpoint);
+
+      try {
+        return await this.attempt(endpoint, send, timeout);
+      } catch (error) {
+        lastError = error;
+        if (!isTransientError(error)) {
+          throw error;
+        }
+      }
+    }
+
+    throw lastError;
+  }
+
+  /**
+   * Per-endpoint statistics
+   */
+  getStats(): RpcEndpointStats[] {
+    const now = Date.now();
+    return this.endpoints.map((endpoint) => {
+      const sorted = [...endpoint.latencies].sort((a, b) => a - b);
+      const quantile = (q: number) =>
+        sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))] : 0;
+
+      return {
+        url: endpoint.url,
+        weight: endpoint.weight,
+        health: endpoint.health,
+        requests: endpoint.requests,
+        failures: endpoint.failures,
+        throttled: endpoint.throttled,
+        timeouts: endpoint.timeouts,
+        latencyMs: {
+          avg: endpoint.latencyCount ? endpoint.latencySum / endpoint.latencyCount : 0,
+          p50: quantile(0.5),
+          p95: quantile(0.95),
+        },
+        coolingDown: endpoint.cooldownUntil > now,
+        lastError: endpoint.lastError,
+      };
+    });
+  }
+
+  private async attempt<T>(
+    endpoint: Endpoint,
+    send: (target: RpcTarget) => Promise<T>,
+    timeout: number
+  ): Promise<T> {
+    const start = performance.now();
+    const controller = new AbortController();
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    endpoint.requests++;
+
+    try {
+      const { url, agent, connection } = endpoint;
+      const result = await Promise.race([
+        send({ url, agent, connection, signal: controller.signal }),
+        new Promise<never>((_, reject) => {
+          timer = setTimeout(() => {
+            controller.abort();
+            reject(new RpcTimeoutError(endpoint.url, timeout));
+          }, timeout);
+        }),
+      ]);
+      this.recordSuccess(endpoint, performance.now() - start);
+      return result;
+    } catch (error) {
+      // Non-transient errors (e.g. account not found) say nothing about endpoint health
+      if (isTransientError(error)) {
+        this.recordFailure(endpoint, error);
+      }
+      throw error;
+    } finally {
+      clearTimeout(timer);
+    }
+  }
+
+  /**
+   * Weighted random choice by weight × health, preferring endpoints that are
+   * not cooling down and were not already tried for this request
+   */
+  private pick(tried: Set<Endpoint>): Endpoint {
+    const now = Date.now();
+    const candidates = [
+      (e: Endpoint) => !tried.has(e) && e.cooldownUntil <= now,
+      (e: Endpoint) => e.cooldownUntil <= now,
+      () => true,
+    ];
+
+    for (const filter of candidates) {
+      const available = this.endpoints.filter(filter);
+      if (available.length === 0) continue;
+
+      const total = available.reduce((sum, e) => sum + e.weight * e.health, 0);
+      let roll = Math.random() * total;
+      for (const endpoint of available) {
+        roll -= endpoint.weight * endpoint.health;
+        if (roll <= 0) return endpoint;
+      }
+      return available[available.length - 1];
+    }
+
+    return this.endpoints[0];
+  }
+
+  private recordSuccess(endpoint: Endpoint, latencyMs: number): void {
+    endpoint.health = endpoint.health + HEALTH_ALPHA * (1 - endpoint.health);
+    endpoint.consecutiveThrottles = 0;
+
+    if (endpoint.latencies.length < LATENCY_WINDOW) {
+      endpoint.latencies.push(latencyMs);
+    } else {
+      endpoint.latencies[endpoint.latencyCursor] = latencyMs;
+      endpoint.latencyCursor = (endpoint.latencyCursor + 1) % LATENCY_WINDOW;
+    }
+    endpoint.latencySum += latencyMs;
+    endpoint.latencyCount++;
+  }
+
+  private recordFailure(endpoint: Endpoint, error: unknown): void {
+    endpoint.failures++;
+    endpoint.health = Math.max(MIN_HEALTH, endpoint.health * (1 - HEALTH_ALPHA));
+    endpoint.lastError = error instanceof Error ? error.message : String(error);
+
+    if (error instanceof RpcTimeoutError) {
+      endpoint.timeouts++;
+    }
+
+    if (isRateLimitError(error)) {
+      endpoint.throttled++;
+      endpoint.consecutiveThrottles++;
+      // Back off this endpoint: 500ms, 1s, 2s ... up to 30s
+      const cooldown = Math.min(MAX_COOLDOWN_MS, 500 * Math.pow(2, endpoint.consecutiveThrottles - 1));
+      endpoint.cooldownUntil = Date.now() + cooldown;
+    }
+  }
+}
+
+function errorMessage(error: unknown): string {
+  return error instanceof Error ? error.message : String(error);
+}
+
+function isRateLimitError(error: unknown): boolean {
+  return /\b429\b|too many requests/i.test(errorMessage(error));
+}
+
+/**
+ * Throttling, server errors, timeouts and connection failures are worth
+ * retrying on another endpoint; anything else is a real answer.
+ */
+export function isTransientError(error: unknown): boolean {
+  if (error instanceof RpcTimeoutError) return true;
+  return (
+    isRateLimitError(error) ||
+    /\b5\d\d\b|fetch failed|socket hang up|ECONNRESET|ECONNREFUSED|ETIMEDOUT|EAI_AGAIN/i.test(
+      errorMessage(error)
+    )
+  );
+}
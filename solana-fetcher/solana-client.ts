@@ -15,31 +15,192 @@ import {
   SolanaClientConfig,
   TokenDataError,
   TokenFetchError,
+  MintSnapshot,
+  MintAccounts,
 } from './types.js';
+import { TokenBucket } from './rate-limiter.js';
+import { RpcPool, RpcEndpointStats } from './rpc-pool.js';
+import {
+  CacheStore,
+  CacheTtlConfig,
+  CacheDataClass,
+  CacheStats,
+  DEFAULT_CACHE_TTL,
+} from './cache.js';
+import { HolderAggregator, HolderScanResult, scanTokenHolders } from './holder-scanner.js';
+import {
+  findMetadataAddress,
+  decodeMetaplexMetadata,
+  decodeMintSnapshot,
+} from './account-decoder.js';
+import { metrics } from './metrics.js';
+
+const rpcDuration = metrics.histogram(
+  'solana_rpc_request_duration_seconds',
+  'Solana RPC call duration including retries, by method and outcome',
+  ['method', 'outcome']
+);
+const cacheLookups = metrics.counter(
+  'solana_cache_lookups_total',
+  'SolanaClient cache lookups by data class and result',
+  ['class', 'result']
+);
+
+/**
+ * Maximum number of accounts per getMultipleAccounts request
+ */
+const MAX_MULTIPLE_ACCOUNTS = 100;
+
+/**
+ * Full holder scans download every token account of a mint, so they get a
+ * longer per-attempt timeout than regular RPC calls
+ */
+const HOLDER_SCAN_TIMEOUT_MULTIPLIER = 4;
+
+/**
+ * Off-chain metadata JSON comes from arbitrary hosts, so it gets a short
+ * timeout and a size cap; a token without it just has no description
+ */
+const OFF_CHAIN_METADATA_TIMEOUT_MS = 5000;
+const OFF_CHAIN_METADATA_MAX_BYTES = 256 * 1024;
+
+/**
+ * HTTPS URL of a Metaplex metadata uri (ipfs:// and ar:// through public
+ * gateways), or null for anything else
+ */
+function offChainMetadataUrl(uri: string): string | null {
+  const trimmed = uri.trim();
+  if (trimmed.startsWith('ipfs://')) return `https://ipfs.io/ipfs/${trimmed.slice('ipfs://'.length)}`;
+  if (trimmed.startsWith('ar://')) return `https://arweave.net/${trimmed.slice('ar://'.length)}`;
+  return trimmed.startsWith('https://') ? trimmed : null;
+}
+
+/**
+ * Cached pieces of a MintSnapshot, one per cache data class
+ */
+interface CachedSnapshotParts {
+  immutable?: Pick<MintSnapshot, 'programId' | 'decimals'>;
+  authorities?: Pick<
+    MintSnapshot,
+    'supply' | 'uiSupply' | 'mintAuthority' | 'freezeAuthority' | 'isInitialized' | 'lamports'
+  >;
+  metadata?: Pick<MintSnapshot, 'metadata'>;
+}
+
+/**
+ * JSON-safe form of a largest-accounts entry for the cache
+ */
+interface CachedBalancePair {
+  address: string;
+  amount: string;
+  decimals: number;
+  uiAmount: number | null;
+  uiAmountString?: string;
+}
 
 /**
  * SolanaClient handles all interactions with Solana blockchain
  */
 export class SolanaClient {
-  private connection: Connection;
+  private pool: RpcPool;
   private timeout: number;
+  private cache: CacheStore | null;
+  private cacheTtl: CacheTtlConfig;
+  private cacheStats: CacheStats = {
+    immutable: { hits: 0, misses: 0 },
+    authorities: { hits: 0, misses: 0 },
+    metadata: { hits: 0, misses: 0 },
+    holders: { hits: 0, misses: 0 },
+  };
 
   constructor(config: SolanaClientConfig = {}) {
     const rpcUrl = config.rpcUrl || 'https://api.mainnet-beta.solana.com';
     const commitment = config.commitment || 'confirmed';
     this.timeout = config.timeout || 30000;
+    this.cache = config.cache || null;
+    this.cacheTtl = { ...DEFAULT_CACHE_TTL, ...config.cacheTtl };
 
-    this.connection = new Connection(rpcUrl, {
+    this.pool = new RpcPool(config.rpcEndpoints?.length ? config.rpcEndpoints : [rpcUrl], {
       commitment,
-      confirmTransactionInitialTimeout: this.timeout,
+      timeout: this.timeout,
+      maxRetries: config.maxRetries,
+      retryDelayMs: config.retryDelayMs,
+      maxSockets: config.maxSockets,
+      limiter: config.requestsPerSecond
+        ? new TokenBucket(config.requestsPerSecond, config.burst)
+        : undefined,
     });
   }
 
   /**
-   * Get the connection instance
+   * Get the connection instance (primary endpoint)
    */
   getConnection(): Connection {
-    return this.connection;
+    return this.pool.primary;
+  }
+
+  /**
+   * Get health and latency statistics per RPC endpoint
+   */
+  getRpcStats(): RpcEndpointStats[] {
+    return this.pool.getStats();
+  }
+
+  /**
+   * Get the configured request timeout in milliseconds
+   */
+  getTimeout(): number {
+    return this.timeout;
+  }
+
+  /**
+   * Get cache hit/miss counters per data class
+   */
+  getCacheStats(): CacheStats {
+    return JSON.parse(JSON.stringify(this.cacheStats));
+  }
+
+  /**
+   * Read a cached value for a data class, counting hits and misses
+   */
+  private async cacheGet<T>(dataClass: CacheDataClass, key: string): Promise<T | undefined> {
+    if (!this.cache) return undefined;
+    let value: T | undefined;
+    try {
+      value = await this.cache.get<T>(key);
+    } catch {
+      // A failing cache backend behaves like a miss
+      value = undefined;
+    }
+    if (value === undefined) {
+      this.cacheStats[dataClass].misses++;
+    } else {
+      this.cacheStats[dataClass].hits++;
+    }
+    cacheLookups.inc({ class: dataClass, result: value === undefined ? 'miss' : 'hit' });
+    return value;
+  }
+
+  private async cacheSet<T>(dataClass: CacheDataClass, key: string, value: T): Promise<void> {
+    if (!this.cache) return;
+    try {
+      await this.cache.set(key, value, this.cacheTtl[dataClass]);
+    } catch {
+      // Caching is best effort
+    }
+  }
+
+  /**
+   * Run a single RPC request through the endpoint pool, which waits for the
+   * rate limiter before each attempt. Transient failures are retried on
+   * other endpoints.
+   */
+  private async rpc<T>(
+    method: string,
+    request: (connection: Connection) => Promise<T>,
+    maxRetries?: number
+  ): Promise<T> {
+    return rpcDuration.time({ method }, () => this.pool.request(request, maxRetries));
   }
 
   /**
@@ -50,7 +211,7 @@ export class SolanaClient {
       const pubkey = new PublicKey(mintAddress);
       
       // Check if account exists
-      const accountInfo = await this.connection.getAccountInfo(pubkey);
+      const accountInfo = await this.rpc('getAccountInfo', (c) => c.getAccountInfo(pubkey));
       if (!accountInfo) {
         throw new TokenDataError(
           TokenFetchError.INVALID_MINT,
@@ -77,20 +238,14 @@ export class SolanaClient {
     try {
       // Try TOKEN_PROGRAM_ID first
       try {
-        const mintInfo = await getMint(
-          this.connection,
-          mintPubkey,
-          'confirmed',
-          TOKEN_PROGRAM_ID
+        const mintInfo = await this.rpc('getAccountInfo', (c) =>
+          getMint(c, mintPubkey, 'confirmed', TOKEN_PROGRAM_ID)
         );
         return { mintInfo, programId: TOKEN_PROGRAM_ID };
       } catch (e) {
         // Try TOKEN_2022_PROGRAM_ID if standard token program fails
-        const mintInfo = await getMint(
-          this.connection,
-          mintPubkey,
-          'confirmed',
-          TOKEN_2022_PROGRAM_ID
+        const mintInfo = await this.rpc('getAccountInfo', (c) =>
+          getMint(c, mintPubkey, 'confirmed', TOKEN_2022_PROGRAM_ID)
         );
         return { mintInfo, programId: TOKEN_2022_PROGRAM_ID };
       }
@@ -104,11 +259,30 @@ export class SolanaClient {
   }
 
   /**
-   * Get all token accounts for a specific mint
+   * Get all token accounts for a specific mint. bypassCache skips the
+   * cached copy (the fresh result is still cached).
    */
-  async getTokenAccounts(mintPubkey: PublicKey): Promise<TokenAccountBalancePair[]> {
+  async getTokenAccounts(
+    mintPubkey: PublicKey,
+    options: { bypassCache?: boolean } = {}
+  ): Promise<TokenAccountBalancePair[]> {
+    const cacheKey = `holders:${mintPubkey.toBase58()}`;
+    const cached = options.bypassCache
+      ? undefined
+      : await this.cacheGet<CachedBalancePair[]>('holders', cacheKey);
+    if (cached) {
+      return cached.map((pair) => ({ ...pair, address: new PublicKey(pair.address) }));
+    }
+
     try {
-      const response = await this.connection.getTokenLargestAccounts(mintPubkey);
+      const response = await this.rpc('getTokenLargestAccounts', (c) =>
+        c.getTokenLargestAccounts(mintPubkey)
+      );
+      await this.cacheSet<CachedBalancePair[]>(
+        'holders',
+        cacheKey,
+        response.value.map((pair) => ({ ...pair, address: pair.address.toBase58() }))
+      );
       return response.value;
     } catch (error) {
       throw new TokenDataError(
@@ -119,12 +293,53 @@ export class SolanaClient {
     }
   }
 
+  /**
+   * Enumerate every token account of a mint with a streamed
+   * getProgramAccounts call (memcmp on the mint, owner + amount data slice)
+   * and aggregate balances per owner. Memory is bounded by maxOwners; past
+   * that the result is approximate. Cached under the holders data class;
+   * bypassCache skips the cached copy.
+   */
+  async scanTokenHolders(
+    mintPubkey: PublicKey,
+    programId: PublicKey,
+    options: { topN?: number; maxOwners?: number; bypassCache?: boolean } = {}
+  ): Promise<HolderScanResult> {
+    const cacheKey = `holders:${mintPubkey.toBase58()}:full`;
+    const cached = options.bypassCache
+      ? undefined
+      : await this.cacheGet<HolderScanResult>('holders', cacheKey);
+    if (cached) return cached;
+
+    try {
+      const result = await rpcDuration.time({ method: 'getProgramAccounts' }, () =>
+        this.pool.requestTarget(
+          async (target) => {
+            // Fresh aggregator per attempt so a failed stream never leaks partial counts
+            const aggregator = new HolderAggregator(options.maxOwners);
+            await scanTokenHolders(target, mintPubkey, programId, aggregator);
+            return aggregator.result(options.topN);
+          },
+          { timeout: this.timeout * HOLDER_SCAN_TIMEOUT_MULTIPLIER }
+        )
+      );
+      await this.cacheSet('holders', cacheKey, result);
+      return result;
+    } catch (error) {
+      throw new TokenDataError(
+        TokenFetchError.NETWORK_ERROR,
+        `Failed to scan token holders for ${mintPubkey.toBase58()}`,
+        error as Error
+      );
+    }
+  }
+
   /**
    * Get token supply information
    */
   async getTokenSupply(mintPubkey: PublicKey) {
     try {
-      const supply = await this.connection.getTokenSupply(mintPubkey);
+      const supply = await this.rpc('getTokenSupply', (c) => c.getTokenSupply(mintPubkey));
       return supply.value;
     } catch (error) {
       throw new TokenDataError(
@@ -140,42 +355,216 @@ export class SolanaClient {
    */
   async getMetaplexMetadata(mintPubkey: PublicKey): Promise<any | null> {
     try {
-      // Metaplex metadata PDA derivation
-      const METADATA_PROGRAM_ID = new PublicKey(
-        'metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s'
-      );
-
-      const [metadataPDA] = PublicKey.findProgramAddressSync(
-        [
-          Buffer.from('metadata'),
-          METADATA_PROGRAM_ID.toBuffer(),
-          mintPubkey.toBuffer(),
-        ],
-        METADATA_PROGRAM_ID
-      );
-
-      const accountInfo = await this.connection.getAccountInfo(metadataPDA);
+      const metadataPDA = findMetadataAddress(mintPubkey);
+      const accountInfo = await this.rpc('getAccountInfo', (c) => c.getAccountInfo(metadataPDA));
       
       if (!accountInfo) return null;
 
-      // Basic parsing - in production you'd use @metaplex-foundation/mpl-token-metadata
-      // For hackathon speed, we'll just extract what we can
-      const data = accountInfo.data;
-      
-      // Simple UTF-8 extraction (not robust, but works for demo)
-      const nameMatch = data.toString('utf8').match(/[\x20-\x7E]{2,32}/g);
-      
-      return {
-        name: nameMatch?.[0] || undefined,
-        symbol: nameMatch?.[1] || undefined,
-        uri: nameMatch?.[2] || undefined,
-      };
+      return decodeMetaplexMetadata(accountInfo.data);
     } catch (error) {
       // Metadata is optional, don't throw
       return null;
     }
   }
 
+  /**
+   * Project description from the off-chain metadata JSON a Metaplex uri
+   * points to, or null when there is none. Best effort: unreachable,
+   * oversized or malformed documents also give null (and are not cached).
+   * Cached under the metadata data class.
+   */
+  async getOffChainDescription(uri: string): Promise<string | null> {
+    const url = offChainMetadataUrl(uri);
+    if (!url) return null;
+
+    const cacheKey = `offchain:${url}`;
+    const cached = await this.cacheGet<{ description: string | null }>('metadata', cacheKey);
+    if (cached) return cached.description;
+
+    try {
+      const response = await fetch(url, { signal: AbortSignal.timeout(OFF_CHAIN_METADATA_TIMEOUT_MS) });
+      if (!response.ok || Number(response.headers.get('content-length')) > OFF_CHAIN_METADATA_MAX_BYTES) {
+        return null;
+      }
+      const body = await response.text();
+      if (body.length > OFF_CHAIN_METADATA_MAX_BYTES) return null;
+
+      const { description } = JSON.parse(body) ?? {};
+      const result = typeof description === 'string' && description.trim() ? description.trim() : null;
+      await this.cacheSet('metadata', cacheKey, { description: result });
+      return result;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Fetch mint accounts and their metadata PDAs for many mints with
+   * getMultipleAccounts, decoding mint layout, program and supply locally.
+   * Missing accounts and non-mint accounts map to null.
+   * With a cache, only stale pieces are fetched: fresh metadata skips the
+   * metadata PDA, fresh authorities (with the immutable fields) skip the
+   * mint account, and mints with every piece fresh need no RPC at all.
+   */
+  async getMintSnapshots(mintPubkeys: PublicKey[]): Promise<Map<string, MintSnapshot | null>> {
+    if (!this.cache) {
+      return this.fetchMintSnapshots(mintPubkeys);
+    }
+
+    const snapshots = new Map<string, MintSnapshot | null>();
+    const stale: Array<{ mintPubkey: PublicKey; parts: CachedSnapshotParts }> = [];
+
+    await Promise.all(
+      mintPubkeys.map(async (mintPubkey) => {
+        const mintAddress = mintPubkey.toBase58();
+        const parts = await this.getCachedSnapshotParts(mintAddress);
+        if (parts.immutable && parts.authorities && parts.metadata) {
+          snapshots.set(mintAddress, { mintAddress, ...parts.immutable, ...parts.authorities, ...parts.metadata });
+        } else {
+          stale.push({ mintPubkey, parts });
+        }
+      })
+    );
+
+    if (stale.length > 0) {
+      const keys: PublicKey[] = [];
+      const requests = stale.map(({ mintPubkey, parts }) => {
+        const mintIndex = !parts.immutable || !parts.authorities ? keys.push(mintPubkey) - 1 : -1;
+        const metadataIndex = !parts.metadata ? keys.push(findMetadataAddress(mintPubkey)) - 1 : -1;
+        return { mintIndex, metadataIndex };
+      });
+      const accounts = await this.fetchAccounts(keys, stale.length);
+
+      await Promise.all(
+        stale.map(async ({ mintPubkey, parts }, i) => {
+          const { mintIndex, metadataIndex } = requests[i];
+          const mintAddress = mintPubkey.toBase58();
+          const metadataAccount = metadataIndex >= 0 ? accounts[metadataIndex] : null;
+
+          let snapshot: MintSnapshot | null;
+          if (mintIndex >= 0) {
+            snapshot = decodeMintSnapshot(mintPubkey, accounts[mintIndex], metadataAccount);
+            if (snapshot && parts.metadata) snapshot.metadata = parts.metadata.metadata;
+          } else {
+            snapshot = {
+              mintAddress,
+              ...parts.immutable!,
+              ...parts.authorities!,
+              metadata: metadataAccount ? decodeMetaplexMetadata(metadataAccount.data) : null,
+            };
+          }
+
+          snapshots.set(mintAddress, snapshot);
+          if (snapshot) await this.cacheSnapshot(snapshot, mintIndex >= 0, metadataIndex >= 0);
+        })
+      );
+    }
+
+    // Preserve input order
+    return new Map(mintPubkeys.map((p) => [p.toBase58(), snapshots.get(p.toBase58()) ?? null]));
+  }
+
+  /**
+   * Read each cached piece of a snapshot; absent pieces are stale
+   */
+  private async getCachedSnapshotParts(mintAddress: string): Promise<CachedSnapshotParts> {
+    const [immutable, authorities, metadata] = await Promise.all([
+      this.cacheGet<CachedSnapshotParts['immutable']>('immutable', `mint:${mintAddress}:immutable`),
+      this.cacheGet<CachedSnapshotParts['authorities']>('authorities', `mint:${mintAddress}:authorities`),
+      this.cacheGet<CachedSnapshotParts['metadata']>('metadata', `mint:${mintAddress}:metadata`),
+    ]);
+    return { immutable, authorities, metadata };
+  }
+
+  /**
+   * Cache the pieces that were just fetched (re-setting a cached piece would
+   * extend its TTL without re-reading it)
+   */
+  private async cacheSnapshot(snapshot: MintSnapshot, mintFetched: boolean, metadataFetched: boolean): Promise<void> {
+    const { mintAddress } = snapshot;
+    const writes: Promise<void>[] = [];
+    if (mintFetched) {
+      writes.push(
+        this.cacheSet('immutable', `mint:${mintAddress}:immutable`, {
+          programId: snapshot.programId,
+          decimals: snapshot.decimals,
+        }),
+        this.cacheSet('authorities', `mint:${mintAddress}:authorities`, {
+          supply: snapshot.supply,
+          uiSupply: snapshot.uiSupply,
+          mintAuthority: snapshot.mintAuthority,
+          freezeAuthority: snapshot.freezeAuthority,
+          isInitialized: snapshot.isInitialized,
+          lamports: snapshot.lamports,
+        })
+      );
+    }
+    if (metadataFetched) {
+      writes.push(this.cacheSet('metadata', `mint:${mintAddress}:metadata`, { metadata: snapshot.metadata }));
+    }
+    await Promise.all(writes);
+  }
+
+  /**
+   * Fetch one mint's raw mint and metadata accounts over RPC, bypassing the
+   * cache, with the snapshot decoded from them. Null if the account is
+   * missing or not a token mint.
+   */
+  async fetchMintAccounts(
+    mintPubkey: PublicKey
+  ): Promise<{ snapshot: MintSnapshot; accounts: MintAccounts } | null> {
+    const [mint, metadata] = await this.fetchAccounts([mintPubkey, findMetadataAddress(mintPubkey)], 1);
+    const snapshot = decodeMintSnapshot(mintPubkey, mint, metadata);
+    return snapshot && mint ? { snapshot, accounts: { mint, metadata } } : null;
+  }
+
+  /**
+   * Fetch and decode snapshots over RPC, bypassing the cache
+   */
+  private async fetchMintSnapshots(
+    mintPubkeys: PublicKey[]
+  ): Promise<Map<string, MintSnapshot | null>> {
+    const keys: PublicKey[] = [];
+    for (const mintPubkey of mintPubkeys) {
+      keys.push(mintPubkey, findMetadataAddress(mintPubkey));
+    }
+    const accounts = await this.fetchAccounts(keys, mintPubkeys.length);
+
+    const snapshots = new Map<string, MintSnapshot | null>();
+    mintPubkeys.forEach((mintPubkey, i) => {
+      snapshots.set(
+        mintPubkey.toBase58(),
+        decodeMintSnapshot(mintPubkey, accounts[2 * i], accounts[2 * i + 1])
+      );
+    });
+    return snapshots;
+  }
+
+  /**
+   * getMultipleAccounts over any number of keys, in parallel chunks
+   */
+  private async fetchAccounts(keys: PublicKey[], mintCount: number): Promise<Array<AccountInfo<Buffer> | null>> {
+    try {
+      const chunks: PublicKey[][] = [];
+      for (let i = 0; i < keys.length; i += MAX_MULTIPLE_ACCOUNTS) {
+        chunks.push(keys.slice(i, i + MAX_MULTIPLE_ACCOUNTS));
+      }
+
+      const responses = await Promise.all(
+        chunks.map((chunk) =>
+          this.rpc('getMultipleAccounts', (c) => c.getMultipleAccountsInfo(chunk))
+        )
+      );
+      return responses.flat();
+    } catch (error) {
+      throw new TokenDataError(
+        TokenFetchError.NETWORK_ERROR,
+        `Failed to fetch mint accounts for ${mintCount} mints`,
+        error as Error
+      );
+    }
+  }
+
   /**
    * Get account info with retry logic
    */
@@ -183,24 +572,14 @@ export class SolanaClient {
     pubkey: PublicKey,
     maxRetries: number = 3
   ): Promise<AccountInfo<Buffer> | null> {
-    let lastError: Error | undefined;
-    
-    for (let i = 0; i < maxRetries; i++) {
-      try {
-        return await this.connection.getAccountInfo(pubkey);
-      } catch (error) {
-        lastError = error as Error;
-        if (i < maxRetries - 1) {
-          // Exponential backoff
-          await new Promise(resolve => setTimeout(resolve, 1000 * Math.pow(2, i)));
-        }
-      }
+    try {
+      return await this.rpc('getAccountInfo', (c) => c.getAccountInfo(pubkey), maxRetries);
+    } catch (error) {
+      throw new TokenDataError(
+        TokenFetchError.NETWORK_ERROR,
+        `Failed to fetch account info after ${maxRetries} retries`,
+        error as Error
+      );
     }
-
-    throw new TokenDataError(
-      TokenFetchError.NETWORK_ERROR,
-      `Failed to fetch account info after ${maxRetries} retries`,
-      lastError
-    );
   }
 }
@@ -1,4 +1,4 @@
-import { PublicKey } from '@solana/web3.js';
+import { PublicKey, TokenAccountBalancePair } from '@solana/web3.js';
 import { SolanaClient } from './solana-client.js';
 import {
   TokenAnalysis,
@@ -9,8 +9,61 @@ import {
   TokenDataError,
   TokenFetchError,
   SolanaClientConfig,
+  BatchAnalysisOptions,
+  BatchAnalysisResult,
+  MintSnapshot,
+  AnalyzeOptions,
+  AnalysisTimings,
+  TokenFingerprint,
+  HolderSource,
 } from './types.js';
+import { CacheStats } from './cache.js';
+import { RpcEndpointStats } from './rpc-pool.js';
+import { HolderScanResult } from './holder-scanner.js';
 import { TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID } from '@solana/spl-token';
+import { metrics } from './metrics.js';
+import { fingerprintMint } from './fingerprint.js';
+
+const stageDuration = metrics.histogram(
+  'token_analyzer_stage_duration_seconds',
+  'TokenAnalyzer time per stage (mint_accounts, holders, scoring, total)',
+  ['stage']
+);
+
+/**
+ * Mints per batched account fetch (mint + metadata PDA = 2 accounts each,
+ * filling one 100-account getMultipleAccounts request)
+ */
+const SNAPSHOT_GROUP_SIZE = 50;
+
+/**
+ * An RPC request paired with how long it took to settle
+ */
+interface TimedStage<T> {
+  promise: Promise<T>;
+  elapsed: Promise<number>; // Milliseconds until the request settled
+}
+
+function timeStage<T>(promise: Promise<T>): TimedStage<T> {
+  const start = performance.now();
+  const elapsed = promise.then(
+    () => performance.now() - start,
+    () => performance.now() - start
+  );
+  return { promise, elapsed };
+}
+
+/**
+ * Feed per-stage timings into the stage histogram
+ */
+function recordTimings(timings: AnalysisTimings): void {
+  if (timings.mintAccountsMs !== undefined) {
+    stageDuration.observe({ stage: 'mint_accounts' }, timings.mintAccountsMs / 1000);
+  }
+  stageDuration.observe({ stage: 'holders' }, timings.holdersMs / 1000);
+  stageDuration.observe({ stage: 'scoring' }, timings.scoringMs / 1000);
+  stageDuration.observe({ stage: 'total' }, timings.totalMs / 1000);
+}
 
 /**
  * TokenAnalyzer performs comprehensive analysis of Solana tokens
@@ -23,86 +76,217 @@ export class TokenAnalyzer {
   }
 
   /**
-   * Analyze a token and return comprehensive data
+   * Health and latency statistics per RPC endpoint
    */
-  async analyzeToken(mintAddress: string): Promise<TokenAnalysis> {
-    try {
-      console.log(`🔍 Analyzing token: ${mintAddress}`);
+  getRpcStats(): RpcEndpointStats[] {
+    return this.client.getRpcStats();
+  }
 
-      // Step 1: Validate mint address
-      const mintPubkey = await this.client.validateMintAddress(mintAddress);
+  /**
+   * Cache hit/miss counters of the underlying client
+   */
+  getCacheStats(): CacheStats {
+    return this.client.getCacheStats();
+  }
 
-      // Step 2: Get mint info and determine program
-      const { mintInfo, programId } = await this.client.getMintInfo(mintPubkey);
-      console.log(`✓ Mint info retrieved (decimals: ${mintInfo.decimals})`);
+  /**
+   * Analyze a token and return comprehensive data
+   * Uses two RPC calls: one getMultipleAccounts for the mint and its
+   * metadata PDA, and one getTokenLargestAccounts for holders. In pipelined
+   * mode (the default) both are issued at once, since holders only need the
+   * mint pubkey; the mint account fetch doubles as the existence check.
+   * With `fullHolders`, every holder is enumerated instead; that scan needs
+   * the owning program, so it starts once the mint account is known.
+   */
+  async analyzeToken(mintAddress: string, options: AnalyzeOptions = {}): Promise<TokenAnalysis> {
+    const pipelined = (options.pipelined ?? true) && !options.fullHolders;
+    const startTime = performance.now();
 
-      // Step 3: Get metadata
-      const metadata = await this.getMetadata(mintPubkey, mintInfo);
-      console.log(`✓ Metadata retrieved: ${metadata.symbol || 'N/A'}`);
+    try {
+      console.log(`🔍 Analyzing token: ${mintAddress}`);
 
-      // Step 4: Get supply information
-      const supply = await this.getSupply(mintPubkey, mintInfo.decimals);
-      console.log(`✓ Supply: ${supply.total}`);
+      // Step 1: Parse mint address
+      let mintPubkey: PublicKey;
+      try {
+        mintPubkey = new PublicKey(mintAddress);
+      } catch (error) {
+        throw new TokenDataError(
+          TokenFetchError.INVALID_MINT,
+          `Invalid mint address: ${mintAddress}`,
+          error as Error
+        );
+      }
 
-      // Step 5: Get holder distribution
-      const holderDistribution = await this.getHolderDistribution(mintPubkey, supply);
-      console.log(`✓ Holders: ${holderDistribution.totalHolders}`);
+      // Step 2: Fetch mint + metadata accounts (and holders, when pipelined)
+      const mintStage = timeStage(this.client.getMintSnapshots([mintPubkey]));
+      const holderStage: TimedStage<HolderSource> | null = pipelined
+        ? timeStage(this.client.getTokenAccounts(mintPubkey))
+        : null;
+      // Holder errors surface after the existence check below
+      holderStage?.promise.catch(() => undefined);
+
+      const snapshot = (await mintStage.promise).get(mintPubkey.toBase58());
+      if (!snapshot) {
+        throw new TokenDataError(
+          TokenFetchError.INVALID_MINT,
+          `Mint address ${mintAddress} does not exist on-chain or is not a token mint`
+        );
+      }
+      console.log(`✓ Mint info retrieved (decimals: ${snapshot.decimals}, supply: ${snapshot.uiSupply})`);
+
+      // Step 3: Holder distribution and risk assessment
+      return await this.completeAnalysis(snapshot, {
+        startTime,
+        pipelined,
+        mintAccountsMs: await mintStage.elapsed,
+        holderStage,
+        options,
+      });
+    } catch (error) {
+      if (error instanceof TokenDataError) {
+        throw error;
+      }
 
-      // Step 6: Program ownership
-      const programOwnership: ProgramOwnership = {
-        programId: programId.toBase58(),
-        isTokenProgram: programId.equals(TOKEN_PROGRAM_ID),
-        isToken2022: programId.equals(TOKEN_2022_PROGRAM_ID),
-      };
+      throw new TokenDataError(
+        TokenFetchError.UNKNOWN,
+        `Failed to analyze token ${mintAddress}`,
+        error as Error
+      );
+    }
+  }
 
-      // Step 7: Calculate risk score and warnings
-      const warnings: string[] = [];
-      let riskScore = 0;
+  /**
+   * Analyze a token from a prefetched mint snapshot.
+   * Only the holder distribution needs an extra RPC call, unless its largest
+   * accounts were prefetched too (ignored for full holder scans).
+   */
+  async analyzeSnapshot(
+    snapshot: MintSnapshot,
+    options: AnalyzeOptions = {},
+    holders?: HolderSource
+  ): Promise<TokenAnalysis> {
+    // Prefetched holders are only reused if they are the kind the options ask for
+    const reusable = holders && Array.isArray(holders) === !options.fullHolders;
+    return this.completeAnalysis(snapshot, {
+      startTime: performance.now(),
+      pipelined: false,
+      holderStage: reusable ? timeStage(Promise.resolve(holders)) : null,
+      options,
+    });
+  }
 
-      // Check mint authority (centralization risk)
-      if (mintInfo.mintAuthority) {
-        warnings.push('⚠️  Mint authority is active - token supply can be inflated');
-        riskScore += 30;
-      }
+  /**
+   * Fingerprint a mint's audit inputs, so callers can skip a re-analysis
+   * when nothing changed: the raw mint and metadata accounts plus the
+   * holders an analysis with the same options would score (largest
+   * accounts, or the full scan with fullHolders). Everything is read fresh,
+   * bypassing the cache. The fetched data can be passed on to
+   * analyzeSnapshot when something did change.
+   */
+  async fingerprintToken(mintAddress: string, options: AnalyzeOptions = {}): Promise<TokenFingerprint> {
+    let mintPubkey: PublicKey;
+    try {
+      mintPubkey = new PublicKey(mintAddress);
+    } catch (error) {
+      throw new TokenDataError(
+        TokenFetchError.INVALID_MINT,
+        `Invalid mint address: ${mintAddress}`,
+        error as Error
+      );
+    }
 
-      // Check freeze authority (can freeze accounts)
-      if (mintInfo.freezeAuthority) {
-        warnings.push('⚠️  Freeze authority is active - accounts can be frozen');
-        riskScore += 25;
-      }
+    // The largest accounts can be fetched alongside the mint; a full scan
+    // needs the owning program from the mint account first
+    const largestPromise = options.fullHolders
+      ? null
+      : this.client.getTokenAccounts(mintPubkey, { bypassCache: true });
+    largestPromise?.catch(() => undefined);
+    const fetched = await this.client.fetchMintAccounts(mintPubkey);
+    if (!fetched) {
+      throw new TokenDataError(
+        TokenFetchError.INVALID_MINT,
+        `Mint address ${mintAddress} does not exist on-chain or is not a token mint`
+      );
+    }
 
-      // Check holder concentration
-      if (holderDistribution.top10Concentration > 50) {
-        warnings.push(
-          `⚠️  High concentration: Top 10 holders own ${holderDistribution.top10Concentration.toFixed(1)}%`
-        );
-        riskScore += 20;
-      }
+    const { snapshot, accounts } = fetched;
+    const holders = await (largestPromise ?? this.fetchHolders(snapshot, options, { bypassCache: true }));
+    return {
+      mintAddress: snapshot.mintAddress,
+      fingerprint: fingerprintMint(accounts, holders),
+      snapshot,
+      holders,
+    };
+  }
 
-      // Check total holders (low liquidity risk)
-      if (holderDistribution.totalHolders < 100) {
-        warnings.push(`⚠️  Low holder count: ${holderDistribution.totalHolders} holders`);
-        riskScore += 15;
-      }
+  /**
+   * Finish an analysis once the mint snapshot is known, reusing an
+   * in-flight holder fetch if one was started alongside the mint fetch
+   */
+  private async completeAnalysis(
+    snapshot: MintSnapshot,
+    context: {
+      startTime: number;
+      pipelined: boolean;
+      mintAccountsMs?: number;
+      holderStage: TimedStage<HolderSource> | null;
+      options: AnalyzeOptions;
+    }
+  ): Promise<TokenAnalysis> {
+    try {
+      const mintPubkey = new PublicKey(snapshot.mintAddress);
+
+      const metadata: TokenMetadata = {
+        name: snapshot.metadata?.name,
+        symbol: snapshot.metadata?.symbol,
+        decimals: snapshot.decimals,
+        uri: snapshot.metadata?.uri,
+        mintAuthority: snapshot.mintAuthority,
+        freezeAuthority: snapshot.freezeAuthority,
+      };
 
-      // Check if metadata is missing
-      if (!metadata.name && !metadata.symbol) {
-        warnings.push('⚠️  No metadata found - token may not be verified');
-        riskScore += 10;
-      }
+      const supply: TokenSupply = {
+        total: snapshot.uiSupply,
+        circulating: snapshot.uiSupply,
+        decimals: snapshot.decimals,
+      };
 
-      console.log(`✓ Analysis complete - Risk score: ${riskScore}/100`);
+      // The off-chain description is fetched alongside the holders
+      const description =
+        context.options.offChainMetadata !== false && snapshot.metadata?.uri
+          ? this.client.getOffChainDescription(snapshot.metadata.uri)
+          : Promise.resolve(null);
+
+      const holderStage =
+        context.holderStage ?? timeStage(this.fetchHolders(snapshot, context.options));
+      const holders = await holderStage.promise;
+      const holdersMs = await holderStage.elapsed;
+      metadata.description = (await description) ?? undefined;
+
+      const scoringStart = performance.now();
+      const holderDistribution = Array.isArray(holders)
+        ? this.computeHolderDistribution(holders, supply)
+        : this.computeScannedDistribution(holders, snapshot);
+      console.log(`✓ Holders: ${holderDistribution.totalHolders}`);
 
-      return {
-        mintAddress,
+      const analysis = this.buildAnalysis(
+        snapshot.mintAddress,
         metadata,
         supply,
         holderDistribution,
-        programOwnership,
-        timestamp: Date.now(),
-        warnings,
-        riskScore,
+        new PublicKey(snapshot.programId)
+      );
+
+      const now = performance.now();
+      analysis.timings = {
+        pipelined: context.pipelined,
+        mintAccountsMs: context.mintAccountsMs,
+        holdersMs,
+        scoringMs: now - scoringStart,
+        totalMs: now - context.startTime,
       };
+      recordTimings(analysis.timings);
+      return analysis;
     } catch (error) {
       if (error instanceof TokenDataError) {
         throw error;
@@ -110,51 +294,103 @@ export class TokenAnalyzer {
 
       throw new TokenDataError(
         TokenFetchError.UNKNOWN,
-        `Failed to analyze token ${mintAddress}`,
+        `Failed to analyze token ${snapshot.mintAddress}`,
         error as Error
       );
     }
   }
 
   /**
-   * Get token metadata
+   * Start the holder fetch for a known mint
    */
-  private async getMetadata(mintPubkey: PublicKey, mintInfo: any): Promise<TokenMetadata> {
-    // Try to get Metaplex metadata
-    const metaplex = await this.client.getMetaplexMetadata(mintPubkey);
-
-    return {
-      name: metaplex?.name,
-      symbol: metaplex?.symbol,
-      decimals: mintInfo.decimals,
-      uri: metaplex?.uri,
-      mintAuthority: mintInfo.mintAuthority?.toBase58() || null,
-      freezeAuthority: mintInfo.freezeAuthority?.toBase58() || null,
-    };
+  private fetchHolders(
+    snapshot: MintSnapshot,
+    options: AnalyzeOptions,
+    { bypassCache = false }: { bypassCache?: boolean } = {}
+  ): Promise<HolderSource> {
+    const mintPubkey = new PublicKey(snapshot.mintAddress);
+    if (options.fullHolders) {
+      return this.client.scanTokenHolders(mintPubkey, new PublicKey(snapshot.programId), {
+        topN: 10,
+        maxOwners: options.maxOwners,
+        bypassCache,
+      });
+    }
+    return this.client.getTokenAccounts(mintPubkey, { bypassCache });
   }
 
   /**
-   * Get token supply information
+   * Assemble the analysis result, compliance warnings and risk score
    */
-  private async getSupply(mintPubkey: PublicKey, decimals: number): Promise<TokenSupply> {
-    const supplyInfo = await this.client.getTokenSupply(mintPubkey);
+  private buildAnalysis(
+    mintAddress: string,
+    metadata: TokenMetadata,
+    supply: TokenSupply,
+    holderDistribution: HolderDistribution,
+    programId: PublicKey
+  ): TokenAnalysis {
+    const programOwnership: ProgramOwnership = {
+      programId: programId.toBase58(),
+      isTokenProgram: programId.equals(TOKEN_PROGRAM_ID),
+      isToken2022: programId.equals(TOKEN_2022_PROGRAM_ID),
+    };
+
+    const warnings: string[] = [];
+    let riskScore = 0;
+
+    // Check mint authority (centralization risk)
+    if (metadata.mintAuthority) {
+      warnings.push('⚠️  Mint authority is active - token supply can be inflated');
+      riskScore += 30;
+    }
+
+    // Check freeze authority (can freeze accounts)
+    if (metadata.freezeAuthority) {
+      warnings.push('⚠️  Freeze authority is active - accounts can be frozen');
+      riskScore += 25;
+    }
+
+    // Check holder concentration
+    if (holderDistribution.top10Concentration > 50) {
+      warnings.push(
+        `⚠️  High concentration: Top 10 holders own ${holderDistribution.top10Concentration.toFixed(1)}%`
+      );
+      riskScore += 20;
+    }
+
+    // Check total holders (low liquidity risk)
+    if (holderDistribution.totalHolders < 100) {
+      warnings.push(`⚠️  Low holder count: ${holderDistribution.totalHolders} holders`);
+      riskScore += 15;
+    }
+
+    // Check if metadata is missing
+    if (!metadata.name && !metadata.symbol) {
+      warnings.push('⚠️  No metadata found - token may not be verified');
+      riskScore += 10;
+    }
+
+    console.log(`✓ Analysis complete - Risk score: ${riskScore}/100`);
 
     return {
-      total: supplyInfo.uiAmountString || '0',
-      circulating: supplyInfo.uiAmountString || '0', // Same as total for basic tokens
-      decimals,
+      mintAddress,
+      metadata,
+      supply,
+      holderDistribution,
+      programOwnership,
+      timestamp: Date.now(),
+      warnings,
+      riskScore,
     };
   }
 
   /**
    * Get holder distribution analysis
    */
-  private async getHolderDistribution(
-    mintPubkey: PublicKey,
+  private computeHolderDistribution(
+    largestAccounts: TokenAccountBalancePair[],
     supply: TokenSupply
-  ): Promise<HolderDistribution> {
-    const largestAccounts = await this.client.getTokenAccounts(mintPubkey);
-
+  ): HolderDistribution {
     // Calculate total supply in smallest units
     const totalSupply = parseFloat(supply.total);
 
@@ -183,23 +419,219 @@ export class TokenAnalyzer {
     };
   }
 
+  /**
+   * Holder distribution from a full scan; balances are aggregated per owner
+   * and percentages use the raw supply to avoid rounding small holders away
+   */
+  private computeScannedDistribution(
+    scan: HolderScanResult,
+    snapshot: MintSnapshot
+  ): HolderDistribution {
+    const rawSupply = Number(snapshot.supply);
+    const scale = Math.pow(10, snapshot.decimals);
+
+    const largestHolders = scan.largestHolders.slice(0, 10).map((holder) => ({
+      address: holder.owner,
+      balance: (holder.amount / scale).toString(),
+      percentage: rawSupply > 0 ? (holder.amount / rawSupply) * 100 : 0,
+    }));
+
+    const top10Concentration = largestHolders.reduce(
+      (sum, holder) => sum + holder.percentage,
+      0
+    );
+
+    return {
+      totalHolders: scan.totalHolders,
+      totalAccounts: scan.totalAccounts,
+      approximate: scan.approximate,
+      top10Concentration,
+      largestHolders,
+    };
+  }
+
   /**
    * Batch analyze multiple tokens
+   * Results are returned in input order; failed mints are skipped.
    */
-  async analyzeTokens(mintAddresses: string[]): Promise<TokenAnalysis[]> {
-    const results: TokenAnalysis[] = [];
+  async analyzeTokens(
+    mintAddresses: string[],
+    options: BatchAnalysisOptions = {}
+  ): Promise<TokenAnalysis[]> {
+    const results: Array<TokenAnalysis | undefined> = new Array(mintAddresses.length);
+
+    for await (const result of this.analyzeTokensStream(mintAddresses, options)) {
+      if (result.analysis) {
+        results[result.index] = result.analysis;
+      } else {
+        console.error(`Failed to analyze ${result.mintAddress}:`, result.error);
+      }
+    }
 
-    for (const address of mintAddresses) {
-      try {
-        const analysis = await this.analyzeToken(address);
-        results.push(analysis);
-      } catch (error) {
-        console.error(`Failed to analyze ${address}:`, error);
-        // Continue with other tokens
+    return results.filter((r): r is TokenAnalysis => r !== undefined);
+  }
+
+  /**
+   * Analyze many tokens with bounded concurrency, yielding each result as
+   * soon as its mint finishes (completion order, not input order).
+   * Mint and metadata accounts are prefetched in groups with getMultipleAccounts,
+   * so each mint only needs one further RPC call for its holders.
+   * RPC throughput is bounded separately by `requestsPerSecond` in the client config.
+   */
+  async *analyzeTokensStream(
+    mintAddresses: Iterable<string>,
+    options: BatchAnalysisOptions = {}
+  ): AsyncGenerator<BatchAnalysisResult> {
+    const concurrency = Math.max(1, options.concurrency ?? 8);
+    const timeoutMs = options.timeoutMs ?? this.client.getTimeout();
+    const analyzeOptions: AnalyzeOptions = {
+      fullHolders: options.fullHolders,
+      maxOwners: options.maxOwners,
+      offChainMetadata: options.offChainMetadata,
+    };
+
+    const pending = this.prefetchSnapshots(mintAddresses);
+    const completed: BatchAnalysisResult[] = [];
+    let notify: (() => void) | null = null;
+    let inFlight = 0;
+    let index = 0;
+
+    const launch = (): boolean => {
+      const next = pending.next();
+      if (next.done) return false;
+
+      const { mintAddress, snapshot } = next.value;
+      const position = index++;
+      inFlight++;
+
+      this.analyzeWithTimeout(mintAddress, snapshot, timeoutMs, position, analyzeOptions).then((result) => {
+        inFlight--;
+        completed.push(result);
+        notify?.();
+      });
+      return true;
+    };
+
+    while (inFlight < concurrency && launch());
+
+    while (inFlight > 0 || completed.length > 0) {
+      if (completed.length === 0) {
+        await new Promise<void>((resolve) => (notify = resolve));
+        notify = null;
+      }
+
+      while (completed.length > 0) {
+        const result = completed.shift()!;
+        launch();
+        yield result;
       }
     }
+  }
 
-    return results;
+  /**
+   * Walk the input lazily in groups, starting one batched account fetch per
+   * group when its first mint is reached. Each mint is paired with a promise
+   * of its snapshot (undefined if the batched fetch failed).
+   */
+  private *prefetchSnapshots(
+    mintAddresses: Iterable<string>
+  ): Generator<{ mintAddress: string; snapshot: Promise<MintSnapshot | null | undefined> }> {
+    let group: string[] = [];
+
+    for (const mintAddress of mintAddresses) {
+      group.push(mintAddress);
+      if (group.length === SNAPSHOT_GROUP_SIZE) {
+        yield* this.prefetchGroup(group);
+        group = [];
+      }
+    }
+    if (group.length > 0) {
+      yield* this.prefetchGroup(group);
+    }
+  }
+
+  private *prefetchGroup(
+    group: string[]
+  ): Generator<{ mintAddress: string; snapshot: Promise<MintSnapshot | null | undefined> }> {
+    const valid = group.filter((address) => this.isValidAddress(address));
+    const snapshots = this.client
+      .getMintSnapshots(valid.map((address) => new PublicKey(address)))
+      .catch(() => null);
+
+    for (const mintAddress of group) {
+      yield {
+        mintAddress,
+        snapshot: snapshots.then((map) => (map ? map.get(mintAddress) : undefined)),
+      };
+    }
+  }
+
+  private isValidAddress(address: string): boolean {
+    try {
+      new PublicKey(address);
+      return true;
+    } catch {
+      return false;
+    }
+  }
+
+  /**
+   * Analyze one mint for a batch, converting failures and timeouts into a result
+   */
+  private async analyzeWithTimeout(
+    mintAddress: string,
+    snapshot: Promise<MintSnapshot | null | undefined>,
+    timeoutMs: number,
+    index: number,
+    options: AnalyzeOptions
+  ): Promise<BatchAnalysisResult> {
+    const startTime = Date.now();
+    let timer: ReturnType<typeof setTimeout> | undefined;
+
+    const timeout = new Promise<never>((_, reject) => {
+      timer = setTimeout(
+        () =>
+          reject(
+            new TokenDataError(
+              TokenFetchError.TIMEOUT,
+              `Analysis of ${mintAddress} timed out after ${timeoutMs}ms`
+            )
+          ),
+        timeoutMs
+      );
+    });
+
+    const analyze = async (): Promise<TokenAnalysis> => {
+      const prefetched = await snapshot;
+      if (prefetched === undefined) {
+        // Batched fetch failed or address is malformed - use the per-call path
+        return this.analyzeToken(mintAddress, options);
+      }
+      if (prefetched === null) {
+        throw new TokenDataError(
+          TokenFetchError.INVALID_MINT,
+          `Mint address ${mintAddress} does not exist on-chain or is not a token mint`
+        );
+      }
+      return this.analyzeSnapshot(prefetched, options);
+    };
+
+    try {
+      const analysis = await Promise.race([analyze(), timeout]);
+      return { mintAddress, index, analysis, durationMs: Date.now() - startTime };
+    } catch (error) {
+      const tokenError =
+        error instanceof TokenDataError
+          ? error
+          : new TokenDataError(
+              TokenFetchError.UNKNOWN,
+              `Failed to analyze token ${mintAddress}`,
+              error as Error
+            );
+      return { mintAddress, index, error: tokenError, durationMs: Date.now() - startTime };
+    } finally {
+      clearTimeout(timer);
+    }
   }
 
   /**
@@ -1,4 +1,7 @@
-import { PublicKey } from '@solana/web3.js';
+import { AccountInfo, PublicKey, TokenAccountBalancePair } from '@solana/web3.js';
+import type { CacheStore, CacheTtlConfig } from './cache.js';
+import type { RpcEndpointConfig } from './rpc-pool.js';
+import type { HolderScanResult } from './holder-scanner.js';
 
 /**
  * Token metadata information
@@ -8,6 +11,7 @@ export interface TokenMetadata {
   symbol?: string;
   decimals: number;
   uri?: string;
+  description?: string; // From the off-chain metadata JSON at `uri`, when fetched
   mintAuthority: string | null;
   freezeAuthority: string | null;
 }
@@ -25,7 +29,9 @@ export interface TokenSupply {
  * Holder distribution data
  */
 export interface HolderDistribution {
-  totalHolders: number;
+  totalHolders: number; // Distinct owners (full scan) or largest accounts returned
+  totalAccounts?: number; // Token accounts seen by a full scan
+  approximate?: boolean; // Full scan exceeded its owner budget
   top10Concentration: number; // Percentage held by top 10
   largestHolders: Array<{
     address: string;
@@ -57,6 +63,74 @@ export interface TokenAnalysis {
   // Compliance flags
   warnings: string[];
   riskScore: number; // 0-100, higher = riskier
+
+  timings?: AnalysisTimings;
+}
+
+/**
+ * Per-stage timings for a single analysis (milliseconds)
+ */
+export interface AnalysisTimings {
+  pipelined: boolean; // Mint and holder fetches overlapped
+  mintAccountsMs?: number; // Mint + metadata account fetch (absent when prefetched)
+  holdersMs: number; // Largest token accounts fetch (or full holder scan)
+  scoringMs: number; // Distribution, warnings and risk score
+  totalMs: number;
+}
+
+/**
+ * Options for a single token analysis
+ */
+export interface AnalyzeOptions {
+  pipelined?: boolean; // Fetch mint and holders concurrently (default: true)
+  fullHolders?: boolean; // Enumerate every holder via getProgramAccounts (default: false)
+  maxOwners?: number; // Owner budget for full scans (default: 1,000,000)
+  offChainMetadata?: boolean; // Fetch the JSON at the metadata uri for its description (default: true)
+}
+
+/**
+ * Mint account state decoded locally from raw account data
+ * (one entry per mint from a batched getMultipleAccounts call)
+ */
+export interface MintSnapshot {
+  mintAddress: string;
+  programId: string;
+  decimals: number;
+  supply: string; // Raw base units
+  uiSupply: string; // Supply adjusted for decimals
+  mintAuthority: string | null;
+  freezeAuthority: string | null;
+  isInitialized: boolean;
+  lamports: number;
+  metadata: {
+    name?: string;
+    symbol?: string;
+    uri?: string;
+  } | null;
+}
+
+/**
+ * Holder data from either getTokenLargestAccounts (top 20 token accounts)
+ * or a full getProgramAccounts scan aggregated by owner
+ */
+export type HolderSource = TokenAccountBalancePair[] | HolderScanResult;
+
+/**
+ * Raw mint account and Metaplex metadata account of a mint
+ */
+export interface MintAccounts {
+  mint: AccountInfo<Buffer>;
+  metadata: AccountInfo<Buffer> | null;
+}
+
+/**
+ * Cheap change-detection result for a mint (see TokenAnalyzer.fingerprintToken)
+ */
+export interface TokenFingerprint {
+  mintAddress: string;
+  fingerprint: string; // sha256 hex of the raw mint accounts and the holders
+  snapshot: MintSnapshot;
+  holders: HolderSource; // What analyzeSnapshot scores with the same fullHolders option
 }
 
 /**
@@ -89,6 +163,36 @@ export class TokenDataError extends Error {
  */
 export interface SolanaClientConfig {
   rpcUrl?: string;
+  rpcEndpoints?: Array<string | RpcEndpointConfig>; // Pool of providers (overrides rpcUrl)
   commitment?: 'processed' | 'confirmed' | 'finalized';
   timeout?: number;
+  maxRetries?: number; // Attempts per RPC call across endpoints (default: 3)
+  retryDelayMs?: number; // Base exponential backoff between attempts (default: 250)
+  maxSockets?: number; // Keep-alive sockets per endpoint (default: 64)
+  requestsPerSecond?: number; // RPC rate limit, match your provider tier (default: unlimited)
+  burst?: number; // Max requests issued back-to-back (default: requestsPerSecond)
+  cache?: CacheStore; // Mint/metadata/holder snapshot cache (default: none)
+  cacheTtl?: Partial<CacheTtlConfig>; // Per data class TTLs (default: DEFAULT_CACHE_TTL)
+}
+
+/**
+ * Options for batch token analysis
+ */
+export interface BatchAnalysisOptions {
+  concurrency?: number; // Mints analyzed in parallel (default: 8)
+  timeoutMs?: number; // Per-mint timeout (default: client timeout)
+  fullHolders?: boolean; // Enumerate every holder per mint (see AnalyzeOptions)
+  maxOwners?: number; // Owner budget for full scans
+  offChainMetadata?: boolean; // Fetch each mint's off-chain metadata description (see AnalyzeOptions)
+}
+
+/**
+ * Result for a single mint in a batch, emitted as soon as it finishes
+ */
+export interface BatchAnalysisResult {
+  mintAddress: string;
+  index: number; // Position in the input list
+  analysis?: TokenAnalysis;
+  error?: TokenDataError;
+  durationMs: number;
 }
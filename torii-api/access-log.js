@@ -0,0 +1,104 @@
+/**
+ * Buffered Access Log
+ * Collects one line per request and writes them in batches, off the request path
+ */
+
+import { createWriteStream } from 'node:fs';
+
+export class AccessLog {
+  /**
+   * @param {object} options
+   * @param {string} [options.path] - Append to this file instead of stdout
+   * @param {number} [options.flushIntervalMs] - Maximum time a line stays buffered
+   * @param {number} [options.maxBufferBytes] - Flush early once this much is buffered
+   * @param {string} [options.tag] - Prefix for every line (e.g. worker id)
+   */
+  constructor(options = {}) {
+    this.stream = options.path
+      ? createWriteStream(options.path, { flags: 'a' })
+      : process.stdout;
+    this.flushIntervalMs = options.flushIntervalMs ?? 100;
+    this.maxBufferBytes = options.maxBufferBytes ?? 64 * 1024;
+    this.tag = options.tag ? `[${options.tag}] ` : '';
+    this.lines = [];
+    this.bufferedBytes = 0;
+    this.dropped = 0;
+    this.writable = true;
+    this.timer = null;
+
+    this.stream.on('drain', () => {
+      this.writable = true;
+    });
+
+    // Last lines go out when the event loop would otherwise go idle
+    process.on('beforeExit', () => this.flush());
+  }
+
+  /**
+   * Queue one line
+   * @param {string} line - Log line (without newline)
+   */
+  write(line) {
+    // A stalled destination must not grow the buffer without bound
+    if (!this.writable && this.bufferedBytes >= this.maxBufferBytes * 16) {
+      this.dropped++;
+      return;
+    }
+
+    this.lines.push(this.tag + line);
+    this.bufferedBytes += line.length + 1;
+
+    if (this.bufferedBytes >= this.maxBufferBytes) {
+      this.flush();
+    } else if (this.timer === null) {
+      this.timer = setTimeout(() => this.flush(), this.flushIntervalMs);
+      this.timer.unref();
+    }
+  }
+
+  /**
+   * Write out everything buffered as a single chunk
+   */
+  flush() {
+    if (this.timer !== null) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.lines.length === 0) return;
+
+    if (this.dropped > 0) {
+      this.lines.push(`${this.tag}[access-log] dropped ${this.dropped} lines while output was blocked`);
+      this.dropped = 0;
+    }
+
+    this.writable = this.stream.write(this.lines.join('\n') + '\n');
+    this.lines = [];
+    this.bufferedBytes = 0;
+  }
+
+  /**
+   * Express middleware: one line per completed request with status and duration
+   */
+  middleware() {
+    return (req, res, next) => {
+      const start = process.hrtime.bigint();
+      res.on('finish', () => {
+        const durationMs = Number(process.hrtime.bigint() - start) / 1e6;
+        this.write(
+          `[${new Date().toISOString()}] ${req.method} ${req.path} ${res.statusCode} ${durationMs.toFixed(2)}ms`
+        );
+      });
+      next();
+    };
+  }
+
+  /**
+   * Flush and, for file logs, close the file
+   */
+  async close() {
+    this.flush();
+    if (this.stream !== process.stdout) {
+      await new Promise(resolve => this.stream.end(resolve));
+    }
+  }
+}
@@ -0,0 +1,147 @@
+/**
+ * Torii Engine Micro-Benchmark
+ * Compares the original per-pattern regex scans with the compiled single-pass
+ * matcher on descriptions up to the 2000-char API limit.
+ *
+ * Usage: node bench.js [durationMsPerRound]
+ */
+
+import assert from 'node:assert/strict';
+import { ToriiEngine } from './torii-engine.js';
+
+const DURATION_MS = parseInt(process.argv[2], 10) || 200; // Per round
+const ROUNDS = 5;
+const engine = new ToriiEngine();
+
+/**
+ * Original implementation: one regex scan per risk pattern, then up to
+ * three more for the token type
+ */
+function classifyBaseline(description) {
+  let score = 0;
+  const risks = [];
+  for (const { pattern, score: points, flag } of engine.riskPatterns) {
+    if (pattern.test(description)) {
+      score += points;
+      risks.push(flag);
+    }
+  }
+
+  let classification;
+  if (score >= 50) classification = 'SECURITY TOKEN';
+  else if (score >= 25) classification = 'HIGH RISK - Possible Security';
+  else if (engine.typePatterns.nft.test(description)) classification = 'NFT';
+  else if (engine.typePatterns.payment.test(description)) classification = 'CRYPTO ASSET';
+  else if (engine.typePatterns.prepaid.test(description)) classification = 'PREPAID PAYMENT';
+  else classification = 'UTILITY TOKEN';
+
+  return { score, risks, classification };
+}
+
+/**
+ * Same decision logic on top of the single-pass matcher
+ */
+function classifyCompiled(description) {
+  const found = engine.matcher.matchMask(description, engine.matcher.allRules, engine.settle);
+  const { score, risks } = engine.scoreRisks(found);
+
+  let classification;
+  if (score >= 50) classification = 'SECURITY TOKEN';
+  else if (score >= 25) classification = 'HIGH RISK - Possible Security';
+  else if (found & engine.nftRule) classification = 'NFT';
+  else if (found & engine.paymentRule) classification = 'CRYPTO ASSET';
+  else if (found & engine.prepaidRule) classification = 'PREPAID PAYMENT';
+  else classification = 'UTILITY TOKEN';
+
+  return { score, risks, classification };
+}
+
+/**
+ * What ToriiEngine.classify returns, reduced to the compared fields
+ */
+function classifyEngine(description) {
+  const { riskScore, risks, classification } = engine.classify(description);
+  return { score: riskScore, risks, classification };
+}
+
+const FILLER = 'A community token for the decentralized ecosystem built on Solana with low fees and fast finality. ';
+const KEYWORDS = [
+  'profit', 'Dividend', 'revenue-share', 'fee distribution', 'YIELD', 'staking', 'reward',
+  'governance', 'vote', 'buyback', 'burn', 'invest', 'return', 'growth', 'NFT', 'collectible',
+  'pfp', 'payment', 'currency', 'remit', 'gift card', 'voucher', 'point', 'prepaid'
+];
+
+/**
+ * Build a description of roughly `length` chars with the given keywords
+ */
+function makeDescription(length, keywords) {
+  let text = '';
+  let k = 0;
+  while (text.length < length) {
+    text += FILLER;
+    if (k < keywords.length) text += `${keywords[k++]} `;
+  }
+  // Flat like the JSON-parsed request bodies the server sees (a sliced string slows charCodeAt)
+  return JSON.parse(JSON.stringify(text.slice(0, length)));
+}
+
+const cases = [
+  { name: 'typical, governance', text: 'Governance token allowing holders to vote on protocol parameters and treasury allocations' },
+  { name: 'typical, security', text: 'ERC-20 governance token with fee distribution to stakers, buyback program, and revenue sharing from protocol profits' },
+  { name: 'short, no keywords', text: makeDescription(80, []) },
+  { name: '500 chars, no keywords', text: makeDescription(500, []) },
+  { name: '2000 chars, no keywords', text: makeDescription(2000, []) },
+  { name: '2000 chars, late NFT', text: makeDescription(1990, []) + ' nft' },
+  { name: '2000 chars, 3 risk keywords', text: makeDescription(2000, ['governance', 'staking', 'burn']) },
+  { name: '2000 chars, all keywords', text: makeDescription(2000, KEYWORDS) }
+];
+
+/**
+ * Randomized equivalence check against the original implementation
+ */
+function verify() {
+  const words = [...KEYWORDS, 'stakeholder', 'artwork', 'appointment', 'reinvest', 'art', 'x', 'the'];
+  for (let i = 0; i < 20000; i++) {
+    const count = Math.floor(Math.random() * 12);
+    const text = Array.from({ length: count }, () => words[Math.floor(Math.random() * words.length)])
+      .join(Math.random() < 0.5 ? ' ' : '');
+    assert.deepEqual(classifyEngine(text), classifyBaseline(text), `Mismatch for "${text}"`);
+    const { score, risks } = classifyBaseline(text);
+    assert.deepEqual(engine.checkSecurityRisk(text), { score, risks });
+  }
+  for (const { text } of cases) {
+    assert.deepEqual(classifyEngine(text), classifyBaseline(text));
+  }
+}
+
+function measure(fn, text) {
+  let iterations = 0;
+  const start = performance.now();
+  let elapsed = 0;
+  while (elapsed < DURATION_MS) {
+    for (let i = 0; i < 1000; i++) fn(text);
+    iterations += 1000;
+    elapsed = performance.now() - start;
+  }
+  return (iterations / elapsed) * 1000;
+}
+
+verify();
+console.log('✅ Compiled matcher matches baseline on 20,000 random descriptions\n');
+
+console.log('case'.padEnd(30), 'baseline ops/s'.padStart(16), 'compiled ops/s'.padStart(16), 'speedup'.padStart(9));
+for (const { name, text } of cases) {
+  // Alternate the two and keep each one's best round, so drift in CPU speed hits both alike
+  let baseline = 0;
+  let compiled = 0;
+  for (let round = 0; round < ROUNDS; round++) {
+    baseline = Math.max(baseline, measure(classifyBaseline, text));
+    compiled = Math.max(compiled, measure(classifyCompiled, text));
+  }
+  console.log(
+    name.padEnd(30),
+    Math.round(baseline).toLocaleString().padStart(16),
+    Math.round(compiled).toLocaleString().padStart(16),
+    `${(compiled / baseline).toFixed(2)}x`.padStart(9)
+  );
+}
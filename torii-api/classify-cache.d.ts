@@ -0,0 +1,22 @@
+/**
+ * Type declarations for classify-cache.js
+ */
+
+import { ToriiEngine, ClassificationResult } from './torii-engine.js';
+
+export function normalizeDescription(description: string): string;
+export function matchesETag(header: string | undefined, etag: string): boolean;
+
+export class ClassifyCache {
+  constructor(engine: ToriiEngine, maxEntries?: number);
+  keyOf(description: string): string;
+  classify(description: string): { result: ClassificationResult; etag: string; hit: boolean };
+  getStats(): {
+    size: number;
+    maxEntries: number;
+    hits: number;
+    misses: number;
+    evictions: number;
+    hitRate: number;
+  };
+}
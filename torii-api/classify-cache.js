@@ -0,0 +1,116 @@
+/**
+ * Classification Result Cache
+ * Content-addressed LRU cache for ToriiEngine.classify results
+ */
+
+import { createHash } from 'node:crypto';
+
+/**
+ * Normalize a description without changing its classification: surrounding
+ * whitespace never takes part in a keyword, and the keyword patterns are
+ * case-insensitive for ASCII only, so only A-Z are lowercased
+ * @param {string} description - Token description
+ * @returns {string} - Normalized description
+ */
+export function normalizeDescription(description) {
+  return description.trim().replace(/[A-Z]+/g, letters => letters.toLowerCase());
+}
+
+/**
+ * Whether an If-None-Match header matches an ETag (weak comparison)
+ * @param {string|undefined} header - If-None-Match request header
+ * @param {string} etag - Current ETag
+ * @returns {boolean}
+ */
+export function matchesETag(header, etag) {
+  if (!header) return false;
+  const opaque = etag.replace(/^W\//, '');
+  return header.split(',').some(tag => {
+    const candidate = tag.trim();
+    return candidate === '*' || candidate.replace(/^W\//, '') === opaque;
+  });
+}
+
+export class ClassifyCache {
+  /**
+   * @param {ToriiEngine} engine - Engine whose results are cached
+   * @param {number} maxEntries - LRU capacity
+   */
+  constructor(engine, maxEntries = 10000) {
+    this.engine = engine;
+    this.maxEntries = maxEntries;
+    this.entries = new Map(); // Insertion order doubles as recency order
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+
+    // Rule fingerprint: keys (and ETags held by clients) change when the rules do
+    this.salt = createHash('sha256')
+      .update(JSON.stringify({
+        risks: engine.riskPatterns.map(({ pattern, score, flag }) => [pattern.source, score, flag]),
+        types: Object.entries(engine.typePatterns).map(([name, pattern]) => [name, pattern.source])
+      }))
+      .digest('hex');
+  }
+
+  /**
+   * Content address of a description
+   * @param {string} description - Token description
+   * @returns {string} - Hex digest
+   */
+  keyOf(description) {
+    return createHash('sha256')
+      .update(this.salt)
+      .update(normalizeDescription(description))
+      .digest('hex');
+  }
+
+  /**
+   * Classify through the cache
+   * @param {string} description - Token description
+   * @returns {object} - { result, etag, hit }
+   */
+  classify(description) {
+    const key = this.keyOf(description);
+    const etag = `W/"${key.slice(0, 32)}"`;
+    let cached = this.entries.get(key);
+    const hit = cached !== undefined;
+
+    if (hit) {
+      this.hits++;
+      // Move to most-recently-used position
+      this.entries.delete(key);
+      this.entries.set(key, cached);
+    } else {
+      this.misses++;
+      cached = Object.freeze(this.engine.classify(description));
+      this.entries.set(key, cached);
+      if (this.entries.size > this.maxEntries) {
+        this.entries.delete(this.entries.keys().next().value);
+        this.evictions++;
+      }
+    }
+
+    // Cached results are shared; each response gets its own fresh timestamp
+    return {
+      result: { ...cached, timestamp: new Date().toISOString() },
+      etag,
+      hit
+    };
+  }
+
+  /**
+   * Hit/miss counters for /health
+   */
+  getStats() {
+    const lookups = this.hits + this.misses;
+    return {
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hitRate: lookups > 0 ? this.hits / lookups : 0
+    };
+  }
+}
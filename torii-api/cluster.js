@@ -0,0 +1,150 @@
+/**
+ * Torii API Cluster
+ * Runs server.js in N worker processes sharing one port
+ *
+ * Usage: node cluster.js
+ *   WEB_CONCURRENCY   - Worker count (default: available CPU cores)
+ *   SIGHUP            - Rolling restart, one worker at a time
+ *   SIGTERM / SIGINT  - Graceful shutdown
+ */
+
+import cluster from 'node:cluster';
+import { availableParallelism } from 'node:os';
+import { fileURLToPath } from 'node:url';
+import { mergeMetrics } from './metrics.js';
+
+const PORT = process.env.PORT || 3000;
+const WORKERS = parseInt(process.env.WEB_CONCURRENCY, 10) || availableParallelism();
+const STATS_INTERVAL_MS = parseInt(process.env.STATS_INTERVAL_MS, 10) || 1000;
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS, 10) || 10000;
+const CRASH_BACKOFF_MS = 1000;
+
+cluster.setupPrimary({ exec: fileURLToPath(new URL('./server.js', import.meta.url)) });
+
+const workerStats = new Map(); // worker id -> last reported stats
+let shuttingDown = false;
+let restarting = false;
+
+/**
+ * Fork a worker and resolve once it accepts connections
+ */
+function fork() {
+  const worker = cluster.fork();
+  const startedAt = Date.now();
+
+  worker.on('message', message => {
+    if (message?.type === 'torii:stats') {
+      workerStats.set(worker.id, message);
+    }
+  });
+
+  worker.on('exit', (code, signal) => {
+    workerStats.delete(worker.id);
+    if (shuttingDown || worker.exitedAfterDisconnect) return;
+
+    // Unexpected exit: replace it, backing off if it died right after starting
+    console.error(`⚠️  Worker ${worker.id} (pid ${worker.process.pid}) exited (${signal || code}), restarting`);
+    const delay = Date.now() - startedAt < CRASH_BACKOFF_MS ? CRASH_BACKOFF_MS : 0;
+    setTimeout(() => {
+      // A replacement that dies early is handled by its own exit listener
+      if (!shuttingDown) fork().catch(() => {});
+    }, delay);
+  });
+
+  return new Promise((resolve, reject) => {
+    worker.once('listening', () => resolve(worker));
+    worker.once('exit', () => reject(new Error(`Worker ${worker.id} exited before listening`)));
+  });
+}
+
+/**
+ * Disconnect a worker (it stops accepting, finishes in-flight requests and
+ * exits), killing it if that takes too long
+ */
+function retire(worker) {
+  return new Promise(resolve => {
+    if (worker.isDead()) return resolve();
+    const timer = setTimeout(() => worker.process.kill('SIGKILL'), SHUTDOWN_TIMEOUT_MS);
+    worker.once('exit', () => {
+      clearTimeout(timer);
+      resolve();
+    });
+    // Already disconnecting (or crashing): just wait for the exit
+    if (worker.isConnected()) worker.disconnect();
+  });
+}
+
+/**
+ * Replace workers one at a time; each replacement is listening before the
+ * old worker is retired, so capacity never drops by more than one worker
+ */
+async function rollingRestart() {
+  if (restarting || shuttingDown) return;
+  restarting = true;
+  console.log(`🔄 Rolling restart of ${Object.keys(cluster.workers).length} workers`);
+
+  try {
+    for (const worker of Object.values(cluster.workers)) {
+      await fork();
+      await retire(worker);
+    }
+    console.log('✅ Rolling restart complete');
+  } catch (error) {
+    console.error('❌ Rolling restart failed:', error.message);
+  } finally {
+    restarting = false;
+  }
+}
+
+async function shutdown(signal, exitCode = 0) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`🛑 ${signal} received, stopping ${Object.keys(cluster.workers).length} workers`);
+  await Promise.all(Object.values(cluster.workers).map(retire));
+  process.exit(exitCode);
+}
+
+/**
+ * Sum per-worker counters and send the cluster-wide view back to every worker
+ */
+function broadcastStats() {
+  const reports = [...workerStats.values()];
+  const cache = { size: 0, maxEntries: 0, hits: 0, misses: 0, evictions: 0 };
+  let requests = 0;
+
+  for (const report of reports) {
+    for (const key of Object.keys(cache)) {
+      cache[key] += report.cache[key];
+    }
+    requests += report.requests;
+  }
+  const lookups = cache.hits + cache.misses;
+  cache.hitRate = lookups > 0 ? cache.hits / lookups : 0;
+
+  const stats = {
+    workers: reports.length,
+    requests,
+    cache,
+    metrics: mergeMetrics(reports.map(report => report.metrics || [])),
+    updatedAt: new Date().toISOString()
+  };
+  for (const worker of Object.values(cluster.workers)) {
+    if (worker.isConnected()) {
+      worker.send({ type: 'torii:cluster-stats', stats });
+    }
+  }
+}
+
+process.on('SIGHUP', rollingRestart);
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+setInterval(broadcastStats, STATS_INTERVAL_MS).unref();
+
+try {
+  await Promise.all(Array.from({ length: WORKERS }, fork));
+} catch (error) {
+  console.error('❌ Failed to start workers:', error.message);
+  await shutdown('Startup failure', 1);
+}
+console.log(`⛩️  Torii API cluster running on http://localhost:${PORT} (${WORKERS} workers, primary pid ${process.pid})`);
+console.log(`🔄 Rolling restart: kill -HUP ${process.pid}`);
@@ -0,0 +1,162 @@
+/**
+ * Torii API Cluster Load Test
+ * Starts cluster.js with increasing worker counts and measures POST /api/check
+ * throughput and latency at each, to show how the server scales across cores.
+ *
+ * Usage: node loadtest.js [--workers 1,2,4,8] [--duration 10] [--connections 128]
+ *                         [--threads 4] [--port 3100] [--cached]
+ *
+ * Load is generated from worker threads so the client is not the bottleneck;
+ * on a many-core box keep threads + server workers <= cores. Descriptions are
+ * unique per request unless --cached is given, so every request is classified.
+ */
+
+import { spawn } from 'node:child_process';
+import { availableParallelism } from 'node:os';
+import { fileURLToPath } from 'node:url';
+import { Worker, isMainThread, parentPort, workerData } from 'node:worker_threads';
+import { runLoad, createHttpClient, percentile } from '../perf/load.mjs';
+
+const DESCRIPTIONS = [
+  'ERC-20 governance token with fee distribution to stakers, buyback program, and revenue sharing from protocol profits',
+  'Governance token allowing holders to vote on protocol parameters and treasury allocations',
+  'ERC-721 NFT collectible with unique artwork and metadata',
+  'Digital currency for peer-to-peer payments and remittance transfers',
+  'Community token for the decentralized ecosystem built on Solana with low fees and fast finality'
+];
+
+/**
+ * Load generator thread: closed loop, one request in flight per connection.
+ * Returns its sorted latencies so the main thread can merge percentiles.
+ */
+async function generateLoad({ port, connections, durationMs, cached, threadIndex }) {
+  const client = createHttpClient(`http://localhost:${port}`, { maxSockets: connections });
+  try {
+    const { samples, errors } = await runLoad({
+      concurrency: connections,
+      durationMs,
+      keepSamples: true,
+      request: n => client.post('/api/check', {
+        description: DESCRIPTIONS[n % DESCRIPTIONS.length] + (cached ? '' : ` #${threadIndex}-${n}`),
+        demoMode: true
+      })
+    });
+    return { latencies: samples, errors };
+  } finally {
+    client.close();
+  }
+}
+
+if (!isMainThread) {
+  parentPort.postMessage(await generateLoad(workerData));
+  process.exit(0);
+}
+
+function parseArgs(argv) {
+  const cores = availableParallelism();
+  const options = {
+    workers: [1, 2, 4, 8, 16, 32].filter(n => n <= cores),
+    duration: 10,
+    connections: 128,
+    threads: Math.max(1, Math.min(4, Math.floor(cores / 4))),
+    port: 3100,
+    cached: false
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--cached') options.cached = true;
+    else if (arg === '--workers') options.workers = argv[++i].split(',').map(Number);
+    else if (arg === '--duration') options.duration = Number(argv[++i]);
+    else if (arg === '--connections') options.connections = Number(argv[++i]);
+    else if (arg === '--threads') options.threads = Number(argv[++i]);
+    else if (arg === '--port') options.port = Number(argv[++i]);
+    else throw new Error(`Unknown argument: ${arg}`);
+  }
+  return options;
+}
+
+/**
+ * Start the cluster and wait until /health answers with every worker listening
+ */
+async function startCluster(workers, port) {
+  const child = spawn(process.execPath, [fileURLToPath(new URL('./cluster.js', import.meta.url))], {
+    env: { ...process.env, PORT: String(port), WEB_CONCURRENCY: String(workers), ACCESS_LOG_PATH: '/dev/null' },
+    stdio: ['ignore', 'pipe', 'inherit']
+  });
+
+  await new Promise((resolve, reject) => {
+    child.stdout.on('data', chunk => {
+      if (chunk.toString().includes('cluster running')) resolve();
+    });
+    child.once('exit', code => reject(new Error(`cluster.js exited with code ${code}`)));
+  });
+  child.stdout.resume();
+  return child;
+}
+
+async function stopCluster(child) {
+  const exited = new Promise(resolve => child.once('exit', resolve));
+  child.kill('SIGTERM');
+  await exited;
+}
+
+async function run(options, workers) {
+  const cluster = await startCluster(workers, options.port);
+  try {
+    const perThread = Math.ceil(options.connections / options.threads);
+    const results = await Promise.all(Array.from({ length: options.threads }, (_, threadIndex) =>
+      new Promise((resolve, reject) => {
+        const thread = new Worker(fileURLToPath(import.meta.url), {
+          workerData: {
+            port: options.port,
+            connections: perThread,
+            durationMs: options.duration * 1000,
+            cached: options.cached,
+            threadIndex
+          }
+        });
+        thread.once('message', resolve);
+        thread.once('error', reject);
+      })
+    ));
+
+    const latencies = new Float64Array(results.reduce((n, r) => n + r.latencies.length, 0));
+    let offset = 0;
+    for (const { latencies: chunk } of results) {
+      latencies.set(chunk, offset);
+      offset += chunk.length;
+    }
+    latencies.sort();
+
+    return {
+      workers,
+      requests: latencies.length,
+      errors: results.reduce((n, r) => n + r.errors, 0),
+      rps: latencies.length / options.duration,
+      p50: percentile(latencies, 50),
+      p99: percentile(latencies, 99)
+    };
+  } finally {
+    await stopCluster(cluster);
+  }
+}
+
+const options = parseArgs(process.argv.slice(2));
+console.log('⛩️  Torii API Cluster Load Test');
+console.log(`   ${availableParallelism()} cores, ${options.connections} connections from ${options.threads} client threads, ${options.duration}s per run, ${options.cached ? 'cached' : 'unique'} descriptions\n`);
+console.log('workers'.padEnd(8), 'req/s'.padStart(10), 'p50 ms'.padStart(9), 'p99 ms'.padStart(9), 'errors'.padStart(7), 'scaling'.padStart(8));
+
+let baseline = null;
+for (const workers of options.workers) {
+  const result = await run(options, workers);
+  baseline ??= result.rps / result.workers;
+  console.log(
+    String(result.workers).padEnd(8),
+    Math.round(result.rps).toLocaleString().padStart(10),
+    result.p50.toFixed(2).padStart(9),
+    result.p99.toFixed(2).padStart(9),
+    String(result.errors).padStart(7),
+    `${(result.rps / baseline).toFixed(2)}x`.padStart(8)
+  );
+}
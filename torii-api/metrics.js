@@ -0,0 +1,161 @@
+/**
+ * Torii Metrics
+ * Prometheus-style histograms for classification and HTTP handling, with
+ * JSON snapshots that the cluster primary merges across workers
+ */
+
+// Classification takes microseconds; HTTP handling up to seconds for batches
+const CLASSIFY_BUCKETS = [0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005, 0.01];
+const HTTP_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5];
+
+export class Histogram {
+  /**
+   * @param {string} name - Metric name
+   * @param {string} help - Description
+   * @param {string[]} labelNames - Label names
+   * @param {number[]} buckets - Upper bounds in seconds
+   */
+  constructor(name, help, labelNames, buckets) {
+    this.name = name;
+    this.help = help;
+    this.labelNames = labelNames;
+    this.buckets = buckets;
+    this.series = new Map();
+  }
+
+  /**
+   * Record one observation
+   * @param {object} labels - Label values
+   * @param {number} seconds - Observed duration
+   */
+  observe(labels, seconds) {
+    const values = this.labelNames.map(name => String(labels[name] ?? ''));
+    const key = values.join('\u0001');
+    let series = this.series.get(key);
+    if (!series) {
+      series = { labels: values, counts: new Array(this.buckets.length + 1).fill(0), sum: 0, count: 0 };
+      this.series.set(key, series);
+    }
+
+    let bucket = 0;
+    while (bucket < this.buckets.length && seconds > this.buckets[bucket]) bucket++;
+    series.counts[bucket]++;
+    series.sum += seconds;
+    series.count++;
+  }
+
+  snapshot() {
+    return {
+      name: this.name,
+      help: this.help,
+      labelNames: this.labelNames,
+      buckets: this.buckets,
+      series: [...this.series.values()].map(series => ({ ...series, counts: [...series.counts] }))
+    };
+  }
+}
+
+export const classifyDuration = new Histogram(
+  'torii_classification_duration_seconds',
+  'Time to classify a description, by cache result',
+  ['cache'],
+  CLASSIFY_BUCKETS
+);
+
+export const httpDuration = new Histogram(
+  'torii_http_request_duration_seconds',
+  'HTTP request handling time by method, route and status',
+  ['method', 'route', 'status'],
+  HTTP_BUCKETS
+);
+
+/**
+ * Snapshot of every Torii metric (JSON-serializable, for IPC)
+ */
+export function snapshotMetrics() {
+  return [classifyDuration.snapshot(), httpDuration.snapshot()];
+}
+
+/**
+ * Add up snapshots from several workers
+ * @param {object[][]} snapshots - One snapshotMetrics() result per worker
+ */
+export function mergeMetrics(snapshots) {
+  const merged = new Map();
+
+  for (const snapshot of snapshots) {
+    for (const metric of snapshot) {
+      let target = merged.get(metric.name);
+      if (!target) {
+        target = { ...metric, series: new Map() };
+        merged.set(metric.name, target);
+      }
+
+      for (const series of metric.series) {
+        const key = series.labels.join('\u0001');
+        const existing = target.series.get(key);
+        if (!existing) {
+          target.series.set(key, { ...series, counts: [...series.counts] });
+        } else {
+          series.counts.forEach((count, i) => { existing.counts[i] += count; });
+          existing.sum += series.sum;
+          existing.count += series.count;
+        }
+      }
+    }
+  }
+
+  return [...merged.values()].map(metric => ({ ...metric, series: [...metric.series.values()] }));
+}
+
+function formatLabels(names, values, extra) {
+  const pairs = names.map((name, i) => `${name}="${values[i].replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"')}"`);
+  if (extra) pairs.push(extra);
+  return pairs.length ? `{${pairs.join(',')}}` : '';
+}
+
+/**
+ * Render snapshots in the Prometheus text exposition format
+ */
+export function renderMetrics(snapshot) {
+  const lines = [];
+
+  for (const metric of snapshot) {
+    lines.push(`# HELP ${metric.name} ${metric.help}`);
+    lines.push(`# TYPE ${metric.name} histogram`);
+
+    for (const series of metric.series) {
+      let cumulative = 0;
+      metric.buckets.forEach((bound, i) => {
+        cumulative += series.counts[i];
+        lines.push(`${metric.name}_bucket${formatLabels(metric.labelNames, series.labels, `le="${bound}"`)} ${cumulative}`);
+      });
+      lines.push(`${metric.name}_bucket${formatLabels(metric.labelNames, series.labels, 'le="+Inf"')} ${series.count}`);
+      lines.push(`${metric.name}_sum${formatLabels(metric.labelNames, series.labels)} ${series.sum}`);
+      lines.push(`${metric.name}_count${formatLabels(metric.labelNames, series.labels)} ${series.count}`);
+    }
+  }
+
+  return lines.join('\n') + '\n';
+}
+
+/**
+ * Express middleware timing every request by its matched route
+ */
+export function httpMetricsMiddleware() {
+  return (req, res, next) => {
+    const start = process.hrtime.bigint();
+    res.on('finish', () => {
+      httpDuration.observe(
+        {
+          method: req.method,
+          // Route pattern, not the raw path, to keep label cardinality bounded
+          route: req.route ? req.baseUrl + req.route.path : 'unmatched',
+          status: res.statusCode
+        },
+        Number(process.hrtime.bigint() - start) / 1e9
+      );
+    });
+    next();
+  };
+}
@@ -0,0 +1,246 @@
+/**
+ * Compiled Rule Matcher
+ * Matches many keyword patterns against a text in a single left-to-right pass
+ * with an Aho-Corasick automaton. Once only a few rules are left to find, the
+ * rest of the text goes to their own regexes, whose literal scans skip ahead
+ * faster than the automaton steps through every character.
+ */
+
+// Same set as the regex \s class, apart from the plain space
+const WHITESPACE = '\t\n\v\f\r\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff';
+
+// Symbols: 0 = any other character, 1-26 = a-z (case-folded), 27-36 = 0-9,
+// 37 = space, 38 = '-', 39 = other whitespace
+const OTHER = 0;
+const SPACE = 37;
+const DASH = 38;
+const WS = 39;
+const ALPHABET = 40;
+
+// Rules left to find at which the scan hands off to per-rule regexes: a
+// regex literal scan costs about a quarter of an automaton step per char, so
+// below this many rules the regexes read the rest of the text faster
+const REGEX_HANDOFF = 4;
+
+const ASCII_SYMBOLS = new Uint8Array(128);
+for (let code = 0; code < 128; code++) {
+  const char = String.fromCharCode(code);
+  if (char >= 'a' && char <= 'z') ASCII_SYMBOLS[code] = code - 96;
+  else if (char >= 'A' && char <= 'Z') ASCII_SYMBOLS[code] = code - 64;
+  else if (char >= '0' && char <= '9') ASCII_SYMBOLS[code] = code - 48 + 27;
+  else if (char === ' ') ASCII_SYMBOLS[code] = SPACE;
+  else if (char === '-') ASCII_SYMBOLS[code] = DASH;
+  else if (WHITESPACE.includes(char)) ASCII_SYMBOLS[code] = WS;
+}
+
+function bitCount(mask) {
+  let count = 0;
+  for (; mask !== 0; mask &= mask - 1) count++;
+  return count;
+}
+
+function symbolOf(code) {
+  if (code < 128) return ASCII_SYMBOLS[code];
+  return WHITESPACE.includes(String.fromCharCode(code)) ? WS : OTHER;
+}
+
+/**
+ * Expand a keyword pattern into the literal keywords it matches.
+ * Supports what the Torii rules use: alternation, letters, digits, spaces
+ * and optional separators written as `[\s-]?`, `\s?` or `-?`.
+ * @param {RegExp} pattern - Case-insensitive keyword pattern
+ * @returns {number[][]} - Keywords as symbol sequences
+ */
+export function expandPattern(pattern) {
+  if (!pattern.flags.includes('i')) {
+    throw new Error(`Pattern ${pattern} must be case-insensitive`);
+  }
+
+  return pattern.source.split('|').flatMap(alternative => {
+    let variants = [[]];
+    const tokens = alternative.match(/\[\\s-\]\??|\\s\??|-\??|[a-zA-Z0-9 ]|[\s\S]/g) || [];
+
+    for (const token of tokens) {
+      let options;
+      if (token.startsWith('[\\s-]')) options = [[SPACE], [WS], [DASH]];
+      else if (token.startsWith('\\s')) options = [[SPACE], [WS]];
+      else if (token.startsWith('-')) options = [[DASH]];
+      else if (/^[a-zA-Z0-9 ]$/.test(token)) options = [[symbolOf(token.charCodeAt(0))]];
+      else throw new Error(`Unsupported syntax "${token}" in ${pattern}`);
+
+      if (token.endsWith('?')) options = [[], ...options];
+      variants = variants.flatMap(prefix => options.map(option => [...prefix, ...option]));
+    }
+
+    return variants;
+  });
+}
+
+export class RuleMatcher {
+  /**
+   * @param {Array<{ name: string, pattern: RegExp }>} rules - Keyword patterns (see expandPattern)
+   */
+  constructor(rules) {
+    if (rules.length > 30) {
+      throw new Error('RuleMatcher supports at most 30 rules');
+    }
+
+    this.names = rules.map(rule => rule.name);
+    this.allRules = (1 << rules.length) - 1;
+    // Global copies, so a search can start at lastIndex without slicing the text
+    this.regexes = rules.map(({ pattern }) => new RegExp(pattern.source, 'gi'));
+    let longestKeyword = 0;
+
+    // Trie of all keywords; outputs[state] = bitmask of rules ending there
+    const children = [new Int32Array(ALPHABET).fill(-1)];
+    const outputs = [0];
+
+    rules.forEach(({ pattern }, index) => {
+      for (const keyword of expandPattern(pattern)) {
+        longestKeyword = Math.max(longestKeyword, keyword.length);
+        let state = 0;
+        for (const symbol of keyword) {
+          if (children[state][symbol] === -1) {
+            children[state][symbol] = children.length;
+            children.push(new Int32Array(ALPHABET).fill(-1));
+            outputs.push(0);
+          }
+          state = children[state][symbol];
+        }
+        outputs[state] |= 1 << index;
+      }
+    });
+    this.longestKeyword = longestKeyword;
+
+    // Breadth-first failure links, folded into a full transition table (DFA)
+    const stateCount = children.length;
+    this.transitions = new Int32Array(stateCount * ALPHABET);
+    this.outputs = Int32Array.from(outputs);
+    const failure = new Int32Array(stateCount);
+    const queue = [];
+
+    for (let symbol = 0; symbol < ALPHABET; symbol++) {
+      const child = children[0][symbol];
+      if (child === -1) {
+        this.transitions[symbol] = 0;
+      } else {
+        this.transitions[symbol] = child;
+        failure[child] = 0;
+        queue.push(child);
+      }
+    }
+
+    for (let head = 0; head < queue.length; head++) {
+      const state = queue[head];
+      this.outputs[state] |= this.outputs[failure[state]];
+
+      for (let symbol = 0; symbol < ALPHABET; symbol++) {
+        const child = children[state][symbol];
+        const fallback = this.transitions[failure[state] * ALPHABET + symbol];
+        if (child === -1) {
+          this.transitions[state * ALPHABET + symbol] = fallback;
+        } else {
+          this.transitions[state * ALPHABET + symbol] = child;
+          failure[child] = fallback;
+          queue.push(child);
+        }
+      }
+    }
+  }
+
+  /**
+   * Bitmask for a list of rule names
+   * @param {string[]} names - Rule names
+   * @returns {number} - Bitmask
+   */
+  maskOf(names) {
+    let mask = 0;
+    for (const name of names) {
+      const index = this.names.indexOf(name);
+      if (index === -1) throw new Error(`Unknown rule: ${name}`);
+      mask |= 1 << index;
+    }
+    return mask;
+  }
+
+  /**
+   * Find which rules match anywhere in the text, reading it once
+   * @param {string} text - Text to scan
+   * @returns {Set<string>} - Names of matching rules
+   */
+  match(text) {
+    return this.namesOf(this.matchMask(text));
+  }
+
+  /**
+   * Bitmask form of match()
+   * @param {string} text - Text to scan
+   * @param {number} [wanted] - Bitmask of rules to search for (default: all)
+   * @param {function(number): number} [settle] - Called with the found mask when
+   *   new rules match; returns a bitmask of rules whose outcome no longer
+   *   matters, so the scan can stop once nothing is left to find
+   * @returns {number} - Bitmask of matching rules
+   */
+  matchMask(text, wanted = this.allRules, settle = null) {
+    const { transitions, outputs } = this;
+    const length = text.length;
+    let found = 0;
+    let state = 0;
+
+    for (let i = 0; i < length && wanted !== 0; i++) {
+      const code = text.charCodeAt(i);
+      state = transitions[state * ALPHABET + (code < 128 ? ASCII_SYMBOLS[code] : symbolOf(code))];
+
+      const hits = outputs[state] & wanted;
+      if (hits !== 0) {
+        found |= hits;
+        wanted &= ~hits;
+        if (settle !== null) wanted &= ~settle(found);
+        if (wanted !== 0 && bitCount(wanted) <= REGEX_HANDOFF) {
+          // No wanted keyword ends at or before i, so one may only start within the last longestKeyword - 1 chars
+          return this.matchRest(text, i + 2 - this.longestKeyword, found, wanted, settle);
+        }
+      }
+    }
+
+    return found;
+  }
+
+  /**
+   * Finish matchMask() with one regex search per remaining rule
+   * @param {string} text - Text being scanned
+   * @param {number} start - Index to search from
+   * @param {number} found - Bitmask of rules matched so far
+   * @param {number} wanted - Bitmask of rules still to find
+   * @param {function(number): number} [settle] - As in matchMask()
+   * @returns {number} - Bitmask of matching rules
+   */
+  matchRest(text, start, found, wanted, settle) {
+    for (let index = 0; wanted !== 0; index++) {
+      const bit = 1 << index;
+      if ((wanted & bit) === 0) continue;
+
+      wanted &= ~bit;
+      const regex = this.regexes[index];
+      regex.lastIndex = Math.max(0, start);
+      if (regex.test(text)) {
+        found |= bit;
+        if (settle !== null) wanted &= ~settle(found);
+      }
+    }
+    return found;
+  }
+
+  /**
+   * Rule names in a bitmask
+   * @param {number} mask - Bitmask of rules
+   * @returns {Set<string>} - Rule names
+   */
+  namesOf(mask) {
+    const names = new Set();
+    for (let i = 0; i < this.names.length; i++) {
+      if (mask & (1 << i)) names.add(this.names[i]);
+    }
+    return names;
+  }
+}
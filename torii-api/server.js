@@ -5,21 +5,46 @@
 
 import express from 'express';
 import cors from 'cors';
+import cluster from 'node:cluster';
+import { once } from 'node:events';
+import { createInterface } from 'node:readline';
 import { ToriiEngine } from './torii-engine.js';
+import { ClassifyCache, matchesETag } from './classify-cache.js';
+import { AccessLog } from './access-log.js';
+import { classifyDuration, httpMetricsMiddleware, snapshotMetrics, renderMetrics } from './metrics.js';
 
 const app = express();
 const PORT = process.env.PORT || 3000;
+const BATCH_MAX_ITEMS = parseInt(process.env.BATCH_MAX_ITEMS, 10) || 100;
+const cacheSize = parseInt(process.env.CLASSIFY_CACHE_SIZE, 10);
+// Anything but a positive count (a typo parses to NaN) would never evict
+const CLASSIFY_CACHE_SIZE = cacheSize > 0 ? cacheSize : 10000;
 const engine = new ToriiEngine();
+const classifyCache = new ClassifyCache(engine, CLASSIFY_CACHE_SIZE);
+const STATS_INTERVAL_MS = parseInt(process.env.STATS_INTERVAL_MS, 10) || 1000;
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS, 10) || 10000;
+const accessLog = new AccessLog({
+  path: process.env.ACCESS_LOG_PATH,
+  tag: cluster.isWorker ? `worker ${cluster.worker.id}` : undefined
+});
+let requestsServed = 0;
+let clusterStats = null; // Cluster-wide totals pushed by the primary (cluster.js)
+let clusterMetrics = null; // Cluster-wide metrics snapshot, pushed alongside
 
 // Middleware
 app.use(cors());
-app.use(express.json());
+// Large enough for a full batch of 2000-char descriptions
+app.use(express.json({ limit: '1mb' }));
 
-// Request logging
+// Request logging (buffered, written outside the request path)
 app.use((req, res, next) => {
-  console.log(`[${new Date().toISOString()}] ${req.method} ${req.path}`);
+  requestsServed++;
   next();
 });
+if (process.env.ACCESS_LOG !== 'off') {
+  app.use(accessLog.middleware());
+}
+app.use(httpMetricsMiddleware());
 
 // Health check
 app.get('/health', (req, res) => {
@@ -27,10 +52,20 @@ app.get('/health', (req, res) => {
     status: 'ok',
     service: 'Torii API',
     version: '1.0.0',
-    timestamp: new Date().toISOString()
+    timestamp: new Date().toISOString(),
+    pid: process.pid,
+    requests: requestsServed,
+    cache: classifyCache.getStats(),
+    ...(cluster.isWorker && { worker: cluster.worker.id, cluster: clusterStats })
   });
 });
 
+// Prometheus metrics (in cluster mode, merged across workers by the primary)
+app.get('/metrics', (req, res) => {
+  const snapshot = clusterMetrics || snapshotMetrics();
+  res.type('text/plain; version=0.0.4; charset=utf-8').send(renderMetrics(snapshot));
+});
+
 // Root endpoint
 app.get('/', (req, res) => {
   res.json({
@@ -38,13 +73,25 @@ app.get('/', (req, res) => {
     version: '1.0.0',
     endpoints: {
       'POST /api/check': 'Analyze token description and classify',
+      'POST /api/check/batch': 'Classify many descriptions, streamed back as NDJSON',
       'GET /api/classify/:type': 'Quick classification by token type',
-      'GET /health': 'Health check'
+      'GET /health': 'Health check',
+      'GET /metrics': 'Prometheus metrics'
     },
     documentation: '/api/docs'
   });
 });
 
+/**
+ * Classify through the cache, recording the time taken by cache result
+ */
+function classify(description) {
+  const start = performance.now();
+  const classified = classifyCache.classify(description);
+  classifyDuration.observe({ cache: classified.hit ? 'hit' : 'miss' }, (performance.now() - start) / 1000);
+  return classified;
+}
+
 /**
  * Payment verification helper
  * In production, this would verify x402 payment signatures
@@ -72,12 +119,58 @@ function verifyPayment(paymentProof) {
   }
 }
 
+/**
+ * Validate a description
+ * @returns {object|null} - Error body, or null if valid
+ */
+function validateDescription(description) {
+  if (!description || typeof description !== 'string') {
+    return {
+      error: 'Missing or invalid "description" field',
+      example: { description: 'ERC-20 governance token with fee distribution' }
+    };
+  }
+
+  if (description.length < 10) {
+    return {
+      error: 'Description too short (minimum 10 characters)',
+      provided: description.length
+    };
+  }
+
+  if (description.length > 2000) {
+    return {
+      error: 'Description too long (maximum 2000 characters)',
+      provided: description.length
+    };
+  }
+
+  return null;
+}
+
+/**
+ * 402 response body for a failed payment verification
+ */
+function paymentRequired(reason) {
+  return {
+    error: 'Payment Required',
+    message: reason,
+    pricing: {
+      amount: '$0.01',
+      currency: 'USDC',
+      network: 'Base (eip155:8453)',
+      payTo: process.env.PAY_TO_ADDRESS || '0xBB6FdC629a153E2bF7629032A3Bf99aec8b48938'
+    }
+  };
+}
+
 /**
  * POST /api/check
  * Analyze token description and return classification
  * 
  * Body: { "description": "token description text", "paymentProof": "..." (optional for demo mode) }
- * Headers: X-Payment-Proof (optional alternative to body field)
+ * Headers: X-Payment-Proof (optional alternative to body field),
+ *          If-None-Match (ETag from an earlier response; 304 if unchanged)
  * Returns: { classification, riskScore, risks, required, ... }
  */
 app.post('/api/check', (req, res) => {
@@ -86,25 +179,9 @@ app.post('/api/check', (req, res) => {
     const paymentHeader = req.headers['x-payment-proof'];
 
     // Validation
-    if (!description || typeof description !== 'string') {
-      return res.status(400).json({
-        error: 'Missing or invalid "description" field',
-        example: { description: 'ERC-20 governance token with fee distribution' }
-      });
-    }
-
-    if (description.length < 10) {
-      return res.status(400).json({
-        error: 'Description too short (minimum 10 characters)',
-        provided: description.length
-      });
-    }
-
-    if (description.length > 2000) {
-      return res.status(400).json({
-        error: 'Description too long (maximum 2000 characters)',
-        provided: description.length
-      });
+    const invalid = validateDescription(description);
+    if (invalid) {
+      return res.status(400).json(invalid);
     }
 
     // Payment verification (skip in demo mode)
@@ -113,27 +190,24 @@ app.post('/api/check', (req, res) => {
       const verification = verifyPayment(proof);
       
       if (!verification.valid) {
-        return res.status(402).json({
-          error: 'Payment Required',
-          message: verification.reason,
-          pricing: {
-            amount: '$0.01',
-            currency: 'USDC',
-            network: 'Base (eip155:8453)',
-            payTo: process.env.PAY_TO_ADDRESS || '0xBB6FdC629a153E2bF7629032A3Bf99aec8b48938'
-          }
-        });
+        return res.status(402).json(paymentRequired(verification.reason));
       }
       
       // Log successful payment
       console.log(`[PAYMENT] Verified payment from ${verification.payer} for audit`);
     }
 
-    // Process
+    // Process (repeat descriptions are served from the classification cache)
     const startTime = Date.now();
-    const result = engine.classify(description);
+    const { result, etag, hit } = classify(description);
     const processingTime = Date.now() - startTime;
 
+    res.set('ETag', etag);
+    res.set('X-Cache', hit ? 'HIT' : 'MISS');
+    if (matchesETag(req.headers['if-none-match'], etag)) {
+      return res.status(304).end();
+    }
+
     // Response
     res.json({
       success: true,
@@ -141,7 +215,8 @@ app.post('/api/check', (req, res) => {
       meta: {
         processingTimeMs: processingTime,
         descriptionLength: description.length,
-        paymentVerified: !demoMode
+        paymentVerified: !demoMode,
+        cached: hit
       }
     });
   } catch (error) {
@@ -153,6 +228,130 @@ app.post('/api/check', (req, res) => {
   }
 });
 
+/**
+ * Read batch items from the request: either a JSON body
+ * ({ descriptions: [...] }) or newline-delimited JSON streamed in the body,
+ * one { "description": "...", "id": ... } (or bare string) per line
+ */
+async function* readBatchItems(req) {
+  if (!req.is('application/x-ndjson')) {
+    const { descriptions } = req.body || {};
+    if (!Array.isArray(descriptions)) {
+      throw Object.assign(new Error('Body must contain a "descriptions" array'), { status: 400 });
+    }
+    for (const item of descriptions) yield item;
+    return;
+  }
+
+  const lines = createInterface({ input: req, crlfDelay: Infinity });
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+    try {
+      yield JSON.parse(line);
+    } catch {
+      yield { parseError: 'Malformed JSON line' };
+    }
+  }
+}
+
+/**
+ * POST /api/check/batch
+ * Classify many descriptions in one request, verifying a single payment proof
+ * for the whole batch. Results are streamed back as NDJSON in input order, one
+ * line per item as soon as it is classified, followed by a final meta line.
+ *
+ * Body (application/json): { "descriptions": ["...", { "id": "x", "description": "..." }], "paymentProof": "...", "demoMode": false }
+ * Body (application/x-ndjson): one item per line; payment via X-Payment-Proof, demo via ?demoMode=true
+ * Returns: {"index":0,"id":"x","success":true,"data":{...}}\n ... {"meta":{...}}\n
+ */
+app.post('/api/check/batch', async (req, res) => {
+  const startTime = Date.now();
+  const streamedBody = req.is('application/x-ndjson');
+  const body = streamedBody ? {} : req.body || {};
+  const demoMode = body.demoMode || req.query.demoMode === 'true';
+
+  // One payment verification for the whole batch, before anything is streamed
+  if (!demoMode) {
+    const verification = verifyPayment(body.paymentProof || req.headers['x-payment-proof']);
+    if (!verification.valid) {
+      return res.status(402).json(paymentRequired(verification.reason));
+    }
+    console.log(`[PAYMENT] Verified payment from ${verification.payer} for batch audit`);
+  }
+
+  if (!streamedBody && Array.isArray(body.descriptions) && body.descriptions.length > BATCH_MAX_ITEMS) {
+    return res.status(400).json({
+      error: `Too many descriptions (maximum ${BATCH_MAX_ITEMS} per batch)`,
+      provided: body.descriptions.length
+    });
+  }
+
+  let index = 0;
+  let succeeded = 0;
+  let failed = 0;
+  let truncated = false;
+
+  const write = async (line) => {
+    // Respect backpressure from slow clients; stop waiting if they disconnect
+    if (!res.write(JSON.stringify(line) + '\n') && !res.destroyed) {
+      await Promise.race([once(res, 'drain'), once(res, 'close')]);
+    }
+  };
+
+  try {
+    for await (const item of readBatchItems(req)) {
+      if (index === 0) {
+        res.status(200).type('application/x-ndjson');
+        res.flushHeaders();
+      }
+      if (res.destroyed) break;
+      if (index >= BATCH_MAX_ITEMS) {
+        truncated = true;
+        break;
+      }
+
+      const description = typeof item === 'string' ? item : item?.description;
+      const id = typeof item === 'object' && item !== null ? item.id : undefined;
+      const invalid = item?.parseError ? { error: item.parseError } : validateDescription(description);
+
+      if (invalid) {
+        failed++;
+        await write({ index, id, success: false, ...invalid });
+      } else {
+        succeeded++;
+        await write({ index, id, success: true, data: classify(description).result });
+      }
+      index++;
+    }
+  } catch (error) {
+    if (!res.headersSent) {
+      return res.status(error.status || 500).json({
+        error: error.status ? error.message : 'Internal server error',
+        message: error.message
+      });
+    }
+    console.error('Error in /api/check/batch:', error);
+    await write({ error: 'Internal server error', message: error.message });
+  }
+
+  if (!res.headersSent) {
+    res.status(200).type('application/x-ndjson');
+  }
+  await write({
+    meta: {
+      items: index,
+      succeeded,
+      failed,
+      truncated,
+      maxItems: BATCH_MAX_ITEMS,
+      processingTimeMs: Date.now() - startTime,
+      avgItemTimeMs: index > 0 ? (Date.now() - startTime) / index : 0,
+      paymentVerified: !demoMode
+    }
+  });
+  res.end();
+});
+
 /**
  * GET /api/classify/:type
  * Quick classification by token type
@@ -216,6 +415,7 @@ app.get('/api/docs', (req, res) => {
           disclaimer: 'Legal disclaimer',
           futureConsideration: 'Upcoming regulatory changes'
         },
+        caching: 'Responses carry a weak ETag; send it back as If-None-Match to get 304 Not Modified',
         example: {
           request: {
             description: 'ERC-20 governance token for DeFi protocol, holders receive 2% of trading fees'
@@ -233,6 +433,22 @@ app.get('/api/docs', (req, res) => {
           }
         }
       },
+      {
+        method: 'POST',
+        path: '/api/check/batch',
+        description: `Classify up to ${BATCH_MAX_ITEMS} descriptions with one payment proof; results stream back as NDJSON`,
+        requestBody: {
+          descriptions: 'array of strings or { id, description } objects (application/json)',
+          ndjson: 'or one { id, description } object per line (application/x-ndjson)'
+        },
+        responseFields: {
+          index: 'Position of the item in the batch',
+          id: 'Echo of the item id, if given',
+          success: 'false for items that failed validation',
+          data: 'Classification result, as for POST /api/check',
+          meta: 'Final line: items, succeeded, failed, truncated, processingTimeMs, avgItemTimeMs, paymentVerified'
+        }
+      },
       {
         method: 'GET',
         path: '/api/classify/:type',
@@ -277,7 +493,7 @@ app.use((req, res) => {
   res.status(404).json({
     error: 'Endpoint not found',
     path: req.path,
-    availableEndpoints: ['POST /api/check', 'GET /api/classify/:type', 'GET /health']
+    availableEndpoints: ['POST /api/check', 'POST /api/check/batch', 'GET /api/classify/:type', 'GET /health', 'GET /metrics']
   });
 });
 
@@ -290,9 +506,44 @@ app.use((err, req, res, next) => {
   });
 });
 
-// Start server
-app.listen(PORT, () => {
+// Start server (as a cluster worker, the primary shares the port and prints the banner)
+const server = app.listen(PORT, () => {
+  if (cluster.isWorker) return;
   console.log(`⛩️  Torii API server running on http://localhost:${PORT}`);
   console.log(`📚 Documentation: http://localhost:${PORT}/api/docs`);
   console.log(`💚 Health check: http://localhost:${PORT}/health`);
 });
+
+// Report local counters to the primary, which sends back cluster-wide totals
+if (cluster.isWorker) {
+  setInterval(() => {
+    if (process.connected) {
+      process.send({
+        type: 'torii:stats',
+        cache: classifyCache.getStats(),
+        requests: requestsServed,
+        metrics: snapshotMetrics()
+      });
+    }
+  }, STATS_INTERVAL_MS).unref();
+
+  process.on('message', message => {
+    if (message?.type === 'torii:cluster-stats') {
+      ({ metrics: clusterMetrics, ...clusterStats } = message.stats);
+    }
+  });
+}
+
+/**
+ * Stop accepting connections, let in-flight requests finish, flush the log
+ */
+function shutdown() {
+  server.close(async () => {
+    await accessLog.close();
+    process.exit(0);
+  });
+  setTimeout(() => process.exit(1), SHUTDOWN_TIMEOUT_MS).unref();
+}
+
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
@@ -49,6 +49,38 @@ const tests = [
     },
     expected: { classification: 'CRYPTO ASSET' }
   },
+  {
+    name: 'Repeat Check Revalidated by ETag (304)',
+    method: 'POST',
+    endpoint: '/api/check',
+    body: {
+      demoMode: true,
+      description: '  ERC-721 NFT Collectible with unique artwork and metadata '
+    },
+    revalidate: true,
+    expected: { notModified: true }
+  },
+  {
+    name: 'Batch Check (NDJSON stream)',
+    method: 'POST',
+    endpoint: '/api/check/batch',
+    body: {
+      demoMode: true,
+      descriptions: [
+        'Governance token allowing holders to vote on protocol parameters',
+        { id: 'nft-1', description: 'ERC-721 NFT collectible with unique artwork and metadata' },
+        'too short'
+      ]
+    },
+    expected: { items: 3, succeeded: 2, failed: 1 }
+  },
+  {
+    name: 'Batch Check Without Payment (Should Fail)',
+    method: 'POST',
+    endpoint: '/api/check/batch',
+    body: { descriptions: ['Digital currency for peer-to-peer payments'] },
+    shouldFail: true
+  },
   {
     name: 'Quick Classify - Governance',
     method: 'GET',
@@ -93,6 +125,25 @@ async function makeRequest(test) {
   }
 
   const response = await fetch(url, options);
+
+  // Send the ETag back: an unchanged result must come back as 304 with no body
+  if (test.revalidate) {
+    const etag = response.headers.get('etag');
+    await response.arrayBuffer();
+    const repeat = await fetch(url, { ...options, headers: { ...options.headers, 'If-None-Match': etag } });
+    if (repeat.status !== 304) {
+      return { status: repeat.status, data: { notModified: false } };
+    }
+    return { status: 200, data: { notModified: true, cached: repeat.headers.get('x-cache') === 'HIT' } };
+  }
+
+  // Batch responses stream one JSON object per line, ending with a meta line
+  if (response.headers.get('content-type')?.includes('application/x-ndjson')) {
+    const lines = (await response.text()).trim().split('\n').map(line => JSON.parse(line));
+    const { meta } = lines.pop();
+    return { status: response.status, data: { ...meta, results: lines } };
+  }
+
   const data = await response.json();
 
   return { status: response.status, data };
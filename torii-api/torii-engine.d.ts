@@ -0,0 +1,24 @@
+/**
+ * Type declarations for torii-engine.js (used by the TypeScript auditor's
+ * embedded mode)
+ */
+
+export interface ClassificationResult {
+  classification: string;
+  classificationJP: string;
+  riskScore: number;
+  riskLevel: 'HIGH' | 'MEDIUM' | 'LOW';
+  required: string;
+  governingLaw: string;
+  risks: string[];
+  confidence: number;
+  timestamp: string;
+  disclaimer: string;
+  futureConsideration: string;
+}
+
+export class ToriiEngine {
+  classify(description: string): ClassificationResult;
+  checkSecurityRisk(description: string): { score: number; risks: string[] };
+  quickClassify(type: string): Record<string, unknown>;
+}
@@ -3,6 +3,8 @@
  * Core logic ported from bash script
  */
 
+import { RuleMatcher } from './rule-matcher.js';
+
 export class ToriiEngine {
   constructor() {
     // Risk keyword patterns and their scores
@@ -40,34 +42,77 @@ export class ToriiEngine {
       payment: /payment|currency|transfer|remit|send money/i,
       prepaid: /prepaid|gift[\s-]?card|voucher|point/i
     };
+
+    // All risk and type patterns compiled into one single-pass matcher
+    this.matcher = new RuleMatcher([
+      ...this.riskPatterns.map(({ pattern }, i) => ({ name: `risk${i}`, pattern })),
+      ...Object.entries(this.typePatterns).map(([name, pattern]) => ({ name, pattern }))
+    ]);
+    this.riskRules = this.matcher.maskOf(this.riskPatterns.map((_, i) => `risk${i}`));
+    this.typeRules = this.matcher.maskOf(Object.keys(this.typePatterns));
+    this.nftRule = this.matcher.maskOf(['nft']);
+    this.paymentRule = this.matcher.maskOf(['payment']);
+    this.prepaidRule = this.matcher.maskOf(['prepaid']);
+    this.riskScores = Int32Array.from(this.riskPatterns, ({ score }) => score);
+    this.settle = found => this.settledRules(found);
   }
 
   /**
-   * Check security risk from token description
-   * @param {string} description - Token description
+   * Rules whose outcome can no longer change the classification: types are
+   * only consulted below a score of 25, in nft > payment > prepaid order
+   * @param {number} found - Bitmask of rules matched so far
+   * @returns {number} - Bitmask of settled rules
+   */
+  settledRules(found) {
+    // Called on every match, so the score is summed without building the flag list
+    const { riskScores } = this;
+    let score = 0;
+    for (let i = 0; i < riskScores.length; i++) {
+      if (found & (1 << i)) score += riskScores[i];
+    }
+    if (score >= 25) return this.typeRules;
+    if (found & this.nftRule) return this.paymentRule | this.prepaidRule;
+    if (found & this.paymentRule) return this.prepaidRule;
+    return 0;
+  }
+
+  /**
+   * Score the risk patterns present in a matcher result
+   * @param {number} found - Bitmask of matched rules (risk pattern i = bit i)
    * @returns {object} - { score, risks }
    */
-  checkSecurityRisk(description) {
+  scoreRisks(found) {
     let score = 0;
     const risks = [];
 
-    for (const { pattern, score: points, flag } of this.riskPatterns) {
-      if (pattern.test(description)) {
+    this.riskPatterns.forEach(({ score: points, flag }, i) => {
+      if (found & (1 << i)) {
         score += points;
         risks.push(flag);
       }
-    }
+    });
 
     return { score, risks };
   }
 
+  /**
+   * Check security risk from token description
+   * @param {string} description - Token description
+   * @returns {object} - { score, risks }
+   */
+  checkSecurityRisk(description) {
+    return this.scoreRisks(this.matcher.matchMask(description, this.riskRules));
+  }
+
   /**
    * Classify token based on description
    * @param {string} description - Token description
    * @returns {object} - Full classification result
    */
   classify(description) {
-    const { score, risks } = this.checkSecurityRisk(description);
+    // One scan of the description covers both risk and type patterns
+    const found = this.matcher.matchMask(description, this.matcher.allRules, this.settle);
+    const { score, risks } = this.scoreRisks(found);
     let classification, classificationJP, required, governingLaw, riskLevel;
 
     // Determine classification based on risk score and keywords
@@ -83,19 +128,19 @@ export class ToriiEngine {
       required = 'Legal consultation before Japan launch';
       governingLaw = 'May require: FIEA registration';
       riskLevel = 'HIGH';
-    } else if (this.typePatterns.nft.test(description)) {
+    } else if (found & this.nftRule) {
       classification = 'NFT';
       classificationJP = 'NFT';
       required = 'Usually none (case by case)';
       governingLaw = 'Note: Fractional NFTs may be securities';
       riskLevel = 'LOW';
-    } else if (this.typePatterns.payment.test(description)) {
+    } else if (found & this.paymentRule) {
       classification = 'CRYPTO ASSET';
       classificationJP = '暗号資産';
       required = 'Crypto Asset Exchange License';
       governingLaw = 'Payment Services Act';
       riskLevel = 'MEDIUM';
-    } else if (this.typePatterns.prepaid.test(description)) {
+    } else if (found & this.prepaidRule) {
       classification = 'PREPAID PAYMENT';
       classificationJP = '前払式支払手段';
       required = 'Notification to Finance Bureau';